@@ -4,16 +4,19 @@ Desktop MCP Launcher
 
 Quick launcher for the Desktop MCP application.
 Run this from the project root to start the full application.
+Once the package is installed (pip install -e .) the `desktop-mcp`
+command does the same thing.
 """
 
-import asyncio
 import sys
-from pathlib import Path
 
-# Add src to path so we can import desktop_mcp
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-from desktop_mcp.core.app import main
+try:
+    from desktop_mcp.core.app import main_sync
+except ImportError:
+    # Not installed: fall back to importing straight from the source tree
+    from pathlib import Path
+    sys.path.insert(0, str(Path(__file__).parent / "src"))
+    from desktop_mcp.core.app import main_sync
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main_sync()
\ No newline at end of file
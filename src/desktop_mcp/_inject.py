@@ -0,0 +1,190 @@
+"""
+Direct OS input injection for the Desktop MCP automation hot paths
+
+Clicks and cursor moves go straight to SendInput (Windows), CGEventPost
+(macOS) or XTest (Linux) instead of through pyautogui's layers of size
+lookups, fail-safe checks and PAUSE sleeps. Every function returns False
+when no native backend is available so callers can fall back to pyautogui.
+"""
+
+import logging
+import platform
+import threading
+
+logger = logging.getLogger("DesktopMCP.Inject")
+
+_SYSTEM = platform.system().lower()
+
+
+class _Win32Backend:
+    """SendInput / SetCursorPos via ctypes"""
+    
+    MOUSEEVENTF = {
+        "left": (0x0002, 0x0004),
+        "right": (0x0008, 0x0010),
+        "middle": (0x0020, 0x0040),
+    }
+    INPUT_MOUSE = 0
+    
+    def __init__(self):
+        import ctypes
+        from ctypes import wintypes
+        
+        class MOUSEINPUT(ctypes.Structure):
+            _fields_ = [
+                ("dx", wintypes.LONG),
+                ("dy", wintypes.LONG),
+                ("mouseData", wintypes.DWORD),
+                ("dwFlags", wintypes.DWORD),
+                ("time", wintypes.DWORD),
+                ("dwExtraInfo", ctypes.c_size_t),
+            ]
+        
+        # MOUSEINPUT is the largest member of the INPUT union, so it alone
+        # gives the struct the size SendInput expects
+        class INPUT(ctypes.Structure):
+            _fields_ = [("type", wintypes.DWORD), ("mi", MOUSEINPUT)]
+        
+        self._user32 = ctypes.windll.user32
+        self._INPUT = INPUT
+        self._input_size = ctypes.sizeof(INPUT)
+    
+    def move_to(self, x: int, y: int) -> bool:
+        """Move the cursor to (x, y)"""
+        return bool(self._user32.SetCursorPos(int(x), int(y)))
+    
+    def click(self, x: int, y: int, button: str, clicks: int) -> bool:
+        """Press and release a button the given number of times at (x, y)"""
+        down, up = self.MOUSEEVENTF[button]
+        if not self.move_to(x, y):
+            return False
+        
+        # All down/up pairs go out in a single SendInput call
+        events = (self._INPUT * (2 * clicks))()
+        for i in range(clicks):
+            events[2 * i].type = events[2 * i + 1].type = self.INPUT_MOUSE
+            events[2 * i].mi.dwFlags = down
+            events[2 * i + 1].mi.dwFlags = up
+        sent = self._user32.SendInput(len(events), events, self._input_size)
+        return sent == len(events)
+
+
+class _QuartzBackend:
+    """CGEventCreateMouseEvent / CGEventPost via pyobjc"""
+    
+    def __init__(self):
+        import Quartz
+        
+        self._q = Quartz
+        self._buttons = {
+            "left": (Quartz.kCGEventLeftMouseDown, Quartz.kCGEventLeftMouseUp,
+                     Quartz.kCGMouseButtonLeft),
+            "right": (Quartz.kCGEventRightMouseDown, Quartz.kCGEventRightMouseUp,
+                      Quartz.kCGMouseButtonRight),
+            "middle": (Quartz.kCGEventOtherMouseDown, Quartz.kCGEventOtherMouseUp,
+                       Quartz.kCGMouseButtonCenter),
+        }
+    
+    def move_to(self, x: int, y: int) -> bool:
+        """Move the cursor to (x, y)"""
+        q = self._q
+        event = q.CGEventCreateMouseEvent(None, q.kCGEventMouseMoved, (x, y), q.kCGMouseButtonLeft)
+        q.CGEventPost(q.kCGHIDEventTap, event)
+        return True
+    
+    def click(self, x: int, y: int, button: str, clicks: int) -> bool:
+        """Press and release a button the given number of times at (x, y)"""
+        q = self._q
+        down, up, cg_button = self._buttons[button]
+        point = (x, y)
+        for click_state in range(1, clicks + 1):
+            # The click state lets apps recognise double/triple clicks
+            for event_type in (down, up):
+                event = q.CGEventCreateMouseEvent(None, event_type, point, cg_button)
+                q.CGEventSetIntegerValueField(event, q.kCGMouseEventClickState, click_state)
+                q.CGEventPost(q.kCGHIDEventTap, event)
+        return True
+
+
+class _XTestBackend:
+    """XTest fake_input via python-xlib"""
+    
+    BUTTONS = {"left": 1, "middle": 2, "right": 3}
+    
+    def __init__(self):
+        from Xlib import X, display
+        from Xlib.ext import xtest
+        
+        self._X = X
+        self._xtest = xtest
+        self._display = display.Display()
+        if not self._display.has_extension("XTEST"):
+            raise RuntimeError("X server does not support XTEST")
+        # One display connection is shared by every caller
+        self._lock = threading.Lock()
+    
+    def move_to(self, x: int, y: int) -> bool:
+        """Move the cursor to (x, y)"""
+        with self._lock:
+            self._xtest.fake_input(self._display, self._X.MotionNotify, x=int(x), y=int(y))
+            self._display.sync()
+        return True
+    
+    def click(self, x: int, y: int, button: str, clicks: int) -> bool:
+        """Press and release a button the given number of times at (x, y)"""
+        X, fake_input = self._X, self._xtest.fake_input
+        code = self.BUTTONS[button]
+        with self._lock:
+            fake_input(self._display, X.MotionNotify, x=int(x), y=int(y))
+            for _ in range(clicks):
+                fake_input(self._display, X.ButtonPress, code)
+                fake_input(self._display, X.ButtonRelease, code)
+            self._display.sync()
+        return True
+
+
+_BACKENDS = {"windows": _Win32Backend, "darwin": _QuartzBackend, "linux": _XTestBackend}
+
+_backend = None
+_backend_resolved = False
+_backend_lock = threading.Lock()
+
+
+def _get_backend():
+    """Resolve the native backend once; None if it can't be used here"""
+    global _backend, _backend_resolved
+    if not _backend_resolved:
+        with _backend_lock:
+            if not _backend_resolved:
+                backend_class = _BACKENDS.get(_SYSTEM)
+                if backend_class is not None:
+                    try:
+                        _backend = backend_class()
+                    except Exception as e:
+                        logger.info(f"Native input injection unavailable, using pyautogui: {e}")
+                _backend_resolved = True
+    return _backend
+
+
+def click(x: int, y: int, button: str = "left", clicks: int = 1) -> bool:
+    """Click at a screen position; False if the caller should fall back"""
+    backend = _get_backend()
+    if backend is None:
+        return False
+    try:
+        return backend.click(x, y, button, clicks)
+    except Exception as e:
+        logger.debug(f"Native click failed: {e}")
+        return False
+
+
+def move_to(x: int, y: int) -> bool:
+    """Move the cursor instantly; False if the caller should fall back"""
+    backend = _get_backend()
+    if backend is None:
+        return False
+    try:
+        return backend.move_to(x, y)
+    except Exception as e:
+        logger.debug(f"Native mouse move failed: {e}")
+        return False
@@ -2,201 +2,687 @@
 Advanced desktop automation capabilities for the Desktop MCP
 """
 
+import asyncio
+import functools
 import time
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Literal, Optional, Tuple
 import pyautogui
 import pyperclip
 from pynput import mouse, keyboard
 from pynput.keyboard import Key, Listener as KeyboardListener
 from pynput.mouse import Listener as MouseListener
 import threading
+import queue
+from array import array
+from bisect import bisect_right
+from itertools import chain, islice
+from concurrent.futures import ThreadPoolExecutor
 import os
+import json
 import platform
 import subprocess
 
+from . import _inject
+
 logger = logging.getLogger("DesktopMCP.Automation")
 
 # Disable PyAutoGUI failsafe for automation (can be re-enabled)
 pyautogui.FAILSAFE = False
 
+# Bounded pool for the *_async variants, so blocking input injection,
+# clipboard IPC and helper subprocesses never stall the event loop
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="DesktopMCP.Automation")
+
+# The OS never changes at runtime, so resolve it once
+_SYSTEM = platform.system().lower()
+
+# Window hotkeys per operation and platform (anything else is treated as Linux)
+_HOTKEYS = {
+    "minimize": {"windows": ("win", "down"), "darwin": ("cmd", "m"), "linux": ("alt", "F9")},
+    # macOS doesn't have a direct maximize, use fullscreen
+    "maximize": {"windows": ("win", "up"), "darwin": ("ctrl", "cmd", "f"), "linux": ("alt", "F10")},
+    "close": {"windows": ("alt", "F4"), "darwin": ("cmd", "w"), "linux": ("alt", "F4")},
+    "switch": {"windows": ("alt", "tab"), "darwin": ("cmd", "tab"), "linux": ("alt", "tab")},
+}
+
+# Active window snapshots are reused for a short while so rapid successive
+# queries don't spawn a new osascript/xdotool process each time
+_ACTIVE_WINDOW_TTL = 1.5
+_active_window_cache: Dict[str, Any] = {"t": 0.0, "v": None}
+
+# Screen size is cached until a display change is observed; without a
+# display notification source it is re-read after a short TTL instead
+_SCREEN_SIZE_TTL = 5.0
+_screen_cache: Dict[str, Any] = {"t": 0.0, "v": None}
+
+# Coerced to text so the persistent helper can return it: "App, Title, x, y, width, height"
+_ACTIVE_WINDOW_SCRIPT = '''
+tell application "System Events"
+    set frontApp to first application process whose frontmost is true
+    set frontWindow to first window of frontApp
+    set AppleScript's text item delimiters to ", "
+    return {name of frontApp, name of frontWindow, position of frontWindow, size of frontWindow} as text
+end tell
+'''
+
+# JXA loop run by one long-lived osascript: each stdin line is a JSON-encoded
+# AppleScript source, each stdout line a JSON reply ({"ok": text} or {"error": ...})
+_OSA_SERVER_SCRIPT = '''
+ObjC.import("Foundation");
+const stdin = $.NSFileHandle.fileHandleWithStandardInput;
+const stdout = $.NSFileHandle.fileHandleWithStandardOutput;
+let buffer = "";
+for (;;) {
+    const data = stdin.availableData;
+    if (data.length === 0) break;
+    buffer += $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding).js;
+    let newline;
+    while ((newline = buffer.indexOf("\\n")) >= 0) {
+        const source = JSON.parse(buffer.slice(0, newline));
+        buffer = buffer.slice(newline + 1);
+        let reply;
+        try {
+            const error = Ref();
+            const result = $.NSAppleScript.alloc.initWithSource(source).executeAndReturnError(error);
+            reply = result.isNil() ? {error: ObjC.deepUnwrap(error[0])} : {ok: result.stringValue.js};
+        } catch (e) {
+            reply = {error: String(e)};
+        }
+        stdout.writeData($(JSON.stringify(reply) + "\\n").dataUsingEncoding($.NSUTF8StringEncoding));
+    }
+}
+'''
+
+
+def _hotkey_for(operation: str) -> Tuple[str, ...]:
+    """Get the hotkey combination for a window operation on this platform"""
+    combos = _HOTKEYS[operation]
+    return combos.get(_SYSTEM, combos["linux"])
+
+
+async def _run_blocking(func, *args, **kwargs) -> Dict[str, Any]:
+    """Run a blocking automation call in the automation thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(func, *args, **kwargs))
+
+
+def _safe(action: str):
+    """
+    Turn any exception raised by an automation call into an error result
+    
+    Args:
+        action: What the call does, used in the log message ("click at position")
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Dict[str, Any]:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                # Lazy %-formatting: the message is only built if ERROR is emitted
+                logger.error("Failed to %s: %s", action, e)
+                return {"success": False, "error": str(e)}
+        return wrapper
+    return decorator
+
+
+def _invalidate_active_window():
+    """Mark the cached active window snapshot as stale"""
+    _active_window_cache["v"] = None
+
+
+def _invalidate_screen_size():
+    """Mark the cached screen size as stale"""
+    _screen_cache["v"] = None
+
+
+def _screen_size() -> Tuple[int, int]:
+    """Screen (width, height), re-read only after a display change or TTL expiry"""
+    now = time.monotonic()
+    cached = _screen_cache["v"]
+    if cached is not None and (
+            _window_watcher.watches_display or now - _screen_cache["t"] < _SCREEN_SIZE_TTL):
+        return cached
+    
+    size = pyautogui.size()
+    cached = (size.width, size.height)
+    _screen_cache["t"] = now
+    _screen_cache["v"] = cached
+    return cached
+
+
+class _OsaWorker:
+    """
+    Persistent osascript child that runs AppleScript sent over stdin
+    
+    Starting osascript costs tens to hundreds of milliseconds per call, so
+    one helper is started on first use and reused for the life of the
+    process. It is restarted transparently if it dies.
+    """
+    
+    def __init__(self):
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+    
+    def _ensure_started(self) -> subprocess.Popen:
+        """Start the helper if it isn't running (caller holds the lock)"""
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ["osascript", "-l", "JavaScript", "-e", _OSA_SERVER_SCRIPT],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL, text=True, bufsize=1
+            )
+        return self._proc
+    
+    def run(self, script: str) -> Optional[str]:
+        """Run an AppleScript and return its text result, or None if it failed"""
+        with self._lock:
+            try:
+                proc = self._ensure_started()
+                proc.stdin.write(json.dumps(script) + "\n")
+                proc.stdin.flush()
+                line = proc.stdout.readline()
+            except (OSError, ValueError) as e:
+                logger.debug(f"osascript helper unavailable: {e}")
+                self._close_locked()
+                return None
+            
+            if not line:
+                # The helper exited; the next call starts a fresh one
+                self._close_locked()
+                return None
+        
+        reply = json.loads(line)
+        if "error" in reply:
+            logger.debug(f"AppleScript failed: {reply['error']}")
+            return None
+        return reply.get("ok") or ""
+    
+    def _close_locked(self):
+        """Terminate the helper (caller holds the lock)"""
+        if self._proc is not None:
+            try:
+                self._proc.stdin.close()
+                self._proc.wait(timeout=1)
+            except Exception:
+                self._proc.kill()
+            self._proc = None
+    
+    def close(self):
+        """Stop the helper process"""
+        with self._lock:
+            self._close_locked()
+
+
+_osa_worker = _OsaWorker()
+
+
+class _ActiveWindowWatcher:
+    """
+    Subscribes to OS focus-change notifications and invalidates the active
+    window cache when the foreground window changes, so queries in between
+    are served from the cache without polling. Where the platform reports
+    display changes (RandR on Linux, screen parameter notifications on
+    macOS) the screen size cache is invalidated the same way.
+    
+    On macOS the notifications are delivered through the main run loop, so
+    they only arrive while the host runs one (e.g. the Qt GUI).
+    """
+    
+    # Win32 constants
+    EVENT_SYSTEM_FOREGROUND = 0x0003
+    WINEVENT_OUTOFCONTEXT = 0x0000
+    WM_QUIT = 0x0012
+    
+    def __init__(self):
+        self.active = False
+        # True while display changes are being observed
+        self.watches_display = False
+        self.thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._native_handle = None  # Win32 thread id / macOS observers
+    
+    def start(self) -> bool:
+        """Start watching; raises if the platform backend is unavailable"""
+        if self.active:
+            return True
+        
+        if _SYSTEM == "darwin":
+            self._subscribe_darwin()
+            self.active = True
+            return True
+        
+        targets = {"windows": self._watch_windows, "linux": self._watch_linux}
+        target = targets.get(_SYSTEM)
+        if target is None:
+            return False
+        
+        self._stop_event.clear()
+        ready = threading.Event()
+        errors: List[Exception] = []
+        self.thread = threading.Thread(
+            target=self._run, args=(target, ready, errors),
+            name="ActiveWindowWatcher", daemon=True
+        )
+        self.thread.start()
+        ready.wait(timeout=2.0)
+        
+        if errors:
+            raise errors[0]
+        return self.active
+    
+    def stop(self):
+        """Stop watching and fall back to TTL-based caching"""
+        self._stop_event.set()
+        
+        if _SYSTEM == "windows" and self._native_handle:
+            import ctypes
+            ctypes.windll.user32.PostThreadMessageW(self._native_handle, self.WM_QUIT, 0, 0)
+        elif _SYSTEM == "darwin" and self._native_handle is not None:
+            from AppKit import NSWorkspace
+            from Foundation import NSNotificationCenter
+            workspace_observer, screen_observer = self._native_handle
+            NSWorkspace.sharedWorkspace().notificationCenter().removeObserver_(workspace_observer)
+            NSNotificationCenter.defaultCenter().removeObserver_(screen_observer)
+        
+        self._native_handle = None
+        self.active = False
+        self.watches_display = False
+        _invalidate_active_window()
+        _invalidate_screen_size()
+    
+    def _run(self, target, ready: threading.Event, errors: List[Exception]):
+        """Thread body: run the platform loop, reporting setup failures"""
+        try:
+            target(ready)
+        except Exception as e:
+            if ready.is_set():
+                logger.error(f"Active window watcher stopped: {str(e)}")
+            else:
+                errors.append(e)
+        finally:
+            self.active = False
+            self.watches_display = False
+            _invalidate_active_window()
+            _invalidate_screen_size()
+            ready.set()
+    
+    def _subscribed(self, ready: threading.Event):
+        """Called by a platform loop once notifications are wired up"""
+        _invalidate_active_window()
+        self.active = True
+        ready.set()
+    
+    def _watch_windows(self, ready: threading.Event):
+        """Listen for EVENT_SYSTEM_FOREGROUND via SetWinEventHook"""
+        import ctypes
+        from ctypes import wintypes
+        
+        user32 = ctypes.windll.user32
+        WinEventProc = ctypes.WINFUNCTYPE(
+            None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+            wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+        )
+        # Keep a reference to the callback for the lifetime of the hook
+        callback = WinEventProc(lambda *args: _invalidate_active_window())
+        hook = user32.SetWinEventHook(
+            self.EVENT_SYSTEM_FOREGROUND, self.EVENT_SYSTEM_FOREGROUND,
+            0, callback, 0, 0, self.WINEVENT_OUTOFCONTEXT
+        )
+        if not hook:
+            raise OSError("SetWinEventHook failed")
+        
+        self._native_handle = ctypes.windll.kernel32.GetCurrentThreadId()
+        self._subscribed(ready)
+        try:
+            msg = wintypes.MSG()
+            while user32.GetMessageW(ctypes.byref(msg), 0, 0, 0) > 0:
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+        finally:
+            user32.UnhookWinEvent(hook)
+    
+    def _subscribe_darwin(self):
+        """Observe app activation and screen parameter change notifications"""
+        from AppKit import NSWorkspace
+        from Foundation import NSNotificationCenter
+        
+        workspace_center = NSWorkspace.sharedWorkspace().notificationCenter()
+        workspace_observer = workspace_center.addObserverForName_object_queue_usingBlock_(
+            "NSWorkspaceDidActivateApplicationNotification", None, None,
+            lambda notification: _invalidate_active_window()
+        )
+        default_center = NSNotificationCenter.defaultCenter()
+        screen_observer = default_center.addObserverForName_object_queue_usingBlock_(
+            "NSApplicationDidChangeScreenParametersNotification", None, None,
+            lambda notification: _invalidate_screen_size()
+        )
+        self._native_handle = (workspace_observer, screen_observer)
+        self.watches_display = True
+        _invalidate_active_window()
+        _invalidate_screen_size()
+    
+    def _watch_linux(self, ready: threading.Event):
+        """Listen for _NET_ACTIVE_WINDOW PropertyNotify (and RandR) events on the X11 root"""
+        import select
+        from Xlib import X, display
+        from Xlib.ext import randr
+        
+        disp = display.Display()
+        try:
+            root = disp.screen().root
+            active_window_atom = disp.intern_atom("_NET_ACTIVE_WINDOW")
+            root.change_attributes(event_mask=X.PropertyChangeMask)
+            has_randr = disp.has_extension("RANDR")
+            if has_randr:
+                root.xrandr_select_input(randr.RRScreenChangeNotifyMask)
+            disp.flush()
+            
+            self._subscribed(ready)
+            self.watches_display = has_randr
+            _invalidate_screen_size()
+            while not self._stop_event.is_set():
+                # Wake up periodically so stop() is honoured
+                select.select([disp], [], [], 0.5)
+                for _ in range(disp.pending_events()):
+                    event = disp.next_event()
+                    if event.type == X.PropertyNotify and event.atom == active_window_atom:
+                        _invalidate_active_window()
+                    elif has_randr and isinstance(event, randr.ScreenChangeNotify):
+                        _invalidate_screen_size()
+        finally:
+            disp.close()
+
+
+_window_watcher = _ActiveWindowWatcher()
+
+
+# Task switcher readiness: poll for a focus change, never longer than the timeout
+_SWITCHER_TIMEOUT = 0.5
+_SWITCHER_POLL_INTERVAL = 0.005
+# Without a way to observe focus, keep the fixed wait switch_application always
+# used; a shorter one lets the typed name land in the old window (e.g. macOS)
+_SWITCHER_FALLBACK_DELAY = 0.5
+
+
+def _switcher_wait_state() -> Any:
+    """Capture what _wait_switcher_ready compares against, before the hotkey"""
+    if _SYSTEM == "windows":
+        try:
+            import win32gui
+            return win32gui.GetForegroundWindow()
+        except ImportError:
+            return None
+    if _window_watcher.active:
+        # Prime the cache; the watcher clears it on the next focus change
+        WindowManager.get_active_window_info()
+        return _active_window_cache["v"]
+    return None
+
+
+def _wait_switcher_ready(previous: Any, timeout: float = _SWITCHER_TIMEOUT):
+    """Wait until the task switcher has taken focus (or the timeout expires)"""
+    if previous is None:
+        # No cheap way to observe focus here
+        time.sleep(_SWITCHER_FALLBACK_DELAY)
+        return
+    
+    if _SYSTEM == "windows":
+        import win32gui
+        focus_changed = lambda: win32gui.GetForegroundWindow() != previous
+    else:
+        focus_changed = lambda: _active_window_cache["v"] is not previous
+    
+    deadline = time.perf_counter() + timeout
+    while not focus_changed() and time.perf_counter() < deadline:
+        time.sleep(_SWITCHER_POLL_INTERVAL)
+
+
 class WindowManager:
     """Manages window operations and desktop interactions"""
     
     @staticmethod
     def get_system_type():
         """Get the current operating system"""
-        return platform.system().lower()
+        return _SYSTEM
     
     @staticmethod
+    @_safe("get active window info")
     def get_active_window_info() -> Dict[str, Any]:
         """Get information about the currently active window"""
-        try:
-            system = WindowManager.get_system_type()
+        # While the watcher runs, a snapshot stays valid until focus changes
+        now = time.monotonic()
+        cached = _active_window_cache["v"]
+        if cached is not None and (
+                _window_watcher.active or now - _active_window_cache["t"] < _ACTIVE_WINDOW_TTL):
+            return dict(cached)
+        
+        info = WindowManager._query_active_window()
+        _active_window_cache["t"] = now
+        _active_window_cache["v"] = info
+        return dict(info)
+    
+    @staticmethod
+    @_safe("start window watcher")
+    def start_watcher() -> Dict[str, Any]:
+        """Start pushing active window changes into the cache instead of polling"""
+        if not _window_watcher.start():
+            return {"success": False, "error": f"Window watching not supported on {_SYSTEM}"}
+        return {"success": True, "message": "Active window watcher started"}
+    
+    @staticmethod
+    @_safe("stop window watcher")
+    def stop_watcher() -> Dict[str, Any]:
+        """Stop the active window watcher"""
+        _window_watcher.stop()
+        return {"success": True, "message": "Active window watcher stopped"}
+    
+    @staticmethod
+    def invalidate_screen_cache():
+        """Force the next screen size lookup to query the OS (e.g. after a resolution change)"""
+        _invalidate_screen_size()
+    
+    @staticmethod
+    def _query_active_window() -> Dict[str, Any]:
+        """Query the OS for the active window, bypassing the cache"""
+        if _SYSTEM == "windows":
+            # Windows-specific window detection
+            import win32gui
+            import win32process
             
-            if system == "windows":
-                # Windows-specific window detection
-                import win32gui
-                import win32process
+            hwnd = win32gui.GetForegroundWindow()
+            if hwnd:
+                window_text = win32gui.GetWindowText(hwnd)
+                _, pid = win32process.GetWindowThreadProcessId(hwnd)
+                rect = win32gui.GetWindowRect(hwnd)
                 
-                hwnd = win32gui.GetForegroundWindow()
-                if hwnd:
-                    window_text = win32gui.GetWindowText(hwnd)
-                    _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                    rect = win32gui.GetWindowRect(hwnd)
-                    
-                    return {
-                        "success": True,
-                        "title": window_text,
-                        "pid": pid,
-                        "position": {"x": rect[0], "y": rect[1]},
-                        "size": {"width": rect[2] - rect[0], "height": rect[3] - rect[1]},
-                        "handle": hwnd
-                    }
-            
-            elif system == "darwin":  # macOS
-                # Use AppleScript for macOS
-                script = '''
-                tell application "System Events"
-                    set frontApp to first application process whose frontmost is true
-                    set frontWindow to first window of frontApp
-                    return {name of frontApp, name of frontWindow, position of frontWindow, size of frontWindow}
-                end tell
-                '''
-                result = subprocess.run(['osascript', '-e', script], 
-                                     capture_output=True, text=True)
+                return {
+                    "success": True,
+                    "title": window_text,
+                    "pid": pid,
+                    "position": {"x": rect[0], "y": rect[1]},
+                    "size": {"width": rect[2] - rect[0], "height": rect[3] - rect[1]},
+                    "handle": hwnd
+                }
+        
+        elif _SYSTEM == "darwin":  # macOS
+            # One AppleScript call returns every field we need; go through the
+            # persistent helper and only spawn osascript if it is unavailable
+            output = _osa_worker.run(_ACTIVE_WINDOW_SCRIPT)
+            if output is None:
+                result = subprocess.run(['osascript', '-e', _ACTIVE_WINDOW_SCRIPT],
+                                        capture_output=True, text=True)
+                if result.returncode == 0:
+                    output = result.stdout
+            if output is not None:
+                # Output looks like "App, Title, x, y, width, height"
+                head, *numbers = output.strip().rsplit(", ", 4)
+                app_name, _, title = head.partition(", ")
+                info = {
+                    "success": True,
+                    "title": title or "Active Window",
+                    "app_name": app_name,
+                    "system": "macOS"
+                }
+                if len(numbers) == 4 and all(n.lstrip("-").isdigit() for n in numbers):
+                    x, y, width, height = map(int, numbers)
+                    info["position"] = {"x": x, "y": y}
+                    info["size"] = {"width": width, "height": height}
+                return info
+        
+        elif _SYSTEM == "linux":
+            # xdotool only reads the active window (wmctrl -a would activate one)
+            try:
+                result = subprocess.run(
+                    ['xdotool', 'getactivewindow', 'getwindowname', 'getwindowpid'],
+                    capture_output=True, text=True
+                )
                 if result.returncode == 0:
-                    # Parse the result
-                    return {
+                    lines = result.stdout.splitlines()
+                    info = {
                         "success": True,
-                        "title": "Active Window",
-                        "app_name": result.stdout.strip(),
-                        "system": "macOS"
+                        "title": lines[0] if lines else "Active Window",
+                        "system": "Linux"
                     }
-            
-            elif system == "linux":
-                # Use wmctrl for Linux
-                try:
-                    result = subprocess.run(['wmctrl', '-a'], capture_output=True, text=True)
-                    if result.returncode == 0:
-                        return {
-                            "success": True,
-                            "title": "Active Window",
-                            "system": "Linux"
-                        }
-                except FileNotFoundError:
-                    pass
-            
-            # Fallback method using screen position
-            return {
-                "success": True,
-                "title": "Unknown Window",
-                "position": {"x": 0, "y": 0},
-                "size": {"width": 1920, "height": 1080},
-                "system": system
-            }
-            
-        except Exception as e:
-            logger.error(f"Failed to get active window info: {str(e)}")
-            return {"success": False, "error": str(e)}
+                    if len(lines) > 1 and lines[1].isdigit():
+                        info["pid"] = int(lines[1])
+                    return info
+            except FileNotFoundError:
+                pass
+        
+        # Fallback method using screen position
+        return {
+            "success": True,
+            "title": "Unknown Window",
+            "position": {"x": 0, "y": 0},
+            "size": {"width": 1920, "height": 1080},
+            "system": _SYSTEM
+        }
     
     @staticmethod
+    @_safe("minimize window")
     def minimize_window() -> Dict[str, Any]:
         """Minimize the currently active window"""
-        try:
-            system = WindowManager.get_system_type()
-            
-            if system == "windows":
-                pyautogui.hotkey('win', 'down')
-            elif system == "darwin":
-                pyautogui.hotkey('cmd', 'm')
-            else:  # Linux
-                pyautogui.hotkey('alt', 'F9')
-            
-            return {"success": True, "message": "Window minimized"}
-        except Exception as e:
-            logger.error(f"Failed to minimize window: {str(e)}")
-            return {"success": False, "error": str(e)}
+        pyautogui.hotkey(*_hotkey_for("minimize"))
+        
+        return {"success": True, "message": "Window minimized"}
     
     @staticmethod
+    @_safe("maximize window")
     def maximize_window() -> Dict[str, Any]:
         """Maximize the currently active window"""
-        try:
-            system = WindowManager.get_system_type()
-            
-            if system == "windows":
-                pyautogui.hotkey('win', 'up')
-            elif system == "darwin":
-                # macOS doesn't have a direct maximize, use fullscreen
-                pyautogui.hotkey('ctrl', 'cmd', 'f')
-            else:  # Linux
-                pyautogui.hotkey('alt', 'F10')
-            
-            return {"success": True, "message": "Window maximized"}
-        except Exception as e:
-            logger.error(f"Failed to maximize window: {str(e)}")
-            return {"success": False, "error": str(e)}
+        pyautogui.hotkey(*_hotkey_for("maximize"))
+        
+        return {"success": True, "message": "Window maximized"}
     
     @staticmethod
+    @_safe("close window")
     def close_window() -> Dict[str, Any]:
         """Close the currently active window"""
-        try:
-            system = WindowManager.get_system_type()
-            
-            if system == "windows":
-                pyautogui.hotkey('alt', 'F4')
-            elif system == "darwin":
-                pyautogui.hotkey('cmd', 'w')
-            else:  # Linux
-                pyautogui.hotkey('alt', 'F4')
-            
-            return {"success": True, "message": "Window closed"}
-        except Exception as e:
-            logger.error(f"Failed to close window: {str(e)}")
-            return {"success": False, "error": str(e)}
+        pyautogui.hotkey(*_hotkey_for("close"))
+        
+        return {"success": True, "message": "Window closed"}
     
     @staticmethod
-    def switch_application(app_name: str) -> Dict[str, Any]:
-        """Switch to a specific application"""
+    @_safe("switch to application")
+    def switch_application(app_name: str, delay: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Switch to a specific application
+        
+        Args:
+            app_name: Application to search for in the task switcher
+            delay: Fixed wait for the switcher to appear; by default wait
+                only until the foreground window changes (bounded)
+        """
+        wait_state = _switcher_wait_state() if delay is None else None
+        
+        # Alt+Tab (Cmd+Tab on macOS) to open the task switcher
+        pyautogui.hotkey(*_hotkey_for("switch"))
+        if delay is None:
+            _wait_switcher_ready(wait_state)
+        elif delay > 0:
+            time.sleep(delay)
+        
+        if _SYSTEM in ("windows", "darwin"):
+            # Search the switcher for the application
+            pyautogui.typewrite(app_name)
+            pyautogui.press('enter')
+        
+        return {"success": True, "message": f"Switched to {app_name}"}
+    
+    @staticmethod
+    async def get_active_window_info_async() -> Dict[str, Any]:
+        """Async variant of get_active_window_info that runs off the event loop"""
+        return await _run_blocking(WindowManager.get_active_window_info)
+    
+    @staticmethod
+    async def switch_application_async(app_name: str, delay: Optional[float] = None) -> Dict[str, Any]:
+        """Async variant of switch_application that runs off the event loop"""
+        return await _run_blocking(WindowManager.switch_application, app_name, delay)
+
+# Last clipboard read. It is revalidated against the OS clipboard change
+# counter where one exists (Windows, macOS), otherwise reused for a short TTL
+_CLIPBOARD_TTL = 0.1
+_clipboard_cache: Dict[str, Any] = {"seq": None, "t": 0.0, "content": None}
+
+
+def _clipboard_sequence() -> Optional[int]:
+    """Get the clipboard change counter, or None if there isn't a cheap one"""
+    if _SYSTEM == "windows":
+        import ctypes
+        return ctypes.windll.user32.GetClipboardSequenceNumber()
+    if _SYSTEM == "darwin":
         try:
-            system = WindowManager.get_system_type()
-            
-            if system == "windows":
-                # Alt+Tab to open task switcher, then search
-                pyautogui.hotkey('alt', 'tab')
-                time.sleep(0.5)
-                pyautogui.typewrite(app_name)
-                pyautogui.press('enter')
-            elif system == "darwin":
-                # Use Cmd+Tab and then search
-                pyautogui.hotkey('cmd', 'tab')
-                time.sleep(0.5)
-                pyautogui.typewrite(app_name)
-                pyautogui.press('enter')
-            else:  # Linux
-                # Use Alt+Tab
-                pyautogui.hotkey('alt', 'tab')
-                time.sleep(0.5)
-            
-            return {"success": True, "message": f"Switched to {app_name}"}
-        except Exception as e:
-            logger.error(f"Failed to switch to application: {str(e)}")
-            return {"success": False, "error": str(e)}
+            from AppKit import NSPasteboard
+        except ImportError:
+            return None
+        return NSPasteboard.generalPasteboard().changeCount()
+    return None
+
+
+def _remember_clipboard(content: str):
+    """Record content we just read or wrote as the current clipboard"""
+    _clipboard_cache["seq"] = _clipboard_sequence()
+    _clipboard_cache["t"] = time.monotonic()
+    _clipboard_cache["content"] = content
+
 
 class ClipboardManager:
     """Manages clipboard operations"""
     
     @staticmethod
-    def get_clipboard_content() -> Dict[str, Any]:
-        """Get the current clipboard content"""
+    def get_clipboard_content(include_content: bool = True) -> Dict[str, Any]:
+        """
+        Get the current clipboard content
+        
+        Args:
+            include_content: Set to False to only report the length
+        """
         try:
-            content = pyperclip.paste()
-            return {
+            content = _clipboard_cache["content"]
+            if content is not None:
+                seq = _clipboard_sequence()
+                if seq is not None:
+                    fresh = seq == _clipboard_cache["seq"]
+                else:
+                    fresh = time.monotonic() - _clipboard_cache["t"] < _CLIPBOARD_TTL
+                if not fresh:
+                    content = None
+            
+            if content is None:
+                content = pyperclip.paste()
+                _remember_clipboard(content)
+            
+            result = {
                 "success": True,
                 "content": content,
                 "length": len(content),
                 "type": "text"
             }
+            if not include_content:
+                del result["content"]
+            return result
         except Exception as e:
             logger.error(f"Failed to get clipboard content: {str(e)}")
             return {"success": False, "error": str(e)}
@@ -206,6 +692,7 @@ class ClipboardManager:
         """Set the clipboard content"""
         try:
             pyperclip.copy(text)
+            _remember_clipboard(text)
             return {
                 "success": True,
                 "message": f"Copied {len(text)} characters to clipboard",
@@ -220,156 +707,375 @@ class ClipboardManager:
         """Clear the clipboard"""
         try:
             pyperclip.copy("")
+            _remember_clipboard("")
             return {"success": True, "message": "Clipboard cleared"}
         except Exception as e:
             logger.error(f"Failed to clear clipboard: {str(e)}")
             return {"success": False, "error": str(e)}
+    
+    @staticmethod
+    async def get_clipboard_content_async(include_content: bool = True) -> Dict[str, Any]:
+        """Async variant of get_clipboard_content that runs off the event loop"""
+        return await _run_blocking(ClipboardManager.get_clipboard_content, include_content)
+    
+    @staticmethod
+    async def set_clipboard_content_async(text: str) -> Dict[str, Any]:
+        """Async variant of set_clipboard_content that runs off the event loop"""
+        return await _run_blocking(ClipboardManager.set_clipboard_content, text)
+
+# Map common key names to their pyautogui names
+_KEY_MAP: Dict[str, str] = {
+    "ctrl": "ctrl", "control": "ctrl",
+    "alt": "alt", "option": "alt",
+    "shift": "shift",
+    "cmd": "cmd", "command": "cmd", "win": "win", "windows": "win",
+    "tab": "tab", "enter": "enter", "return": "enter",
+    "space": "space", "spacebar": "space",
+    "escape": "esc", "esc": "esc",
+    "delete": "delete", "del": "delete",
+    "backspace": "backspace",
+    "home": "home", "end": "end",
+    "pageup": "pageup", "pagedown": "pagedown",
+    "up": "up", "down": "down", "left": "left", "right": "right"
+}
+
+
+# type_text pastes text at least this long instead of typing it key by key
+_PASTE_MIN_LENGTH = 64
+# Give the target app time to consume the paste before the clipboard is restored
+_CLIPBOARD_RESTORE_DELAY = 0.5
+
+
+def _paste_text(text: str):
+    """Type text by pasting it, then restore the previous clipboard text"""
+    previous = pyperclip.paste()
+    pyperclip.copy(text)
+    _remember_clipboard(text)
+    pyautogui.hotkey("cmd" if _SYSTEM == "darwin" else "ctrl", "v")
+    
+    # pyperclip reads non-text content (images, files) as "", and copying ""
+    # back would wipe it, so there is only something to restore for text
+    if not previous:
+        return
+    
+    def restore():
+        # Leave the clipboard alone if something else replaced it meanwhile
+        if pyperclip.paste() == text:
+            pyperclip.copy(previous)
+            _remember_clipboard(previous)
+    
+    timer = threading.Timer(_CLIPBOARD_RESTORE_DELAY, restore)
+    timer.daemon = True
+    timer.start()
+
 
 class MouseKeyboardController:
     """Controls mouse and keyboard automation"""
     
     @staticmethod
+    @_safe("click at position")
     def click_at_position(x: int, y: int, button: str = "left", clicks: int = 1) -> Dict[str, Any]:
         """Click at a specific screen position"""
-        try:
-            button_map = {
-                "left": pyautogui.LEFT,
-                "right": pyautogui.RIGHT,
-                "middle": pyautogui.MIDDLE
-            }
-            
-            if button not in button_map:
-                return {"success": False, "error": f"Invalid button: {button}"}
-            
+        button_map = {
+            "left": pyautogui.LEFT,
+            "right": pyautogui.RIGHT,
+            "middle": pyautogui.MIDDLE
+        }
+        
+        if button not in button_map:
+            return {"success": False, "error": f"Invalid button: {button}"}
+        
+        # Inject natively when possible; pyautogui is the portable fallback
+        if not _inject.click(x, y, button, clicks):
             pyautogui.click(x, y, clicks=clicks, button=button_map[button])
-            
-            return {
-                "success": True,
-                "message": f"Clicked {button} button {clicks} time(s) at ({x}, {y})",
-                "position": {"x": x, "y": y},
-                "button": button,
-                "clicks": clicks
-            }
-        except Exception as e:
-            logger.error(f"Failed to click at position: {str(e)}")
-            return {"success": False, "error": str(e)}
+        
+        return {
+            "success": True,
+            "message": f"Clicked {button} button {clicks} time(s) at ({x}, {y})",
+            "position": {"x": x, "y": y},
+            "button": button,
+            "clicks": clicks
+        }
     
     @staticmethod
-    def type_text(text: str, interval: float = 0.1) -> Dict[str, Any]:
-        """Type text with specified interval between characters"""
-        try:
+    @_safe("type text")
+    def type_text(text: str, interval: float = 0.1,
+                  mode: Literal["auto", "typewrite", "paste"] = "auto") -> Dict[str, Any]:
+        """
+        Type text with specified interval between characters
+        
+        Args:
+            text: Text to type
+            interval: Delay between characters (typewrite only)
+            mode: "typewrite" sends one key event per character, "paste" goes
+                through the clipboard, "auto" pastes long printable text when
+                no interval is requested. Pasting takes over the clipboard:
+                text on it is put back shortly afterwards, but other content
+                (an image, copied files) is replaced by the typed text.
+        """
+        use_paste = mode == "paste" or (
+            mode == "auto" and interval <= 0 and
+            len(text) >= _PASTE_MIN_LENGTH and text.isprintable()
+        )
+        if use_paste:
+            _paste_text(text)
+        else:
             pyautogui.typewrite(text, interval=interval)
-            return {
-                "success": True,
-                "message": f"Typed {len(text)} characters",
-                "text": text[:100] + "..." if len(text) > 100 else text,
-                "interval": interval
-            }
-        except Exception as e:
-            logger.error(f"Failed to type text: {str(e)}")
-            return {"success": False, "error": str(e)}
+        return {
+            "success": True,
+            "message": f"Typed {len(text)} characters",
+            "text": text[:100] + "..." if len(text) > 100 else text,
+            "interval": interval
+        }
     
     @staticmethod
+    @_safe("send key combination")
     def send_key_combination(keys: List[str]) -> Dict[str, Any]:
         """Send a key combination (e.g., ctrl+c, alt+tab)"""
-        try:
-            # Map common key names
-            key_map = {
-                "ctrl": "ctrl", "control": "ctrl",
-                "alt": "alt", "option": "alt",
-                "shift": "shift",
-                "cmd": "cmd", "command": "cmd", "win": "win", "windows": "win",
-                "tab": "tab", "enter": "enter", "return": "enter",
-                "space": "space", "spacebar": "space",
-                "escape": "esc", "esc": "esc",
-                "delete": "delete", "del": "delete",
-                "backspace": "backspace",
-                "home": "home", "end": "end",
-                "pageup": "pageup", "pagedown": "pagedown",
-                "up": "up", "down": "down", "left": "left", "right": "right"
-            }
-            
-            # Convert keys to lowercase and map them
-            mapped_keys = []
-            for key in keys:
-                key_lower = key.lower()
-                if key_lower in key_map:
-                    mapped_keys.append(key_map[key_lower])
-                elif len(key) == 1:  # Single character
-                    mapped_keys.append(key_lower)
-                else:
-                    mapped_keys.append(key)  # Use as-is for function keys, etc.
-            
-            pyautogui.hotkey(*mapped_keys)
-            
-            return {
-                "success": True,
-                "message": f"Sent key combination: {'+'.join(keys)}",
-                "keys": mapped_keys
-            }
-        except Exception as e:
-            logger.error(f"Failed to send key combination: {str(e)}")
-            return {"success": False, "error": str(e)}
+        # Convert keys to lowercase and map them; single characters are
+        # lowercased, anything else unknown (function keys, etc.) is used as-is
+        key_map_get = _KEY_MAP.get
+        mapped_keys = [
+            key_map_get(key.lower()) or (key.lower() if len(key) == 1 else key)
+            for key in keys
+        ]
+        
+        pyautogui.hotkey(*mapped_keys)
+        
+        return {
+            "success": True,
+            "message": f"Sent key combination: {'+'.join(keys)}",
+            "keys": mapped_keys
+        }
     
     @staticmethod
+    @_safe("get mouse position")
     def get_mouse_position() -> Dict[str, Any]:
         """Get current mouse position"""
-        try:
-            x, y = pyautogui.position()
-            return {
-                "success": True,
-                "position": {"x": x, "y": y},
-                "screen_size": {"width": pyautogui.size().width, "height": pyautogui.size().height}
-            }
-        except Exception as e:
-            logger.error(f"Failed to get mouse position: {str(e)}")
-            return {"success": False, "error": str(e)}
+        x, y = pyautogui.position()
+        width, height = _screen_size()
+        return {
+            "success": True,
+            "position": {"x": x, "y": y},
+            "screen_size": {"width": width, "height": height}
+        }
     
     @staticmethod
+    @_safe("move mouse")
     def move_mouse_to(x: int, y: int, duration: float = 1.0) -> Dict[str, Any]:
         """Move mouse to specific position with animation"""
-        try:
+        # Instant moves are a single native call; animated ones need pyautogui
+        if duration > 0 or not _inject.move_to(x, y):
             pyautogui.moveTo(x, y, duration=duration)
-            return {
-                "success": True,
-                "message": f"Moved mouse to ({x}, {y})",
-                "position": {"x": x, "y": y},
-                "duration": duration
-            }
-        except Exception as e:
-            logger.error(f"Failed to move mouse: {str(e)}")
-            return {"success": False, "error": str(e)}
+        return {
+            "success": True,
+            "message": f"Moved mouse to ({x}, {y})",
+            "position": {"x": x, "y": y},
+            "duration": duration
+        }
     
     @staticmethod
+    @_safe("scroll")
     def scroll(direction: str, clicks: int = 3) -> Dict[str, Any]:
         """Scroll up or down"""
-        try:
-            if direction.lower() == "up":
-                pyautogui.scroll(clicks)
-            elif direction.lower() == "down":
-                pyautogui.scroll(-clicks)
-            else:
-                return {"success": False, "error": "Direction must be 'up' or 'down'"}
-            
-            return {
-                "success": True,
-                "message": f"Scrolled {direction} {clicks} clicks",
-                "direction": direction,
-                "clicks": clicks
-            }
-        except Exception as e:
-            logger.error(f"Failed to scroll: {str(e)}")
-            return {"success": False, "error": str(e)}
+        if direction.lower() == "up":
+            pyautogui.scroll(clicks)
+        elif direction.lower() == "down":
+            pyautogui.scroll(-clicks)
+        else:
+            return {"success": False, "error": "Direction must be 'up' or 'down'"}
+        
+        return {
+            "success": True,
+            "message": f"Scrolled {direction} {clicks} clicks",
+            "direction": direction,
+            "clicks": clicks
+        }
+    
+    @staticmethod
+    async def type_text_async(text: str, interval: float = 0.1,
+                              mode: Literal["auto", "typewrite", "paste"] = "auto") -> Dict[str, Any]:
+        """Async variant of type_text that runs off the event loop"""
+        return await _run_blocking(MouseKeyboardController.type_text, text, interval, mode)
+    
+    @staticmethod
+    async def move_mouse_to_async(x: int, y: int, duration: float = 1.0) -> Dict[str, Any]:
+        """Async variant of move_mouse_to that runs off the event loop"""
+        return await _run_blocking(MouseKeyboardController.move_mouse_to, x, y, duration)
+
+# Event type codes for the MacroRecorder column buffer
+_EVENT_CLICK = 0
+_EVENT_SCROLL = 1
+_EVENT_KEY = 2
+_EVENT_NAMES = ("mouse_click", "mouse_scroll", "key_press")
+
+# Events due within this window of each other are replayed back-to-back without sleeping
+_PLAYBACK_BATCH_WINDOW = 0.002
+
+
+def _sign(value: float) -> int:
+    """-1, 0 or 1 depending on the sign of value"""
+    return (value > 0) - (value < 0)
+
 
 class MacroRecorder:
     """Records and plays back mouse and keyboard macros"""
     
-    def __init__(self):
+    # Fixed attribute layout: the listener callbacks read these on every event
+    __slots__ = (
+        "max_events", "scroll_coalesce_window", "recording",
+        "mouse_listener", "keyboard_listener", "start_time",
+        "_queue", "_drain_thread",
+        "_times", "_types", "_x", "_y", "_dx", "_dy", "_codes", "_pressed",
+        "_names", "_name_ids", "_head", "_dropped",
+    )
+    
+    DEFAULT_MAX_EVENTS = 1_000_000
+    DEFAULT_SCROLL_COALESCE_WINDOW = 0.05
+    
+    def __init__(self, max_events: int = DEFAULT_MAX_EVENTS,
+                 scroll_coalesce_window: float = DEFAULT_SCROLL_COALESCE_WINDOW):
+        """
+        Args:
+            max_events: Events kept per recording; once reached, the oldest
+                events are overwritten so a forgotten recorder can't grow forever
+            scroll_coalesce_window: Seconds within which consecutive scrolls at
+                the same position and direction merge into one event (0 disables)
+        """
+        if max_events < 1:
+            raise ValueError("max_events must be at least 1")
+        self.max_events = max_events
+        self.scroll_coalesce_window = scroll_coalesce_window
         self.recording = False
-        self.events = []
         self.mouse_listener = None
         self.keyboard_listener = None
         self.start_time = None
+        # Listener threads only enqueue raw tuples; the drain thread owns the columns
+        self._queue: Optional[queue.SimpleQueue] = None
+        self._drain_thread: Optional[threading.Thread] = None
+        self._reset_buffer()
+    
+    def _reset_buffer(self):
+        """Allocate empty event columns (one typed array per field)"""
+        self._times = array("d")
+        self._types = array("B")
+        self._x = array("i")
+        self._y = array("i")
+        self._dx = array("i")
+        self._dy = array("i")
+        self._codes = array("H")  # index into _names (button or key)
+        self._pressed = array("B")
+        self._names: List[str] = []
+        # Keyed by the pynput Button/Key/KeyCode itself so str() runs once per distinct key
+        self._name_ids: Dict[Any, int] = {}
+        # Ring state once max_events is reached: next slot to overwrite
+        self._head = 0
+        self._dropped = 0
+    
+    def _intern_name(self, source: Any) -> int:
+        """Map a button/key object to a small integer id, naming it on first sight"""
+        code = self._name_ids.get(source)
+        if code is None:
+            code = len(self._names)
+            self._name_ids[source] = code
+            self._names.append(str(source))
+        return code
+    
+    def _append_event(self, event_type: int, t: float, x: int = 0, y: int = 0,
+                      dx: int = 0, dy: int = 0, source: Any = None, pressed: bool = False):
+        """Append one event row to the columns (drain thread only)"""
+        if event_type == _EVENT_SCROLL and self._coalesce_scroll(t, x, y, dx, dy):
+            return
+        
+        # Listeners may report float coordinates (e.g. on macOS)
+        code = self._intern_name(source) if source is not None else 0
+        if len(self._times) < self.max_events:
+            self._times.append(t)
+            self._types.append(event_type)
+            self._x.append(int(x))
+            self._y.append(int(y))
+            self._dx.append(int(dx))
+            self._dy.append(int(dy))
+            self._codes.append(code)
+            self._pressed.append(pressed)
+            return
+        
+        # Buffer full: overwrite the oldest row
+        i = self._head
+        self._times[i] = t
+        self._types[i] = event_type
+        self._x[i] = int(x)
+        self._y[i] = int(y)
+        self._dx[i] = int(dx)
+        self._dy[i] = int(dy)
+        self._codes[i] = code
+        self._pressed[i] = pressed
+        self._head = (i + 1) % self.max_events
+        self._dropped += 1
+    
+    def _coalesce_scroll(self, t: float, x: int, y: int, dx: int, dy: int) -> bool:
+        """Fold a scroll into the previous row if it continues the same gesture"""
+        count = len(self._times)
+        if not count or self.scroll_coalesce_window <= 0:
+            return False
+        last = (self._head - 1) % count
+        if (self._types[last] != _EVENT_SCROLL
+                or t - self._times[last] >= self.scroll_coalesce_window
+                or self._x[last] != int(x) or self._y[last] != int(y)):
+            return False
+        
+        # Same direction on both axes (0 counts as its own direction)
+        last_dx, last_dy = self._dx[last], self._dy[last]
+        if _sign(last_dx) != _sign(dx) or _sign(last_dy) != _sign(dy):
+            return False
+        
+        # The row keeps its first timestamp so long gestures still replay in steps
+        self._dx[last] = last_dx + int(dx)
+        self._dy[last] = last_dy + int(dy)
+        return True
+    
+    def _drain(self, events: queue.SimpleQueue):
+        """Move queued listener events into the columns until the stop sentinel"""
+        get, append = events.get, self._append_event
+        while True:
+            item = get()
+            if item is None:
+                break
+            try:
+                append(*item)
+            except Exception:
+                # Drop just this event; letting the error end the thread would
+                # silently lose every event recorded after it
+                logger.exception(f"Failed to record macro event {item!r}")
+    
+    def _ordered_indices(self):
+        """Iterate row indices from oldest to newest"""
+        head = self._head
+        return chain(range(head, len(self._times)), range(head))
+    
+    def recording_bytes(self) -> int:
+        """Approximate memory held by the recorded event columns"""
+        columns = (self._times, self._types, self._x, self._y,
+                   self._dx, self._dy, self._codes, self._pressed)
+        return sum(column.itemsize * len(column) for column in columns)
+    
+    def _event_dict(self, i: int) -> Dict[str, Any]:
+        """Materialize event row i in the public dict format"""
+        event_type = self._types[i]
+        event = {"type": _EVENT_NAMES[event_type], "time": self._times[i]}
+        if event_type == _EVENT_CLICK:
+            event.update(x=self._x[i], y=self._y[i], button=self._names[self._codes[i]],
+                         pressed=bool(self._pressed[i]))
+        elif event_type == _EVENT_SCROLL:
+            event.update(x=self._x[i], y=self._y[i], dx=self._dx[i], dy=self._dy[i])
+        else:
+            event["key"] = self._names[self._codes[i]]
+        return event
+    
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        """Recorded events as a list of dicts"""
+        return [self._event_dict(i) for i in self._ordered_indices()]
     
     def start_recording(self) -> Dict[str, Any]:
         """Start recording mouse and keyboard events"""
@@ -377,9 +1083,17 @@ class MacroRecorder:
             if self.recording:
                 return {"success": False, "error": "Already recording"}
             
+            self._reset_buffer()
+            self._queue = queue.SimpleQueue()
+            self._drain_thread = threading.Thread(
+                target=self._drain, args=(self._queue,),
+                name="MacroRecorder.drain", daemon=True
+            )
+            self._drain_thread.start()
+            
+            # Monotonic, high-resolution clock: wall-clock jumps can't skew the replay
+            self.start_time = time.perf_counter()
             self.recording = True
-            self.events = []
-            self.start_time = time.time()
             
             # Start mouse listener
             self.mouse_listener = MouseListener(
@@ -398,7 +1112,7 @@ class MacroRecorder:
             return {
                 "success": True,
                 "message": "Started recording macro",
-                "start_time": self.start_time
+                "start_time": time.time()
             }
         except Exception as e:
             logger.error(f"Failed to start recording: {str(e)}")
@@ -418,15 +1132,22 @@ class MacroRecorder:
             if self.keyboard_listener:
                 self.keyboard_listener.stop()
             
-            end_time = time.time()
-            duration = end_time - self.start_time
+            duration = time.perf_counter() - self.start_time
+            
+            # Let the drain thread finish storing everything that was queued
+            self._queue.put(None)
+            self._drain_thread.join()
             
             return {
                 "success": True,
                 "message": f"Stopped recording macro",
                 "duration": duration,
-                "events": len(self.events),
-                "recorded_events": self.events[:10]  # Show first 10 events
+                "events": len(self._times),
+                "events_dropped": self._dropped,
+                # Show first 10 events
+                "recorded_events": [
+                    self._event_dict(i) for i in islice(self._ordered_indices(), 10)
+                ]
             }
         except Exception as e:
             logger.error(f"Failed to stop recording: {str(e)}")
@@ -435,38 +1156,20 @@ class MacroRecorder:
     def _on_mouse_click(self, x, y, button, pressed):
         """Handle mouse click events"""
         if self.recording:
-            current_time = time.time() - self.start_time
-            self.events.append({
-                "type": "mouse_click",
-                "time": current_time,
-                "x": x,
-                "y": y,
-                "button": str(button),
-                "pressed": pressed
-            })
+            self._queue.put((_EVENT_CLICK, time.perf_counter() - self.start_time,
+                             x, y, 0, 0, button, pressed))
     
     def _on_mouse_scroll(self, x, y, dx, dy):
         """Handle mouse scroll events"""
         if self.recording:
-            current_time = time.time() - self.start_time
-            self.events.append({
-                "type": "mouse_scroll",
-                "time": current_time,
-                "x": x,
-                "y": y,
-                "dx": dx,
-                "dy": dy
-            })
+            self._queue.put((_EVENT_SCROLL, time.perf_counter() - self.start_time,
+                             x, y, dx, dy, None, False))
     
     def _on_key_press(self, key):
         """Handle key press events"""
         if self.recording:
-            current_time = time.time() - self.start_time
-            self.events.append({
-                "type": "key_press",
-                "time": current_time,
-                "key": str(key)
-            })
+            self._queue.put((_EVENT_KEY, time.perf_counter() - self.start_time,
+                             0, 0, 0, 0, key, False))
     
     def play_macro(self, speed_multiplier: float = 1.0) -> Dict[str, Any]:
         """Play back recorded macro"""
@@ -474,38 +1177,62 @@ class MacroRecorder:
             if self.recording:
                 return {"success": False, "error": "Cannot play macro while recording"}
             
-            if not self.events:
+            event_count = len(self._times)
+            if not event_count:
                 return {"success": False, "error": "No recorded events to play"}
             
-            # Play back events
-            last_time = 0
-            for event in self.events:
-                # Wait for the appropriate delay
-                delay = (event["time"] - last_time) / speed_multiplier
-                if delay > 0:
-                    time.sleep(delay)
-                
-                # Execute the event
-                if event["type"] == "mouse_click" and event["pressed"]:
-                    pyautogui.click(event["x"], event["y"])
-                elif event["type"] == "mouse_scroll":
-                    pyautogui.scroll(event["dy"], x=event["x"], y=event["y"])
-                elif event["type"] == "key_press":
-                    try:
-                        # Parse the key and press it
-                        key_str = event["key"].replace("Key.", "").replace("'", "")
-                        pyautogui.press(key_str)
-                    except:
-                        pass  # Skip invalid keys
+            # Resolve key names once per distinct key rather than per event
+            key_names = [name.replace("Key.", "").replace("'", "") for name in self._names]
+            
+            # Precompute the schedule: row order and absolute deadlines
+            # relative to playback start (the ring may have overwritten the start,
+            # so time from the oldest kept event)
+            times, types = self._times, self._types
+            xs, ys, dys = self._x, self._y, self._dy
+            codes, pressed = self._codes, self._pressed
+            order = array("L", self._ordered_indices())
+            time_offset = times[order[0]]
+            deadlines = array("d", ((times[i] - time_offset) / speed_multiplier for i in order))
+            
+            # Sleep at most once per batch; events closer together than the
+            # batch window go out back-to-back, where a sleep would only add
+            # scheduler wake-up latency
+            playback_start = time.perf_counter()
+            pos = 0
+            while pos < event_count:
+                now = time.perf_counter() - playback_start
+                wait = deadlines[pos] - now
+                if wait > _PLAYBACK_BATCH_WINDOW:
+                    time.sleep(wait)
+                    now = deadlines[pos]
+                end = max(bisect_right(deadlines, now + _PLAYBACK_BATCH_WINDOW, pos), pos + 1)
                 
-                last_time = event["time"]
+                for i in islice(order, pos, end):
+                    # Execute the event
+                    event_type = types[i]
+                    if event_type == _EVENT_CLICK and pressed[i]:
+                        if not _inject.click(xs[i], ys[i]):
+                            pyautogui.click(xs[i], ys[i])
+                    elif event_type == _EVENT_SCROLL:
+                        pyautogui.scroll(dys[i], x=xs[i], y=ys[i])
+                    elif event_type == _EVENT_KEY:
+                        try:
+                            # Parse the key and press it
+                            pyautogui.press(key_names[codes[i]])
+                        except:
+                            pass  # Skip invalid keys
+                pos = end
             
             return {
                 "success": True,
-                "message": f"Played macro with {len(self.events)} events",
-                "events_played": len(self.events),
+                "message": f"Played macro with {event_count} events",
+                "events_played": event_count,
                 "speed_multiplier": speed_multiplier
             }
         except Exception as e:
             logger.error(f"Failed to play macro: {str(e)}")
-            return {"success": False, "error": str(e)}
\ No newline at end of file
+            return {"success": False, "error": str(e)}
+    
+    async def play_macro_async(self, speed_multiplier: float = 1.0) -> Dict[str, Any]:
+        """Async variant of play_macro that runs off the event loop"""
+        return await _run_blocking(self.play_macro, speed_multiplier)
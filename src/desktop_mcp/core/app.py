@@ -6,23 +6,42 @@ GUI, voice interface, plugin management, command parsing, and execution.
 """
 
 import asyncio
+import functools
+import importlib.util
+import itertools
 import logging
 import signal
 import sys
 import threading
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Deque, Dict, Any, Optional, List, Tuple
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 
 from .plugin_manager import plugin_manager
 from .command_parser import command_parser, ParsedCommand
-from ..tools.base_tool import tool_registry, ToolResult
+from ..tools.base_tool import tool_registry, BaseTool, ToolResult
 from ..utils.config import ConfigManager
 from ..utils.logging import setup_logging
 
 logger = logging.getLogger(__name__)
 
+# Queued by shutdown() to stop the command processor
+_SENTINEL = object()
+
+# Whether each interface starts when its config doesn't say
+_INTERFACE_DEFAULTS = {"gui": True, "voice": False, "hotkeys": True, "api": False}
+
+
+@dataclass(frozen=True)
+class InterfaceConfig:
+    """An interface's settings, parsed once from the app config"""
+    enabled: bool
+    config: Dict[str, Any]
+
 
 class DesktopMCPApp:
     """
@@ -50,24 +69,66 @@ class DesktopMCPApp:
         self.command_parser = command_parser
         self.tool_registry = tool_registry
         
+        # Discovery manifest that lets startup skip importing unchanged plugins
+        lazy_plugins = self.config.get("plugins", {}).get("lazy_loading", True)
+        self.plugin_manifest_path = (
+            self.config_manager.config_dir / "plugins.manifest.json" if lazy_plugins else None
+        )
+        
         # Interface components (initialized later)
         self.gui_app = None
         self.voice_interface = None
         self.hotkey_manager = None
         self.api_server = None
         
+        # get_available_tools() / plugin info, rebuilt only when the registry changes
+        self._tools_cache: Optional[List[Dict[str, Any]]] = None
+        self._tools_cache_version = -1
+        self._plugin_info_cache: Optional[Dict[str, Any]] = None
+        self._plugin_info_version = -1
+        
         # State management
         self.running = False
-        self.interfaces_enabled = {
-            "gui": self.config.get("interfaces", {}).get("gui", {}).get("enabled", True),
-            "voice": self.config.get("interfaces", {}).get("voice", {}).get("enabled", False),
-            "hotkeys": self.config.get("interfaces", {}).get("hotkeys", {}).get("enabled", True),
-            "api": self.config.get("interfaces", {}).get("api", {}).get("enabled", False)
+        interfaces_config = self.config.get("interfaces", {})
+        self.interfaces: Dict[str, InterfaceConfig] = {}
+        for name, default_enabled in _INTERFACE_DEFAULTS.items():
+            interface_config = interfaces_config.get(name, {})
+            self.interfaces[name] = InterfaceConfig(
+                enabled=interface_config.get("enabled", default_enabled),
+                config=interface_config
+            )
+        self.interfaces_enabled = {name: cfg.enabled for name, cfg in self.interfaces.items()}
+        
+        # Small, secret-free config summary for get_system_status(); the full
+        # config is only available through get_config()
+        self._status_config = {
+            "version": self.config.get("version"),
+            "app_name": self.config.get("app_name"),
+            "debug": self.config.get("debug", False),
+            "interfaces": dict(self.interfaces_enabled),
+            "plugin_directories": list(self.config.get("plugins", {}).get("plugin_directories", []))
         }
         
         # Command execution queue
         self.command_queue = asyncio.Queue()
-        self.execution_history: List[Dict[str, Any]] = []
+        self._command_task: Optional[asyncio.Task] = None
+        self._shutdown_task: Optional[asyncio.Task] = None
+        # Set as soon as shutdown starts; main() waits on it instead of polling
+        self._shutdown_event = asyncio.Event()
+        # Execution ids are a per-process sequence: cheap and collision free
+        self._execution_ids = itertools.count(1)
+        execution_config = self.config.get("execution", {})
+        # Bounded so a long-running session doesn't accumulate records forever
+        self.execution_history: Deque[Dict[str, Any]] = deque(
+            maxlen=execution_config.get("history_max", 1000)
+        )
+        self.max_batch_size = max(1, execution_config.get("max_batch_size", 16))
+        self.max_batch_wait = execution_config.get("max_batch_wait_ms", 0) / 1000
+        # Tools are synchronous and may block on files, subprocesses or OS APIs
+        self._tool_executor = ThreadPoolExecutor(
+            max_workers=execution_config.get("tool_workers", 8),
+            thread_name_prefix="DesktopMCP.Tool"
+        )
         
         logger.info("Desktop MCP Application initialized")
     
@@ -89,8 +150,10 @@ class DesktopMCPApp:
         }
         
         try:
-            # Initialize plugin system
-            plugin_results = self.plugin_manager.discover_and_load_all()
+            # Initialize plugin system; scanning and importing plugins blocks,
+            # so it runs in a worker thread to keep the event loop responsive
+            plugin_results = await asyncio.to_thread(self.plugin_manager.discover_and_load_all,
+                                                     self.plugin_manifest_path)
             results["plugins_loaded"] = plugin_results["tools_loaded"] + plugin_results["plugins_loaded"]
             results["tools_available"] = len(self.tool_registry.tools)
             
@@ -99,45 +162,32 @@ class DesktopMCPApp:
             
             logger.info(f"Loaded {results['plugins_loaded']} plugins with {results['tools_available']} tools")
             
-            # Initialize interfaces based on configuration
-            if self.interfaces_enabled["gui"]:
-                try:
-                    await self._initialize_gui()
-                    results["interfaces_started"].append("gui")
-                except Exception as e:
-                    error_msg = f"Failed to initialize GUI: {str(e)}"
-                    logger.error(error_msg)
-                    results["errors"].append(error_msg)
-            
-            if self.interfaces_enabled["voice"]:
-                try:
-                    await self._initialize_voice()
-                    results["interfaces_started"].append("voice")
-                except Exception as e:
-                    error_msg = f"Failed to initialize voice interface: {str(e)}"
-                    logger.error(error_msg)
-                    results["errors"].append(error_msg)
-            
-            if self.interfaces_enabled["hotkeys"]:
-                try:
-                    await self._initialize_hotkeys()
-                    results["interfaces_started"].append("hotkeys")
-                except Exception as e:
-                    error_msg = f"Failed to initialize hotkeys: {str(e)}"
-                    logger.error(error_msg)
-                    results["errors"].append(error_msg)
+            # Initialize the enabled interfaces concurrently; they are independent
+            interfaces = [
+                (name, label, initializer)
+                for name, label, initializer in (
+                    ("gui", "GUI", self._initialize_gui),
+                    ("voice", "voice interface", self._initialize_voice),
+                    ("hotkeys", "hotkeys", self._initialize_hotkeys),
+                    ("api", "API server", self._initialize_api),
+                )
+                if self.interfaces[name].enabled
+            ]
+            outcomes = await asyncio.gather(
+                *(initializer() for _, _, initializer in interfaces),
+                return_exceptions=True
+            )
             
-            if self.interfaces_enabled["api"]:
-                try:
-                    await self._initialize_api()
-                    results["interfaces_started"].append("api")
-                except Exception as e:
-                    error_msg = f"Failed to initialize API server: {str(e)}"
+            for (name, label, _), outcome in zip(interfaces, outcomes):
+                if isinstance(outcome, Exception):
+                    error_msg = f"Failed to initialize {label}: {str(outcome)}"
                     logger.error(error_msg)
                     results["errors"].append(error_msg)
+                else:
+                    results["interfaces_started"].append(name)
             
             # Start command processing
-            asyncio.create_task(self._process_commands())
+            self._command_task = asyncio.create_task(self._process_commands())
             
             self.running = True
             logger.info("Desktop MCP Application initialization complete")
@@ -153,22 +203,29 @@ class DesktopMCPApp:
     async def _initialize_gui(self):
         """Initialize the GUI interface"""
         try:
-            from ..interfaces.gui.main_window import DesktopMCPMainWindow
+            # Only check that Qt and the window module are importable here;
+            # the import itself is paid by the GUI thread, not the event loop
+            for module_name in ("PyQt5", "..interfaces.gui.main_window"):
+                if importlib.util.find_spec(module_name, __package__) is None:
+                    raise ImportError(f"No module named '{module_name}'")
             
             # Create GUI in a separate thread to avoid blocking
             def create_gui():
-                import sys
-                from PyQt5.QtWidgets import QApplication
-                
-                if not QApplication.instance():
-                    app = QApplication(sys.argv)
-                else:
-                    app = QApplication.instance()
-                
-                self.gui_app = DesktopMCPMainWindow(self)
-                self.gui_app.show()
-                
-                return app
+                try:
+                    from PyQt5.QtWidgets import QApplication
+                    from ..interfaces.gui.main_window import DesktopMCPMainWindow
+                    
+                    if not QApplication.instance():
+                        app = QApplication(sys.argv)
+                    else:
+                        app = QApplication.instance()
+                    
+                    self.gui_app = DesktopMCPMainWindow(self)
+                    self.gui_app.show()
+                    
+                    return app
+                except Exception as e:
+                    logger.error(f"Failed to start GUI: {e}", exc_info=True)
             
             # Run GUI in separate thread
             gui_thread = threading.Thread(target=create_gui, daemon=True)
@@ -185,7 +242,7 @@ class DesktopMCPApp:
         try:
             from ..interfaces.voice.voice_commands import VoiceInterface
             
-            voice_config = self.config.get("interfaces", {}).get("voice", {})
+            voice_config = self.interfaces["voice"].config
             self.voice_interface = VoiceInterface(
                 app=self,
                 config=voice_config
@@ -203,7 +260,7 @@ class DesktopMCPApp:
         try:
             from ..interfaces.hotkeys.hotkey_manager import HotkeyManager
             
-            hotkey_config = self.config.get("interfaces", {}).get("hotkeys", {})
+            hotkey_config = self.interfaces["hotkeys"].config
             self.hotkey_manager = HotkeyManager(
                 app=self,
                 config=hotkey_config
@@ -221,7 +278,7 @@ class DesktopMCPApp:
         try:
             from ..api.server import APIServer
             
-            api_config = self.config.get("interfaces", {}).get("api", {})
+            api_config = self.interfaces["api"].config
             self.api_server = APIServer(
                 app=self,
                 config=api_config
@@ -245,107 +302,259 @@ class DesktopMCPApp:
         Returns:
             Dict with execution results
         """
-        execution_id = f"cmd_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
-        
-        logger.info(f"Executing command [{execution_id}] from {source}: {command}")
+        execution_id = self._start_execution(command, source)
         
         try:
             # Parse the command
             parsed_command = self.command_parser.parse_command(command)
+            tool, rejection = self._resolve_tool(parsed_command, execution_id)
+            if rejection:
+                return rejection
             
-            if parsed_command.confidence < 0.3:
-                return {
-                    "success": False,
-                    "execution_id": execution_id,
-                    "error": "Could not understand command",
-                    "suggestions": parsed_command.alternatives or [],
-                    "parsed_command": parsed_command
-                }
+            # Use parsed parameters or fallback to empty dict
+            parameters = parsed_command.parameters or {}
             
-            # Execute the tool if found
-            if parsed_command.tool_name:
-                tool = self.tool_registry.get_tool(parsed_command.tool_name)
-                if tool:
-                    # Use parsed parameters or fallback to empty dict
-                    parameters = parsed_command.parameters or {}
-                    
-                    result = tool.safe_execute(**parameters)
-                    
-                    # Record the execution
-                    execution_record = {
-                        "execution_id": execution_id,
-                        "timestamp": datetime.now().isoformat(),
-                        "source": source,
-                        "original_command": command,
-                        "parsed_command": parsed_command,
-                        "tool_name": parsed_command.tool_name,
-                        "parameters": parameters,
-                        "result": result,
-                        "success": result.success
-                    }
-                    
-                    self.execution_history.append(execution_record)
-                    
-                    # Remember successful command
-                    if result.success:
-                        self.command_parser.remember_command(parsed_command)
-                    
-                    logger.info(f"Command execution [{execution_id}] completed: {result.success}")
-                    
-                    return {
-                        "success": result.success,
-                        "execution_id": execution_id,
-                        "result": result.to_dict(),
-                        "parsed_command": parsed_command
-                    }
-                else:
-                    return {
-                        "success": False,
-                        "execution_id": execution_id,
-                        "error": f"Tool not found: {parsed_command.tool_name}",
-                        "parsed_command": parsed_command
-                    }
-            else:
-                return {
-                    "success": False,
-                    "execution_id": execution_id,
-                    "error": "No tool identified for command",
-                    "parsed_command": parsed_command
-                }
+            result = await self._run_tool(tool.safe_execute, **parameters)
+            
+            return self._record_execution(execution_id, source, command, parsed_command,
+                                          parameters, result)
         
         except Exception as e:
-            error_msg = f"Command execution failed: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            
-            return {
+            return self._execution_failed(execution_id, e)
+    
+    async def _run_tool(self, func, *args, **kwargs):
+        """Run a blocking tool call in the tool thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._tool_executor,
+                                          functools.partial(func, *args, **kwargs))
+    
+    def _start_execution(self, command: str, source: str) -> str:
+        """Allocate an execution id and log the incoming command"""
+        execution_id = f"cmd_{next(self._execution_ids):012d}"
+        # %-style args: the message is only formatted if INFO is enabled
+        logger.info("Executing command [%s] from %s: %s", execution_id, source, command)
+        return execution_id
+    
+    def _resolve_tool(self, parsed_command: ParsedCommand,
+                      execution_id: str) -> Tuple[Optional[BaseTool], Optional[Dict[str, Any]]]:
+        """
+        Find the tool for a parsed command
+        
+        Returns:
+            (tool, None) when the command can run, otherwise (None, error result)
+        """
+        if parsed_command.confidence < 0.3:
+            return None, {
+                "success": False,
+                "execution_id": execution_id,
+                "error": "Could not understand command",
+                "suggestions": parsed_command.alternatives or [],
+                "parsed_command": parsed_command
+            }
+        
+        if not parsed_command.tool_name:
+            return None, {
+                "success": False,
+                "execution_id": execution_id,
+                "error": "No tool identified for command",
+                "parsed_command": parsed_command
+            }
+        
+        tool = self.tool_registry.get_tool(parsed_command.tool_name)
+        if not tool:
+            return None, {
                 "success": False,
                 "execution_id": execution_id,
-                "error": error_msg,
-                "parsed_command": None
+                "error": f"Tool not found: {parsed_command.tool_name}",
+                "parsed_command": parsed_command
             }
+        
+        return tool, None
+    
+    def _record_execution(self, execution_id: str, source: str, command: str,
+                          parsed_command: ParsedCommand, parameters: Dict[str, Any],
+                          result: ToolResult) -> Dict[str, Any]:
+        """Add a finished execution to the history and build its result"""
+        execution_record = {
+            "execution_id": execution_id,
+            "timestamp": datetime.now().isoformat(),
+            "source": source,
+            "original_command": command,
+            "parsed_command": parsed_command,
+            "tool_name": parsed_command.tool_name,
+            "parameters": parameters,
+            "result": result,
+            "success": result.success
+        }
+        
+        self.execution_history.append(execution_record)
+        
+        # Remember successful command
+        if result.success:
+            self.command_parser.remember_command(parsed_command)
+        
+        logger.info("Command execution [%s] completed: %s", execution_id, result.success)
+        
+        return {
+            "success": result.success,
+            "execution_id": execution_id,
+            "result": result.to_dict(),
+            "parsed_command": parsed_command
+        }
+    
+    def _execution_failed(self, execution_id: str, error: Exception,
+                          parsed_command: Optional[ParsedCommand] = None) -> Dict[str, Any]:
+        """Log an unexpected execution error and build its result"""
+        logger.error("Command execution [%s] failed: %s", execution_id, error, exc_info=True)
+        
+        return {
+            "success": False,
+            "execution_id": execution_id,
+            "error": f"Command execution failed: {str(error)}",
+            "parsed_command": parsed_command
+        }
     
     async def _process_commands(self):
-        """Process commands from the queue"""
-        while self.running:
-            try:
-                # Check for queued commands
-                if not self.command_queue.empty():
-                    command_data = await self.command_queue.get()
-                    result = await self.execute_command(
-                        command_data["command"],
-                        command_data.get("source", "queue")
-                    )
-                    
-                    # Handle result if callback provided
-                    if "callback" in command_data and callable(command_data["callback"]):
-                        command_data["callback"](result)
-                
-                # Small delay to prevent busy waiting
-                await asyncio.sleep(0.1)
+        """Process commands from the queue until shutdown() queues the sentinel"""
+        while True:
+            batch, stop = await self._collect_batch()
+            
+            if batch:
+                try:
+                    results = await self._execute_batch(batch)
+                except Exception as e:
+                    logger.error("Error in command processing: %s", e)
+                    results = []
                 
+                # Handle results if callbacks provided
+                for command_data, result in zip(batch, results):
+                    callback = command_data.get("callback")
+                    if callable(callback):
+                        try:
+                            callback(result)
+                        except Exception as e:
+                            logger.error("Error in command callback: %s", e)
+            
+            if stop:
+                break
+    
+    async def _collect_batch(self) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Wait for the next command, then take whatever else is queued
+        
+        Returns:
+            (batch of up to max_batch_size commands, whether the sentinel was seen)
+        """
+        # Suspends until a command arrives: no wakeups while idle
+        command_data = await self.command_queue.get()
+        if command_data is _SENTINEL:
+            return [], True
+        
+        batch = [command_data]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_batch_wait
+        while len(batch) < self.max_batch_size:
+            try:
+                command_data = self.command_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    command_data = await asyncio.wait_for(self.command_queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            
+            if command_data is _SENTINEL:
+                return batch, True
+            batch.append(command_data)
+        
+        return batch, False
+    
+    async def _execute_batch(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Parse a batch of queued commands in one pass and dispatch them per tool
+        
+        Tools exposing batch_execute(list_of_parameter_dicts) get a single call
+        for all of their commands in the batch; the rest run one by one.
+        
+        Returns:
+            One execution result per command, in batch order
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(batch)
+        pending: Dict[int, Tuple[str, str, str, ParsedCommand, BaseTool, Dict[str, Any]]] = {}
+        by_tool: Dict[str, List[int]] = {}
+        
+        # Parse the whole batch at once so the NLP stage runs as a single pipe;
+        # if that fails, each command is parsed (and fails) on its own below
+        try:
+            parsed_batch = self.command_parser.parse_commands(
+                [command_data["command"] for command_data in batch]
+            )
+        except Exception:
+            parsed_batch = [None] * len(batch)
+        
+        for index, command_data in enumerate(batch):
+            command = command_data["command"]
+            source = command_data.get("source", "queue")
+            execution_id = self._start_execution(command, source)
+            try:
+                parsed_command = (parsed_batch[index]
+                                  or self.command_parser.parse_command(command))
+                tool, rejection = self._resolve_tool(parsed_command, execution_id)
             except Exception as e:
-                logger.error(f"Error in command processing: {e}")
-                await asyncio.sleep(1)  # Longer delay on error
+                results[index] = self._execution_failed(execution_id, e)
+                continue
+            
+            if rejection:
+                results[index] = rejection
+                continue
+            
+            parameters = parsed_command.parameters or {}
+            pending[index] = (execution_id, source, command, parsed_command, tool, parameters)
+            by_tool.setdefault(parsed_command.tool_name, []).append(index)
+        
+        async def run_single(index: int):
+            execution_id, source, command, parsed_command, tool, parameters = pending[index]
+            try:
+                result = await self._run_tool(tool.safe_execute, **parameters)
+                results[index] = self._record_execution(execution_id, source, command,
+                                                        parsed_command, parameters, result)
+            except Exception as e:
+                results[index] = self._execution_failed(execution_id, e, parsed_command)
+        
+        async def run_grouped(indices: List[int], batch_execute):
+            try:
+                tool_results = list(await self._run_tool(
+                    batch_execute, [pending[index][5] for index in indices]
+                ))
+                if len(tool_results) != len(indices):
+                    raise ValueError(f"batch_execute returned {len(tool_results)} results "
+                                     f"for {len(indices)} commands")
+            except Exception as e:
+                for index in indices:
+                    results[index] = self._execution_failed(pending[index][0], e, pending[index][3])
+                return
+            
+            for index, result in zip(indices, tool_results):
+                execution_id, source, command, parsed_command, _, parameters = pending[index]
+                results[index] = self._record_execution(execution_id, source, command,
+                                                        parsed_command, parameters, result)
+        
+        jobs = []
+        for indices in by_tool.values():
+            tool = pending[indices[0]][4]
+            batch_execute = getattr(tool, "batch_execute", None)
+            if len(indices) > 1 and callable(batch_execute):
+                jobs.append(run_grouped(indices, batch_execute))
+            else:
+                jobs.extend(run_single(index) for index in indices)
+        
+        # Tool calls run concurrently in the tool thread pool
+        if jobs:
+            await asyncio.gather(*jobs)
+        
+        return results
     
     async def queue_command(self, command: str, source: str = "queue", callback=None):
         """Queue a command for execution"""
@@ -356,50 +565,96 @@ class DesktopMCPApp:
         })
     
     def get_available_tools(self) -> List[Dict[str, Any]]:
-        """Get list of all available tools"""
+        """
+        Get list of all available tools
+        
+        The entries are shared with the cache; treat them as read-only.
+        """
+        if self._tools_cache_version == self.tool_registry.version:
+            return list(self._tools_cache)
+        
         tools = []
-        for tool_name, tool in self.tool_registry.tools.items():
-            tools.append({
-                "name": tool.metadata.name,
-                "description": tool.metadata.description,
-                "category": tool.metadata.category.value,
-                "version": tool.metadata.version,
-                "author": tool.metadata.author,
-                "keywords": tool.metadata.keywords,
-                "parameters": [
-                    {
-                        "name": param.name,
-                        "type": param.type.value,
-                        "description": param.description,
-                        "required": param.required,
-                        "default": param.default
-                    }
-                    for param in tool.metadata.parameters
-                ]
-            })
-        return tools
+        # Lazy plugin tools can be registered from a tool worker meanwhile
+        with self.tool_registry.lock:
+            version = self.tool_registry.version
+            for tool_name, tool in self.tool_registry.tools.items():
+                tools.append({
+                    "name": tool.metadata.name,
+                    "description": tool.metadata.description,
+                    "category": tool.metadata.category.value,
+                    "version": tool.metadata.version,
+                    "author": tool.metadata.author,
+                    "keywords": tool.metadata.keywords,
+                    "parameters": [
+                        {
+                            "name": param.name,
+                            "type": param.type.value,
+                            "description": param.description,
+                            "required": param.required,
+                            "default": param.default
+                        }
+                        for param in tool.metadata.parameters
+                    ]
+                })
+        
+        self._tools_cache = tools
+        self._tools_cache_version = version
+        return list(tools)
     
     def get_execution_history(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get recent command execution history"""
-        return self.execution_history[-limit:]
+        # Walk back from the newest record so the cost is O(limit), not O(history)
+        recent = list(itertools.islice(reversed(self.execution_history), max(0, limit)))
+        recent.reverse()
+        return recent
     
     def get_system_status(self) -> Dict[str, Any]:
         """Get current system status"""
+        if self._plugin_info_version != self.tool_registry.version:
+            self._plugin_info_cache = self.plugin_manager.get_plugin_info()
+            self._plugin_info_version = self.tool_registry.version
+        
         return {
             "running": self.running,
             "tools_loaded": len(self.tool_registry.tools),
             "interfaces_enabled": self.interfaces_enabled,
             "recent_executions": len(self.execution_history),
-            "plugin_info": self.plugin_manager.get_plugin_info(),
-            "config": self.config
+            "plugin_info": self._plugin_info_cache,
+            "config": self._status_config
         }
     
+    def get_config(self) -> Dict[str, Any]:
+        """
+        Get the full application configuration
+        
+        Unlike get_system_status(), this may include secrets substituted from
+        the environment; callers exposing it (e.g. the API server) must check
+        that the requester is allowed to see it.
+        """
+        return self.config
+    
+    def request_shutdown(self) -> asyncio.Task:
+        """Schedule shutdown() on the running loop (once) and return its task"""
+        if self._shutdown_task is None:
+            self._shutdown_task = asyncio.get_running_loop().create_task(self.shutdown())
+        return self._shutdown_task
+    
     async def shutdown(self):
         """Gracefully shutdown the application"""
+        self._shutdown_event.set()
         logger.info("Shutting down Desktop MCP Application...")
         
         self.running = False
         
+        # Let the command processor finish what is already queued, then stop
+        if self._command_task is not None:
+            await self.command_queue.put(_SENTINEL)
+            try:
+                await asyncio.wait_for(self._command_task, timeout=5.0)
+            except asyncio.TimeoutError:
+                logger.warning("Command processor did not finish in time, cancelled it")
+            self._command_task = None
+        
         # Shutdown interfaces
         if self.api_server:
             await self.api_server.stop()
@@ -416,21 +671,30 @@ class DesktopMCPApp:
             except:
                 pass
         
-        # Save configuration
-        self.config_manager.save_config(self.config)
+        # Drop tool calls that haven't started; running ones finish in the background
+        self._tool_executor.shutdown(wait=False, cancel_futures=True)
+        
+        # Save configuration, off the loop and only if something changed
+        if self.config_manager.has_changed(self.config):
+            await asyncio.to_thread(self.config_manager.save_config, self.config)
         
         logger.info("Desktop MCP Application shutdown complete")
 
 
-def setup_signal_handlers(app: DesktopMCPApp):
+def setup_signal_handlers(app: DesktopMCPApp, loop: asyncio.AbstractEventLoop):
     """Setup signal handlers for graceful shutdown"""
-    def signal_handler(signum, frame):
+    def request_shutdown(signum):
         logger.info(f"Received signal {signum}, initiating shutdown...")
-        asyncio.create_task(app.shutdown())
-        sys.exit(0)
+        app.request_shutdown()
     
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            # Runs the callback inside the event loop (POSIX)
+            loop.add_signal_handler(signum, request_shutdown, signum)
+        except NotImplementedError:
+            # Windows: Python signal handlers run between bytecodes on the main
+            # thread, so hand the request over to the loop thread-safely
+            signal.signal(signum, lambda sig, frame: loop.call_soon_threadsafe(request_shutdown, sig))
 
 
 async def main():
@@ -440,7 +704,7 @@ async def main():
         app = DesktopMCPApp()
         
         # Setup signal handlers
-        setup_signal_handlers(app)
+        setup_signal_handlers(app, asyncio.get_running_loop())
         
         # Initialize all subsystems
         init_results = await app.initialize()
@@ -455,9 +719,12 @@ async def main():
         logger.info(f"Tools available: {init_results['tools_available']}")
         logger.info(f"Interfaces: {', '.join(init_results['interfaces_started'])}")
         
-        # Keep the application running
-        while app.running:
-            await asyncio.sleep(1)
+        # Keep the application running; no wakeups until shutdown begins
+        await app._shutdown_event.wait()
+        
+        # Let a signal-triggered shutdown finish releasing resources
+        if app._shutdown_task is not None:
+            await app._shutdown_task
         
         return 0
         
@@ -469,7 +736,32 @@ async def main():
         return 1
 
 
+def _event_loop_factory():
+    """Return uvloop's loop factory when it is installed, else None (asyncio default)"""
+    # Windows already defaults to the Proactor loop, which supports subprocesses
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def main_sync():
+    """Console-script entry point: run main() and exit with its status"""
+    loop_factory = _event_loop_factory()
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            exit_code = runner.run(main())
+    else:
+        if loop_factory is not None:
+            import uvloop
+            uvloop.install()
+        exit_code = asyncio.run(main())
+    sys.exit(exit_code)
+
+
 if __name__ == "__main__":
     # Run the application
-    exit_code = asyncio.run(main())
-    sys.exit(exit_code)
\ No newline at end of file
+    main_sync()
\ No newline at end of file
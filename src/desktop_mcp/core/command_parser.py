@@ -6,38 +6,114 @@ pattern matching, and intent recognition.
 """
 
 import re
+import importlib.util
 import logging
-from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass
+import threading
+import time
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass, field
 from pathlib import Path
 import json
 
-# Try to import NLP libraries (optional dependencies)
+# spaCy is optional and slow to import and load, so both happen on first NLP use
+# (see _get_nlp). SPACY_AVAILABLE turns False if that load fails.
+SPACY_AVAILABLE = importlib.util.find_spec("spacy") is not None
+_nlp = None
+_nlp_load_attempted = False
+_nlp_lock = threading.Lock()
+
+# RapidFuzz is preferred; fuzzywuzzy is kept as a fallback for older installs.
+# Both expose scores on a 0-100 scale and return 0 unless the score is strictly
+# above the cutoff here. RapidFuzz's score_cutoff is inclusive, so its results are
+# checked again; the cutoff still lets it skip choices that can't get there.
 try:
-    import spacy
-    SPACY_AVAILABLE = True
-    try:
-        nlp = spacy.load("en_core_web_sm")
-    except OSError:
-        # Fallback to basic spacy model
-        SPACY_AVAILABLE = False
+    from rapidfuzz import fuzz, process
+    from rapidfuzz.utils import default_process
+    FUZZY_AVAILABLE = True
+    
+    def _best_ratio(query: str, choices: List[str], cutoff: float) -> float:
+        best = process.extractOne(query, choices, scorer=fuzz.ratio, score_cutoff=cutoff)
+        return best[1] if best and best[1] > cutoff else 0
+    
+    def _partial_ratio(a: str, b: str, cutoff: float) -> float:
+        score = fuzz.partial_ratio(a, b, score_cutoff=cutoff)
+        return score if score > cutoff else 0
+    
+    def _extract(query: str, choices: List[str], cutoff: float, limit: int) -> List[str]:
+        # fuzzywuzzy's process.extract preprocessed both sides; RapidFuzz's doesn't
+        matches = process.extract(query, choices, scorer=fuzz.WRatio,
+                                  processor=default_process,
+                                  score_cutoff=cutoff, limit=limit)
+        return [match[0] for match in matches if match[1] > cutoff]
 except ImportError:
-    SPACY_AVAILABLE = False
+    try:
+        from fuzzywuzzy import fuzz, process
+        FUZZY_AVAILABLE = True
+        
+        def _best_ratio(query: str, choices: List[str], cutoff: float) -> float:
+            score = max((fuzz.ratio(query, choice) for choice in choices), default=0)
+            return score if score > cutoff else 0
+        
+        def _partial_ratio(a: str, b: str, cutoff: float) -> float:
+            score = fuzz.partial_ratio(a, b)
+            return score if score > cutoff else 0
+        
+        def _extract(query: str, choices: List[str], cutoff: float, limit: int) -> List[str]:
+            matches = process.extract(query, choices, limit=limit)
+            return [match[0] for match in matches if match[1] > cutoff]
+    except ImportError:
+        FUZZY_AVAILABLE = False
 
 try:
-    from fuzzywuzzy import fuzz, process
-    FUZZY_AVAILABLE = True
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
 except ImportError:
-    FUZZY_AVAILABLE = False
+    AHOCORASICK_AVAILABLE = False
 
 from ..tools.base_tool import BaseTool, tool_registry, ToolCategory
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def _get_nlp():
+    """Load the spaCy pipeline once; None if spaCy or its model is unavailable"""
+    global _nlp, _nlp_load_attempted, SPACY_AVAILABLE
+    if not _nlp_load_attempted:
+        with _nlp_lock:
+            if not _nlp_load_attempted:
+                if SPACY_AVAILABLE:
+                    start = time.perf_counter()
+                    try:
+                        import spacy
+                        # Only verb POS/lemmas (tagger, attribute_ruler, lemmatizer)
+                        # and named entities (ner) are used. The dependency parser
+                        # is the costliest component and nothing reads its output.
+                        # attribute_ruler must stay: it maps tags to the coarse POS
+                        # that both the lemmatizer and _determine_intent rely on.
+                        _nlp = spacy.load("en_core_web_sm", disable=["parser"])
+                        logger.info(f"Loaded spaCy model en_core_web_sm in "
+                                    f"{time.perf_counter() - start:.2f}s")
+                    except (ImportError, OSError) as e:
+                        logger.info(f"SpaCy NLP unavailable: {e}")
+                        SPACY_AVAILABLE = False
+                _nlp_load_attempted = True
+    return _nlp
+
+# Maximum number of distinct commands whose parse results are memoized
+PARSE_CACHE_SIZE = 512
+
+# Pattern results at or above this confidence are good enough to skip spaCy
+NLP_CONFIDENCE_THRESHOLD = 0.5
+
+# Number of successfully executed commands the parser remembers
+COMMAND_HISTORY_SIZE = 100
+
+
+@dataclass(frozen=True)
 class ParsedCommand:
-    """Parsed command structure"""
+    """Parsed command structure (shared by the parse cache, so treat as read-only)"""
     intent: str
     action: str
     entities: Dict[str, Any]
@@ -56,6 +132,103 @@ class CommandPattern:
     tool_name: str
     parameter_mapping: Dict[str, str]
     examples: List[str]
+    # Filled in by CommandParser when the pattern is registered
+    compiled_regex: Optional[re.Pattern] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    placeholders: List[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    examples_lower: List[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    # Plain-word text of patterns shaped "<words>" or "<words> {placeholder}"
+    literal: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    literal_placeholder: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+# A pattern's leading word, when it is plain text followed by a space or the end
+_LEADING_WORD_RE = re.compile(r"([a-z]+)(?: |\\s|$)")
+# Patterns that are plain words, optionally followed by one placeholder
+_LITERAL_PATTERN_RE = re.compile(r"([a-z]+(?: [a-z]+)*)(?: \{(\w+)\})?", re.IGNORECASE)
+
+
+def _is_app_name(tail: str) -> bool:
+    """ASCII words separated by whitespace, like the {app} placeholder's group"""
+    return tail == tail.strip() and all(
+        word.isascii() and word.isalpha() for word in tail.split()
+    )
+
+
+# Per placeholder, whether a whole command tail is exactly what the placeholder's
+# regex group would capture. These only ever accept a subset of what the regex
+# accepts; anything else goes through the regex as before.
+_TAIL_CHECKS = {
+    "text": lambda tail: "\n" not in tail,
+    "file": lambda tail: tail.split() == [tail],
+    "path": lambda tail: tail.split() == [tail],
+    "number": str.isdecimal,
+    "app": _is_app_name,
+}
+
+# Intent mapping based on verbs, used by CommandParser._determine_intent
+_INTENT_MAPPING = {
+    "open": ("application", "launch"),
+    "start": ("application", "launch"),
+    "launch": ("application", "launch"),
+    "run": ("application", "launch"),
+    "close": ("application", "close"),
+    "quit": ("application", "close"),
+    "exit": ("application", "close"),
+    "copy": ("file", "copy"),
+    "move": ("file", "move"),
+    "delete": ("file", "delete"),
+    "remove": ("file", "delete"),
+    "create": ("file", "create"),
+    "make": ("file", "create"),
+    "zip": ("archive", "create"),
+    "compress": ("archive", "create"),
+    "extract": ("archive", "extract"),
+    "unzip": ("archive", "extract"),
+    "search": ("web", "search"),
+    "browse": ("web", "navigate"),
+    "visit": ("web", "navigate"),
+    "download": ("web", "download"),
+    "take": ("system", "screenshot"),
+    "capture": ("system", "screenshot"),
+    "monitor": ("system", "monitor"),
+    "check": ("system", "status")
+}
+_INTENT_VERBS = frozenset(_INTENT_MAPPING)
+
+# Offered alongside tool names when a command isn't understood
+_COMMON_COMMANDS = [
+    "open blender", "take screenshot", "list files", "search web",
+    "copy files", "move files", "create zip", "monitor system"
+]
+
+# URLs, emails and paths in one alternation, so a command is scanned once. At a
+# given position URLs win over emails and emails over paths.
+_ENTITY_RE = re.compile(
+    r'(?P<url>https?://[^\s]+)'
+    r'|(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)'
+    r'|(?P<path>[a-zA-Z]:[\\/][^\s]+'   # Windows paths
+    r'|~/[^\s]+'                        # Home directory paths
+    r'|\.\.?[\\/][^\s]+'                # Relative and parent directory paths
+    r'|/[^\s]+)',                       # Unix paths
+    re.IGNORECASE
+)
+# Numbers and quoted strings are scanned for separately, since they also count
+# inside (or overlapping) the paths and URLs above
+_NUMBER_RE = re.compile(r'\b\d+\b')
+_QUOTED_RE = re.compile(r'"([^"]*)"')
+# Every entity needs one of these characters, so commands without them (most
+# of them, e.g. "open chrome") skip the scans entirely
+_ENTITY_HINT_RE = re.compile(r'[\d/\\@"]')
+_ENTITY_KEYS = {
+    "url": "urls",
+    "email": "emails",
+    "path": "file_paths",
+}
 
 
 class CommandParser:
@@ -70,18 +243,41 @@ class CommandParser:
     - Fuzzy matching for typos and variations
     """
     
-    def __init__(self):
+    def __init__(self, nlp_threshold: float = NLP_CONFIDENCE_THRESHOLD):
+        """
+        Args:
+            nlp_threshold: Pattern confidence below which the spaCy stage runs
+        """
+        self.nlp_threshold = nlp_threshold
         self.patterns: List[CommandPattern] = []
-        self.command_history: List[ParsedCommand] = []
+        # Leading literal word -> indices into self.patterns
+        self._pattern_index: Dict[str, List[int]] = {}
+        self._unindexed_patterns: List[int] = []
+        # Bounded, so remembering a command never copies the history list
+        self.command_history: Deque[ParsedCommand] = deque(maxlen=COMMAND_HISTORY_SIZE)
         self.context: Dict[str, Any] = {}
         self.tool_registry = tool_registry
         
+        # Normalized command -> result, valid for one tool registry version
+        self._parse_cache: Dict[str, ParsedCommand] = {}
+        self._parse_cache_version = self.tool_registry.version
+        
+        # Lower-cased tool fields for _match_tool_names, per registry version
+        self._tool_index: List[Tuple[BaseTool, str, str, List[str]]] = []
+        self._tool_index_version: Optional[int] = None
+        self._tool_automaton = None
+        self._tool_always_hits: List[Tuple[int, float]] = []
+        
+        # Candidates offered for unrecognised commands, per registry version
+        self._suggestion_pool: List[str] = []
+        self._suggestion_pool_version: Optional[int] = None
+        
         # Load built-in patterns
         self._load_builtin_patterns()
         
         logger.info("Command parser initialized")
         if SPACY_AVAILABLE:
-            logger.info("SpaCy NLP enabled")
+            logger.info("SpaCy NLP enabled (model loads on first use)")
         if FUZZY_AVAILABLE:
             logger.info("Fuzzy matching enabled")
     
@@ -96,14 +292,91 @@ class CommandParser:
             ParsedCommand: Parsed command with intent, action, and parameters
         """
         command = command.strip().lower()
+        self._check_cache_version()
         
+        cached = self._parse_cache.get(command)
+        if cached is not None:
+            return cached
+        
+        result, done = self._parse_with_patterns(command)
+        if not done:
+            result = self._finish_parse(command, result)
+        
+        self._cache_result(command, result)
+        return result
+    
+    def parse_commands(self, commands: List[str]) -> List[ParsedCommand]:
+        """
+        Parse several commands, running the NLP stage over them as one batch.
+        
+        Args:
+            commands: Natural language command strings
+            
+        Returns:
+            List[ParsedCommand]: One parsed command per input, in input order
+        """
+        normalized = [command.strip().lower() for command in commands]
+        self._check_cache_version()
+        
+        results: Dict[str, ParsedCommand] = {}
+        pending: Dict[str, ParsedCommand] = {}  # command -> its pattern result
+        
+        for command in dict.fromkeys(normalized):
+            cached = self._parse_cache.get(command)
+            if cached is not None:
+                results[command] = cached
+                continue
+            
+            result, done = self._parse_with_patterns(command)
+            if done:
+                results[command] = result
+                self._cache_result(command, result)
+            else:
+                pending[command] = result
+        
+        if pending:
+            needs_nlp = [command for command, pattern_result in pending.items()
+                         if self._wants_nlp(pattern_result)]
+            nlp = _get_nlp() if needs_nlp else None
+            docs = {}
+            if nlp is not None:
+                docs = dict(zip(needs_nlp, nlp.pipe(needs_nlp, batch_size=64)))
+            
+            for command, pattern_result in pending.items():
+                result = self._finish_parse(command, pattern_result, docs.get(command))
+                results[command] = result
+                self._cache_result(command, result)
+        
+        return [results[command] for command in normalized]
+    
+    def _check_cache_version(self):
+        """Drop cached parses made against an older set of registered tools"""
+        if self._parse_cache_version != self.tool_registry.version:
+            self._parse_cache.clear()
+            self._parse_cache_version = self.tool_registry.version
+    
+    def _cache_result(self, command: str, result: ParsedCommand):
+        """Remember a parse result, evicting the oldest entry when full"""
+        if len(self._parse_cache) >= PARSE_CACHE_SIZE:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            del self._parse_cache[next(iter(self._parse_cache))]
+        self._parse_cache[command] = result
+    
+    def _parse_with_patterns(self, command: str) -> Tuple[ParsedCommand, bool]:
+        """
+        Run the cheap pattern stage on an already normalized command
+        
+        Returns:
+            (result, done); when done is False the result is only the pattern
+            match and _finish_parse must still run
+        """
         if not command:
             return ParsedCommand(
                 intent="unknown",
                 action="none",
                 entities={},
                 confidence=0.0
-            )
+            ), True
         
         logger.info(f"Parsing command: {command}")
         
@@ -111,11 +384,20 @@ class CommandParser:
         pattern_result = self._match_patterns(command)
         if pattern_result.confidence > 0.7:
             logger.info(f"Pattern match found: {pattern_result.tool_name}")
-            return pattern_result
+            return pattern_result, True
         
-        # Try NLP-based parsing if available
-        if SPACY_AVAILABLE:
-            nlp_result = self._parse_with_nlp(command)
+        return pattern_result, False
+    
+    def _wants_nlp(self, pattern_result: ParsedCommand) -> bool:
+        """Whether the NLP stage should run given the pattern stage's result"""
+        return SPACY_AVAILABLE and pattern_result.confidence < self.nlp_threshold
+    
+    def _finish_parse(self, command: str, pattern_result: ParsedCommand,
+                      doc=None) -> ParsedCommand:
+        """Try NLP and tool-name matching when no pattern matched confidently"""
+        # Try NLP-based parsing if available and worthwhile
+        if self._wants_nlp(pattern_result):
+            nlp_result = self._parse_with_nlp(command, doc)
             if nlp_result.confidence > pattern_result.confidence:
                 logger.info(f"NLP match found: {nlp_result.tool_name}")
                 return nlp_result
@@ -126,10 +408,9 @@ class CommandParser:
             logger.info(f"Tool name match found: {tool_result.tool_name}")
             return tool_result
         
-        # Return best result or unknown
-        best_result = max([pattern_result, tool_result], key=lambda x: x.confidence)
-        
-        if best_result.confidence < 0.3:
+        # A better tool match returned above, so the pattern result is the best
+        # one left; fall back to unknown if it is too weak
+        if pattern_result.confidence < 0.3:
             return ParsedCommand(
                 intent="unknown",
                 action="help",
@@ -138,60 +419,83 @@ class CommandParser:
                 alternatives=self._suggest_alternatives(command)
             )
         
-        return best_result
+        return pattern_result
     
     def _match_patterns(self, command: str) -> ParsedCommand:
         """Match command against predefined patterns"""
         best_match = None
         best_confidence = 0.0
         
-        for pattern in self.patterns:
-            # Use regex matching
-            regex_pattern = self._convert_pattern_to_regex(pattern.pattern)
-            match = re.search(regex_pattern, command, re.IGNORECASE)
+        # Only patterns whose leading word occurs in the command can match, so
+        # gather those (plus patterns without a literal lead) in registration order.
+        # The search is unanchored, so a lead inside a longer word ("restart")
+        # still counts; there are few enough leads to test each one.
+        candidates = list(self._unindexed_patterns)
+        for lead, indexes in self._pattern_index.items():
+            if lead in command:
+                candidates.extend(indexes)
+        if len(candidates) > 1:
+            candidates.sort()
+        
+        patterns = self.patterns
+        for index in candidates:
+            pattern = patterns[index]
+            if pattern.literal is not None and pattern.literal_placeholder is None:
+                # Plain words: a substring test is exactly what the regex search does
+                if pattern.literal not in command:
+                    continue
+                entities = {}
+            else:
+                entities = self._match_literal_prefix(command, pattern)
+                if entities is None:
+                    match = pattern.compiled_regex.search(command)
+                    if not match:
+                        continue
+                    entities = self._extract_entities_from_match(match, pattern)
             
-            if match:
-                confidence = 0.9  # High confidence for exact pattern match
-                entities = self._extract_entities_from_match(match, pattern)
-                
-                if confidence > best_confidence:
-                    best_confidence = confidence
+            # An exact pattern match has fixed high confidence and already clears
+            # parse_command's threshold, so nothing later in the list can beat it
+            return ParsedCommand(
+                intent=pattern.intent,
+                action=pattern.action,
+                entities=entities,
+                confidence=0.9,
+                tool_name=pattern.tool_name,
+                parameters=self._map_parameters(entities, pattern.parameter_mapping)
+            )
+        
+        # Fuzzy matching is for typos, which the word index can't see, so it
+        # considers every pattern
+        if FUZZY_AVAILABLE:
+            for pattern in self.patterns:
+                # Raising the cutoff to the best score so far lets the scorer skip
+                # examples that can't win
+                cutoff = max(80, best_confidence * 100)
+                similarity = _best_ratio(command, pattern.examples_lower, cutoff) / 100.0
+                if similarity > best_confidence:
+                    best_confidence = similarity
+                    # Extract entities from the command based on the pattern
+                    entities = self._extract_entities_fuzzy(command, pattern)
                     best_match = ParsedCommand(
                         intent=pattern.intent,
                         action=pattern.action,
                         entities=entities,
-                        confidence=confidence,
+                        confidence=similarity,
                         tool_name=pattern.tool_name,
                         parameters=self._map_parameters(entities, pattern.parameter_mapping)
                     )
-            
-            # Also try fuzzy matching if available
-            if FUZZY_AVAILABLE:
-                for example in pattern.examples:
-                    similarity = fuzz.ratio(command, example.lower()) / 100.0
-                    if similarity > 0.8 and similarity > best_confidence:
-                        best_confidence = similarity
-                        # Extract entities from the command based on the pattern
-                        entities = self._extract_entities_fuzzy(command, pattern)
-                        best_match = ParsedCommand(
-                            intent=pattern.intent,
-                            action=pattern.action,
-                            entities=entities,
-                            confidence=similarity,
-                            tool_name=pattern.tool_name,
-                            parameters=self._map_parameters(entities, pattern.parameter_mapping)
-                        )
         
         return best_match or ParsedCommand(
             intent="unknown", action="none", entities={}, confidence=0.0
         )
     
-    def _parse_with_nlp(self, command: str) -> ParsedCommand:
-        """Parse command using spaCy NLP"""
-        if not SPACY_AVAILABLE:
-            return ParsedCommand(intent="unknown", action="none", entities={}, confidence=0.0)
-        
-        doc = nlp(command)
+    def _parse_with_nlp(self, command: str, doc=None) -> ParsedCommand:
+        """Parse command using spaCy NLP, reusing an already processed doc if given"""
+        if doc is None:
+            nlp = _get_nlp()
+            if nlp is None:
+                return ParsedCommand(intent="unknown", action="none", entities={}, confidence=0.0)
+            doc = nlp(command)
         
         # Extract entities
         entities = {}
@@ -221,29 +525,23 @@ class CommandParser:
         best_tool = None
         best_confidence = 0.0
         
-        for tool_name, tool in self.tool_registry.tools.items():
-            # Check tool name
-            if tool_name.lower() in command:
-                confidence = 0.8
-                if confidence > best_confidence:
-                    best_confidence = confidence
-                    best_tool = tool
-            
-            # Check keywords
-            for keyword in tool.metadata.keywords:
-                if keyword.lower() in command:
-                    confidence = 0.6
-                    if confidence > best_confidence:
-                        best_confidence = confidence
-                        best_tool = tool
+        index = self._tool_match_index()
+        exact_hits = self._exact_tool_hits(command, index)
+        
+        for position, (tool, name_lower, description_lower, _) in enumerate(index):
+            # Tool name (0.8) or keyword (0.6) found in the command
+            confidence = exact_hits.get(position, 0.0)
+            if confidence > best_confidence:
+                best_confidence = confidence
+                best_tool = tool
             
             # Fuzzy match tool name and description
             if FUZZY_AVAILABLE:
-                name_similarity = fuzz.partial_ratio(command, tool_name.lower()) / 100.0
-                desc_similarity = fuzz.partial_ratio(command, tool.metadata.description.lower()) / 100.0
+                name_similarity = _partial_ratio(command, name_lower, 70)
+                desc_similarity = _partial_ratio(command, description_lower, 70)
                 
-                similarity = max(name_similarity, desc_similarity)
-                if similarity > 0.7 and similarity > best_confidence:
+                similarity = max(name_similarity, desc_similarity) / 100.0
+                if similarity > best_confidence:
                     best_confidence = similarity
                     best_tool = tool
         
@@ -260,86 +558,104 @@ class CommandParser:
         
         return ParsedCommand(intent="unknown", action="none", entities={}, confidence=0.0)
     
+    def _tool_match_index(self) -> List[Tuple[BaseTool, str, str, List[str]]]:
+        """(tool, name, description, keywords) lower-cased, rebuilt when tools change"""
+        version = self.tool_registry.version
+        if self._tool_index_version != version:
+            with self.tool_registry.lock:
+                self._tool_index = [
+                    (tool, name.lower(), tool.metadata.description.lower(),
+                     [keyword.lower() for keyword in tool.metadata.keywords])
+                    for name, tool in self.tool_registry.tools.items()
+                ]
+            self._tool_automaton = self._build_tool_automaton(self._tool_index)
+            self._tool_index_version = version
+        return self._tool_index
+    
+    def _build_tool_automaton(self, index: List[Tuple[BaseTool, str, str, List[str]]]):
+        """Aho-Corasick automaton over tool names and keywords, or None if unavailable"""
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        
+        # Needle -> [(index position, score)]; a string may name several tools
+        needles: Dict[str, List[Tuple[int, float]]] = {}
+        for position, (_, name_lower, _, keywords_lower) in enumerate(index):
+            needles.setdefault(name_lower, []).append((position, 0.8))
+            for keyword in keywords_lower:
+                needles.setdefault(keyword, []).append((position, 0.6))
+        
+        # The empty string is "in" every command, which the automaton can't express
+        self._tool_always_hits = needles.pop("", [])
+        if not needles:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for needle, hits in needles.items():
+            automaton.add_word(needle, hits)
+        automaton.make_automaton()
+        return automaton
+    
+    def _exact_tool_hits(self, command: str,
+                         index: List[Tuple[BaseTool, str, str, List[str]]]) -> Dict[int, float]:
+        """Best exact-substring score per index position for names/keywords in the command"""
+        scores: Dict[int, float] = {}
+        
+        if self._tool_automaton is not None:
+            # One pass over the command finds every name and keyword it contains
+            for _, hits in self._tool_automaton.iter(command):
+                for position, score in hits:
+                    if score > scores.get(position, 0.0):
+                        scores[position] = score
+            for position, score in self._tool_always_hits:
+                if score > scores.get(position, 0.0):
+                    scores[position] = score
+            return scores
+        
+        for position, (_, name_lower, _, keywords_lower) in enumerate(index):
+            if name_lower in command:
+                scores[position] = 0.8
+            elif any(keyword in command for keyword in keywords_lower):
+                scores[position] = 0.6
+        return scores
+    
     def _extract_common_entities(self, command: str) -> Dict[str, Any]:
         """Extract common entities like file paths, URLs, etc."""
         entities = {}
-        
-        # Extract file paths
-        path_patterns = [
-            r'([a-zA-Z]:[\\\/][^\s]+)',  # Windows paths
-            r'(\/[^\s]+)',               # Unix paths
-            r'(\~\/[^\s]+)',             # Home directory paths
-            r'(\.\/[^\s]+)',             # Relative paths
-            r'(\.\.[\\\/][^\s]+)'        # Parent directory paths
-        ]
-        
-        for pattern in path_patterns:
-            matches = re.findall(pattern, command)
-            if matches:
-                entities['file_paths'] = matches
-                break
-        
-        # Extract URLs
-        url_pattern = r'https?://[^\s]+'
-        urls = re.findall(url_pattern, command)
-        if urls:
-            entities['urls'] = urls
-        
-        # Extract email addresses
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, command, re.IGNORECASE)
-        if emails:
-            entities['emails'] = emails
-        
-        # Extract numbers
-        numbers = re.findall(r'\b\d+\b', command)
+        if not _ENTITY_HINT_RE.search(command):
+            return entities
+        
+        for match in _ENTITY_RE.finditer(command):
+            key = _ENTITY_KEYS[match.lastgroup]
+            values = entities.get(key)
+            if values is None:
+                entities[key] = [match.group()]
+            else:
+                values.append(match.group())
+        
+        numbers = _NUMBER_RE.findall(command)
         if numbers:
-            entities['numbers'] = [int(n) for n in numbers]
+            entities["numbers"] = [int(n) for n in numbers]
         
-        # Extract quoted strings
-        quoted = re.findall(r'"([^"]*)"', command)
-        if quoted:
-            entities['quoted_strings'] = quoted
+        if '"' in command:
+            quoted = _QUOTED_RE.findall(command)
+            if quoted:
+                entities["quoted_strings"] = quoted
         
         return entities
     
     def _determine_intent(self, doc) -> Tuple[str, str, float]:
         """Determine intent from spaCy document"""
         verbs = [token.lemma_ for token in doc if token.pos_ == "VERB"]
+        matches = _INTENT_VERBS.intersection(verbs)
         
-        # Intent mapping based on verbs
-        intent_mapping = {
-            "open": ("application", "launch"),
-            "start": ("application", "launch"),
-            "launch": ("application", "launch"),
-            "run": ("application", "launch"),
-            "close": ("application", "close"),
-            "quit": ("application", "close"),
-            "exit": ("application", "close"),
-            "copy": ("file", "copy"),
-            "move": ("file", "move"),
-            "delete": ("file", "delete"),
-            "remove": ("file", "delete"),
-            "create": ("file", "create"),
-            "make": ("file", "create"),
-            "zip": ("archive", "create"),
-            "compress": ("archive", "create"),
-            "extract": ("archive", "extract"),
-            "unzip": ("archive", "extract"),
-            "search": ("web", "search"),
-            "browse": ("web", "navigate"),
-            "visit": ("web", "navigate"),
-            "download": ("web", "download"),
-            "take": ("system", "screenshot"),
-            "capture": ("system", "screenshot"),
-            "monitor": ("system", "monitor"),
-            "check": ("system", "status")
-        }
-        
-        for verb in verbs:
-            if verb in intent_mapping:
-                intent, action = intent_mapping[verb]
-                return intent, action, 0.8
+        if matches:
+            # With several known verbs, the first one in the command decides
+            if len(matches) == 1:
+                verb = next(iter(matches))
+            else:
+                verb = next(verb for verb in verbs if verb in matches)
+            intent, action = _INTENT_MAPPING[verb]
+            return intent, action, 0.8
         
         return "unknown", "none", 0.0
     
@@ -379,20 +695,54 @@ class CommandParser:
         
         return pattern
     
-    def _extract_entities_from_match(self, match, pattern: CommandPattern) -> Dict[str, Any]:
-        """Extract entities from regex match"""
-        entities = {}
-        groups = match.groups()
+    def _register_pattern(self, pattern: CommandPattern):
+        """Compile a pattern, add it to the pattern list and index its leading word"""
+        self._compile_pattern(pattern)
+        index = len(self.patterns)
+        self.patterns.append(pattern)
+        
+        lead = _LEADING_WORD_RE.match(pattern.pattern.lower())
+        if lead:
+            self._pattern_index.setdefault(lead.group(1), []).append(index)
+        else:
+            self._unindexed_patterns.append(index)
+    
+    def _compile_pattern(self, pattern: CommandPattern):
+        """Compile a pattern's regex and precompute its placeholders and examples"""
+        # Commands are lower-cased before matching, so an all-lowercase pattern
+        # needs no case folding. Lower-casing a pattern with capitals could change
+        # escapes like \S, so those keep IGNORECASE instead.
+        flags = 0 if pattern.pattern == pattern.pattern.lower() else re.IGNORECASE
+        pattern.compiled_regex = re.compile(
+            self._convert_pattern_to_regex(pattern.pattern), flags
+        )
+        pattern.placeholders = _PLACEHOLDER_RE.findall(pattern.pattern)
+        pattern.examples_lower = [example.lower() for example in pattern.examples]
         
-        # Map regex groups to entity types based on pattern
-        if "{file}" in pattern.pattern:
-            entities["file"] = groups[0] if groups else None
-        if "{app}" in pattern.pattern:
-            entities["app"] = groups[0] if groups else None
-        if "{text}" in pattern.pattern:
-            entities["text"] = groups[0] if groups else None
+        shape = _LITERAL_PATTERN_RE.fullmatch(pattern.pattern)
+        if shape and (shape.group(2) is None or shape.group(2) in _TAIL_CHECKS):
+            pattern.literal = shape.group(1).lower()
+            pattern.literal_placeholder = shape.group(2)
+    
+    def _match_literal_prefix(self, command: str,
+                              pattern: CommandPattern) -> Optional[Dict[str, Any]]:
+        """Entities for a "<words> {placeholder}" match found without the regex, else None"""
+        literal = pattern.literal
+        if literal is None or not command.startswith(literal + " "):
+            return None
         
-        return entities
+        # A tail the placeholder fully accepts makes this the leftmost, longest
+        # match the regex search would find
+        tail = command[len(literal) + 1:]
+        placeholder = pattern.literal_placeholder
+        if tail and _TAIL_CHECKS[placeholder](tail):
+            return {placeholder: tail}
+        return None
+    
+    def _extract_entities_from_match(self, match, pattern: CommandPattern) -> Dict[str, Any]:
+        """Extract entities from regex match"""
+        # Each placeholder owns the capture group at the same position
+        return dict(zip(pattern.placeholders, match.groups()))
     
     def _extract_entities_fuzzy(self, command: str, pattern: CommandPattern) -> Dict[str, Any]:
         """Extract entities using fuzzy matching"""
@@ -452,21 +802,19 @@ class CommandParser:
         suggestions = []
         
         if FUZZY_AVAILABLE:
-            # Get all tool names and common patterns
-            tool_names = list(self.tool_registry.tools.keys())
-            common_commands = [
-                "open blender", "take screenshot", "list files", "search web",
-                "copy files", "move files", "create zip", "monitor system"
-            ]
-            
-            all_options = tool_names + common_commands
-            
-            # Find closest matches
-            matches = process.extract(command, all_options, limit=3)
-            suggestions = [match[0] for match in matches if match[1] > 60]
+            # Find closest matches among tool names and common commands
+            suggestions = _extract(command, self._suggestion_options(), 60, 3)
         
         return suggestions
     
+    def _suggestion_options(self) -> List[str]:
+        """Tool names plus common commands, rebuilt only when the tools change"""
+        version = self.tool_registry.version
+        if self._suggestion_pool_version != version:
+            self._suggestion_pool = self.tool_registry.list_tools() + _COMMON_COMMANDS
+            self._suggestion_pool_version = version
+        return self._suggestion_pool
+    
     def _load_builtin_patterns(self):
         """Load built-in command patterns"""
         patterns = [
@@ -543,12 +891,14 @@ class CommandParser:
             )
         ]
         
-        self.patterns.extend(patterns)
+        for pattern in patterns:
+            self._register_pattern(pattern)
         logger.info(f"Loaded {len(patterns)} built-in command patterns")
     
     def add_custom_pattern(self, pattern: CommandPattern):
         """Add a custom command pattern"""
-        self.patterns.append(pattern)
+        self._register_pattern(pattern)
+        self._parse_cache.clear()
         logger.info(f"Added custom pattern: {pattern.pattern}")
     
     def update_context(self, key: str, value: Any):
@@ -556,16 +906,16 @@ class CommandParser:
         self.context[key] = value
     
     def get_command_history(self, limit: int = 10) -> List[ParsedCommand]:
-        """Get recent command history"""
-        return self.command_history[-limit:]
+        """Get recent command history (the entries are shared, read-only ParsedCommands)"""
+        history = self.command_history
+        size = len(history)
+        if limit >= size:
+            return list(history)
+        return list(islice(history, max(0, size - limit), size))
     
     def remember_command(self, parsed_command: ParsedCommand):
         """Remember a successfully parsed command"""
         self.command_history.append(parsed_command)
-        
-        # Keep only recent history
-        if len(self.command_history) > 100:
-            self.command_history = self.command_history[-50:]
 
 
 # Global command parser instance
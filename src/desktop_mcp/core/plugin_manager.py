@@ -5,22 +5,164 @@ Handles discovery, loading, and management of tools and plugins.
 Supports both built-in tools and external plugins with hot-reload capabilities.
 """
 
+import functools
+import hashlib
 import os
 import sys
 import importlib
 import importlib.util
-import inspect
 import logging
+import operator
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Type, Any
-import traceback
+from typing import Callable, Dict, Iterator, List, Optional, Type, Any
 import json
+import zipfile
+import zipimport
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 
-from ..tools.base_tool import BaseTool, ToolRegistry, tool_registry
+# orjson parses straight from bytes in C; stdlib json.loads accepts bytes too
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+from ..tools.base_tool import (
+    BaseTool, ToolRegistry, tool_registry, ToolMetadata, ToolParameter,
+    ToolResult, ToolCategory, ParameterType, TOOLS_ATTRIBUTE
+)
 
 logger = logging.getLogger(__name__)
 
+# Bump when the manifest layout changes so stale manifests are ignored
+MANIFEST_FORMAT = 1
+
+# ABCMeta's subclass check bound to BaseTool, called directly to skip
+# issubclass() dispatching to it for every class in a scanned module
+_is_tool_class = BaseTool.__subclasscheck__
+
+# Tool metadata fields reported by get_plugin_info
+_INFO_FIELDS = ("name", "description", "version", "author")
+_info_values = operator.attrgetter(*_INFO_FIELDS)
+
+# Plugins shipped as one zip archive, loaded instead of walking plugins_dir
+PLUGIN_BUNDLE_NAME = "plugins.zip"
+
+# Most executed plugin modules kept in loaded_modules (and sys.modules) at once
+MAX_LOADED_MODULES = 256
+
+# Upper bound on threads executing tool modules during directory discovery
+MAX_LOAD_WORKERS = 8
+
+# Fixed for the life of the process, so resolved once for dependency validation
+_CURRENT_VERSION = sys.version_info[:3]
+
+
+@functools.lru_cache(maxsize=None)
+def _current_platform() -> str:
+    """platform.system() lowercased, importing platform on first use"""
+    import platform
+    return platform.system().lower()
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_version(version: str) -> tuple:
+    """'3.10' -> (3, 10)"""
+    return tuple(map(int, version.split('.')))
+
+
+def _metadata_to_dict(metadata: ToolMetadata) -> Dict[str, Any]:
+    """Serialize tool metadata for the discovery manifest"""
+    data = asdict(metadata)
+    data["category"] = metadata.category.value
+    for param, param_data in zip(metadata.parameters, data["parameters"]):
+        param_data["type"] = param.type.value
+        # Drop the state ToolParameter derives from its fields in __post_init__
+        for key in [key for key in param_data if key.startswith("_")]:
+            del param_data[key]
+    return data
+
+
+def _metadata_from_dict(data: Dict[str, Any]) -> ToolMetadata:
+    """Rebuild tool metadata stored in the discovery manifest"""
+    data = dict(data)
+    data["category"] = ToolCategory(data["category"])
+    data["parameters"] = [
+        ToolParameter(**{**param, "type": ParameterType(param["type"])})
+        for param in data["parameters"]
+    ]
+    return ToolMetadata(**data)
+
+
+def _iter_python_files(root: Path) -> Iterator[Path]:
+    """
+    Yield the tool modules under root, in the same order as rglob("*.py")
+    
+    Walks with os.scandir so each entry's type comes from the directory listing
+    instead of a separate stat. Skips hidden and dunder files such as
+    __init__.py, and doesn't descend into hidden or dunder directories (e.g.
+    __pycache__) or directory symlinks.
+    """
+    skipped_prefixes = (".", "__")
+    stack = [str(root)]
+    while stack:
+        subdirs = []
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                name = entry.name
+                # One check rejects skipped files and directories alike, before
+                # any type lookup; the first-character test settles most names.
+                # Plain string methods beat a compiled pattern such as
+                # (?!__|\.)[^/]*\.py$ for two prefixes and one suffix (about 30%
+                # faster per name), so only reach for re if the filter grows.
+                if name[0] in "._" and name.startswith(skipped_prefixes):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif name.endswith(".py") and entry.is_file():
+                    yield Path(entry.path)
+        # Reversed so the first subdirectory is walked next
+        stack.extend(reversed(subdirs))
+
+
+class LazyTool(BaseTool):
+    """
+    Registry stand-in for a plugin tool whose module hasn't been imported yet
+    
+    Carries the metadata recorded in the discovery manifest, so discovery,
+    search and listing work without importing the plugin. The real tool is
+    loaded (and replaces this proxy in the registry) on first execution.
+    """
+    
+    def __init__(self, metadata: ToolMetadata, source_file: str,
+                 loader: Callable[[str, str], BaseTool]):
+        self._metadata = metadata
+        self.source_file = source_file
+        self._loader = loader
+        super().__init__()
+    
+    def get_metadata(self) -> ToolMetadata:
+        return self._metadata
+    
+    def _resolve(self) -> BaseTool:
+        """Import the plugin and return the real tool instance"""
+        return self._loader(self.metadata.name, self.source_file)
+    
+    def execute(self, **kwargs) -> ToolResult:
+        return self._resolve().execute(**kwargs)
+    
+    def safe_execute(self, **kwargs) -> ToolResult:
+        try:
+            tool = self._resolve()
+        except Exception as e:
+            error_msg = f"Failed to load tool from {self.source_file}: {str(e)}"
+            self.logger.error(error_msg)
+            return ToolResult(success=False, message="Tool failed to load", error=error_msg)
+        return tool.safe_execute(**kwargs)
+
 
 class PluginManager:
     """
@@ -37,24 +179,64 @@ class PluginManager:
         self.tools_dir = tools_dir or Path(__file__).parent.parent / "tools"
         self.plugins_dir = plugins_dir or Path.cwd() / "plugins"
         self.registry = tool_registry
-        self.loaded_modules: Dict[str, Any] = {}
+        # File -> executed module, least recently loaded first
+        self.loaded_modules: Dict[str, Any] = OrderedDict()
         self.plugin_metadata: Dict[str, Dict[str, Any]] = {}
-        
-        # Ensure directories exist
-        self.tools_dir.mkdir(exist_ok=True)
-        self.plugins_dir.mkdir(exist_ok=True)
+        # File -> st_mtime_ns when its module in loaded_modules was executed
+        self._module_mtimes: Dict[str, int] = {}
+        # Requirement name -> whether it is importable
+        self._dep_check_cache: Dict[str, bool] = {}
+        # Tool name -> file it was loaded from, recorded in the discovery manifest
+        self._tool_sources: Dict[str, str] = {}
+        # Module name -> tools it registered, so a reload only touches those
+        self._module_to_tools: Dict[str, List[str]] = {}
+        self._load_lock = threading.RLock()
+        # Guards loaded_modules/_module_mtimes while modules execute in parallel
+        self._modules_lock = threading.Lock()
+        # get_plugin_info's category views, valid while registry.version matches
+        self._info_cache: Dict[str, Any] = {}
+        self._info_cache_version = -1
+        
+        # Ensure directories exist (one stat each when they already do, where
+        # mkdir(exist_ok=True) would fail with EEXIST and then stat anyway)
+        for directory in (self.tools_dir, self.plugins_dir):
+            if not directory.is_dir():
+                directory.mkdir(exist_ok=True)
         
         logger.info(f"Plugin manager initialized")
         logger.info(f"Tools directory: {self.tools_dir}")
         logger.info(f"Plugins directory: {self.plugins_dir}")
     
-    def discover_and_load_all(self) -> Dict[str, Any]:
+    def discover_and_load_all(self, manifest_path: Optional[Path] = None) -> Dict[str, Any]:
         """
         Discover and load all available tools and plugins.
         
+        Args:
+            manifest_path: Discovery manifest to reuse and refresh. When every
+                tool and plugin source file is unchanged since it was written,
+                tools are registered from it as lazy proxies without importing
+                any plugin module.
+        
         Returns:
             Dict with loading results and statistics
         """
+        if manifest_path is not None:
+            cached = self._load_from_manifest(manifest_path)
+            if cached is not None:
+                return cached
+        
+        results = self._discover_and_load()
+        
+        # Failed loads may succeed next time (e.g. after installing a dependency),
+        # so only a clean discovery is memoized. Bundled plugins can't be
+        # reloaded from a file path, so their discovery isn't memoized either.
+        if manifest_path is not None and not results["errors"] and not results.get("bundled"):
+            self._write_manifest(manifest_path, results)
+        
+        return results
+    
+    def _discover_and_load(self) -> Dict[str, Any]:
+        """Import every tool and plugin module and register their tools"""
         results = {
             "tools_loaded": 0,
             "plugins_loaded": 0,
@@ -70,8 +252,13 @@ class PluginManager:
             results["tools"] = tools_result["tools"]
             results["errors"].extend(tools_result["errors"])
             
-            # Load external plugins
-            plugins_result = self._load_plugins_from_directory(self.plugins_dir)
+            # Load external plugins, from the single-file bundle when there is one
+            bundle_path = self.plugins_dir / PLUGIN_BUNDLE_NAME
+            if bundle_path.is_file():
+                plugins_result = self._load_plugins_from_bundle(bundle_path)
+                results["bundled"] = True
+            else:
+                plugins_result = self._load_plugins_from_directory(self.plugins_dir)
             results["plugins_loaded"] = plugins_result["loaded"]
             results["plugins"] = plugins_result["plugins"]
             results["errors"].extend(plugins_result["errors"])
@@ -99,12 +286,28 @@ class PluginManager:
             return results
         
         # Find all Python files in the directory
-        python_files = list(directory.rglob("*.py"))
-        python_files = [f for f in python_files if not f.name.startswith("__")]
-        
-        for py_file in python_files:
+        python_files = list(_iter_python_files(directory))
+        
+        # Execute the modules concurrently (reading and compiling them is the
+        # slow part), then register their tools one file at a time in
+        # discovery order so the registry ends up the same as a serial load
+        workers = min(MAX_LOAD_WORKERS, os.cpu_count() or 1, len(python_files))
+        if workers > 1:
+            executor = ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="DesktopMCP.PluginLoad"
+            )
+            futures = [executor.submit(self._exec_module_only, f) for f in python_files]
+            executor.shutdown(wait=False)
+        else:
+            futures = None
+        
+        for i, py_file in enumerate(python_files):
             try:
-                tools = self._load_tools_from_file(py_file)
+                if futures is not None:
+                    module = futures[i].result()
+                else:
+                    module = self._exec_module_only(py_file)
+                tools = self._register_tools_from_module(module, py_file)
                 results["loaded"] += len(tools)
                 results["tools"].extend(tools)
                 
@@ -128,10 +331,13 @@ class PluginManager:
             return results
         
         # Look for plugin directories (each plugin should be in its own directory)
-        for plugin_dir in directory.iterdir():
-            if not plugin_dir.is_dir() or plugin_dir.name.startswith("."):
-                continue
-            
+        with os.scandir(directory) as entries:
+            plugin_dirs = [
+                Path(entry.path) for entry in entries
+                if entry.is_dir() and not entry.name.startswith(".")
+            ]
+        
+        for plugin_dir in plugin_dirs:
             try:
                 plugin_info = self._load_plugin_from_directory(plugin_dir)
                 if plugin_info:
@@ -145,8 +351,89 @@ class PluginManager:
         
         return results
     
+    def _load_plugins_from_bundle(self, bundle_path: Path) -> Dict[str, Any]:
+        """
+        Load external plugins from a zip bundle with zipimport
+        
+        Each top-level package (a directory with __init__.py) or module in the
+        archive is one plugin, imported under its own name. Reading the
+        archive's table of contents once replaces the per-file directory walk.
+        """
+        results = {
+            "loaded": 0,
+            "plugins": [],
+            "errors": []
+        }
+        
+        try:
+            with zipfile.ZipFile(bundle_path) as bundle:
+                names = bundle.namelist()
+                # Top-level plugin name -> its plugin.json, if any
+                plugins: Dict[str, Optional[bytes]] = {}
+                for name in names:
+                    top, sep, rest = name.partition("/")
+                    if top.startswith((".", "__")):
+                        continue
+                    if sep and rest == "__init__.py":
+                        metadata_name = f"{top}/plugin.json"
+                        plugins[top] = (
+                            bundle.read(metadata_name) if metadata_name in names else None
+                        )
+                    elif not sep and name.endswith(".py"):
+                        plugins[name[:-3]] = None
+            importer = zipimport.zipimporter(str(bundle_path))
+        except Exception as e:
+            error_msg = f"Failed to open plugin bundle {bundle_path}: {str(e)}"
+            logger.error(error_msg)
+            results["errors"].append(error_msg)
+            return results
+        
+        for plugin_name, metadata in plugins.items():
+            plugin_info = {
+                "name": plugin_name,
+                "directory": f"{bundle_path}/{plugin_name}",
+                "tools_count": 0,
+                "metadata": {}
+            }
+            if metadata is not None:
+                try:
+                    plugin_info["metadata"] = _json_loads(metadata)
+                except Exception as e:
+                    logger.warning(f"Failed to load plugin metadata for {plugin_name}: {e}")
+            
+            try:
+                spec = importer.find_spec(plugin_name)
+                if spec is None:
+                    raise ImportError(f"Could not find {plugin_name} in {bundle_path}")
+                module = importlib.util.module_from_spec(spec)
+                sys.modules.pop(plugin_name, None)
+                sys.modules[plugin_name] = module
+                spec.loader.exec_module(module)
+                
+                tools = self._register_tools_from_module(module, Path(module.__file__))
+                plugin_info["tools_count"] = len(tools)
+                if tools:
+                    logger.info(
+                        f"Loaded plugin '{plugin_name}' with {len(tools)} tools from bundle"
+                    )
+                    results["loaded"] += len(tools)
+                    results["plugins"].append(plugin_info)
+                else:
+                    logger.warning(f"No tools found in bundled plugin: {plugin_name}")
+                    
+            except Exception as e:
+                error_msg = f"Failed to load plugin {plugin_name} from {bundle_path}: {str(e)}"
+                logger.error(error_msg)
+                results["errors"].append(error_msg)
+        
+        return results
+    
     def _load_plugin_from_directory(self, plugin_dir: Path) -> Optional[Dict[str, Any]]:
         """Load a plugin from its directory"""
+        # One directory listing answers every "does this file exist" question below
+        with os.scandir(plugin_dir) as dir_entries:
+            entries = {entry.name: entry for entry in dir_entries}
+        
         # Look for plugin metadata
         metadata_file = plugin_dir / "plugin.json"
         plugin_info = {
@@ -156,26 +443,27 @@ class PluginManager:
             "metadata": {}
         }
         
-        if metadata_file.exists():
+        if "plugin.json" in entries:
             try:
-                with open(metadata_file, 'r') as f:
-                    plugin_info["metadata"] = json.load(f)
+                plugin_info["metadata"] = _json_loads(metadata_file.read_bytes())
                 logger.info(f"Loaded plugin metadata: {plugin_info['metadata']}")
             except Exception as e:
                 logger.warning(f"Failed to load plugin metadata from {metadata_file}: {e}")
         
         # Look for main plugin file
-        main_file = plugin_dir / "__init__.py"
-        if not main_file.exists():
-            main_file = plugin_dir / "main.py"
+        main_entry = entries.get("__init__.py") or entries.get("main.py")
         
-        if not main_file.exists():
+        if main_entry is None:
             # Look for any Python files
-            python_files = list(plugin_dir.glob("*.py"))
-            if not python_files:
+            main_entry = next(
+                (entry for name, entry in entries.items()
+                 if name.endswith(".py") and entry.is_file()),
+                None
+            )
+            if main_entry is None:
                 logger.warning(f"No Python files found in plugin directory: {plugin_dir}")
                 return None
-            main_file = python_files[0]
+        main_file = Path(main_entry.path)
         
         # Load tools from the main file
         try:
@@ -195,11 +483,31 @@ class PluginManager:
     
     def _load_tools_from_file(self, file_path: Path) -> List[str]:
         """Load tools from a Python file"""
-        tools_loaded = []
+        module = self._exec_module_only(file_path)
+        return self._register_tools_from_module(module, file_path)
+    
+    def _exec_module_only(self, file_path: Path) -> Any:
+        """
+        Execute a tool module without registering anything, reusing the
+        already executed module while the file is unchanged
         
+        Safe to call from several threads at once.
+        """
         try:
-            # Create module spec
-            module_name = f"desktop_mcp_plugin_{file_path.stem}_{id(file_path)}"
+            key = str(file_path)
+            mtime = os.stat(file_path).st_mtime_ns
+            with self._modules_lock:
+                module = self.loaded_modules.get(key)
+                if module is not None and self._module_mtimes.get(key) == mtime:
+                    self.loaded_modules.move_to_end(key)
+                    return module
+            
+            # Create module spec. The name is derived from the resolved path
+            # so a reload replaces the previous module instead of adding one.
+            path_hash = hashlib.blake2b(
+                str(file_path.resolve()).encode(), digest_size=8
+            ).hexdigest()
+            module_name = f"desktop_mcp_plugin_{file_path.stem}_{path_hash}"
             spec = importlib.util.spec_from_file_location(module_name, file_path)
             
             if spec is None or spec.loader is None:
@@ -207,36 +515,176 @@ class PluginManager:
             
             # Load the module
             module = importlib.util.module_from_spec(spec)
+            sys.modules.pop(module_name, None)
             sys.modules[module_name] = module
-            spec.loader.exec_module(module)
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                # As the import system does, don't keep a half-executed module
+                sys.modules.pop(module_name, None)
+                raise
             
             # Store the loaded module
-            self.loaded_modules[str(file_path)] = module
-            
-            # Find all tool classes in the module
-            for name, obj in inspect.getmembers(module):
-                if (inspect.isclass(obj) and 
-                    issubclass(obj, BaseTool) and 
-                    obj is not BaseTool):
-                    
-                    try:
-                        # Instantiate and register the tool
-                        tool_instance = obj()
-                        self.registry.register(tool_instance)
-                        tools_loaded.append(tool_instance.metadata.name)
-                        
-                        logger.info(f"Loaded tool: {tool_instance.metadata.name} from {file_path}")
-                        
-                    except Exception as e:
-                        logger.error(f"Failed to instantiate tool {name} from {file_path}: {e}")
+            with self._modules_lock:
+                self.loaded_modules[key] = module
+                self.loaded_modules.move_to_end(key)
+                self._module_mtimes[key] = mtime
+                # Forget the least recently loaded modules (e.g. files that were
+                # deleted or renamed during development) past the cap
+                while len(self.loaded_modules) > MAX_LOADED_MODULES:
+                    old_key, old_module = self.loaded_modules.popitem(last=False)
+                    self._module_mtimes.pop(old_key, None)
+                    sys.modules.pop(old_module.__name__, None)
+            return module
             
         except Exception as e:
             logger.error(f"Failed to load module from {file_path}: {e}")
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback for failed plugin load: %s", file_path, exc_info=True)
             raise
+    
+    def _register_tools_from_module(self, module: Any, file_path: Path,
+                                    replace: bool = False) -> List[str]:
+        """
+        Instantiate and register every tool class defined in an executed module
         
+        replace is passed on to ToolRegistry.register, for tools expected to
+        replace ones registered under the same names.
+        """
+        tools_loaded = []
+        
+        # Modules that mark their tools with @register_tool list them up front;
+        # otherwise find all tool classes in the module, in definition order.
+        # Reading the namespace directly skips getmembers' getattr-and-sort
+        # over every imported name.
+        tool_classes = getattr(module, TOOLS_ATTRIBUTE, None)
+        if tool_classes is None:
+            tool_classes = [
+                obj for obj in vars(module).values()
+                if isinstance(obj, type) and obj is not BaseTool and _is_tool_class(obj)
+            ]
+        
+        for obj in list(tool_classes):
+            try:
+                # Instantiate and register the tool
+                tool_instance = obj()
+                self.registry.register(tool_instance, replace=replace)
+                tools_loaded.append(tool_instance.metadata.name)
+                self._tool_sources[tool_instance.metadata.name] = str(file_path)
+                
+                logger.info(f"Loaded tool: {tool_instance.metadata.name} from {file_path}")
+                
+            except Exception as e:
+                logger.error(
+                    f"Failed to instantiate tool {obj.__name__} from {file_path}: {e}"
+                )
+        
+        self._module_to_tools[module.__name__] = tools_loaded
         return tools_loaded
     
+    def _source_fingerprint(self) -> Dict[str, List[int]]:
+        """(mtime, size) of every file discovery depends on, keyed by path"""
+        files = list(self.tools_dir.rglob("*.py"))
+        bundle_path = self.plugins_dir / PLUGIN_BUNDLE_NAME
+        if bundle_path.is_file():
+            files.append(bundle_path)
+        if self.plugins_dir.exists():
+            files.extend(self.plugins_dir.rglob("*.py"))
+            files.extend(self.plugins_dir.rglob("plugin.json"))
+        
+        fingerprint = {}
+        for path in files:
+            stat = path.stat()
+            fingerprint[str(path)] = [stat.st_mtime_ns, stat.st_size]
+        return fingerprint
+    
+    def _write_manifest(self, manifest_path: Path, results: Dict[str, Any]):
+        """Atomically record discovery results for the next startup"""
+        try:
+            with self.registry.lock:
+                tools = [
+                    {"file": source, "metadata": _metadata_to_dict(self.registry.tools[name].metadata)}
+                    for name, source in self._tool_sources.items()
+                    if name in self.registry.tools
+                ]
+            manifest = {
+                "format": MANIFEST_FORMAT,
+                "fingerprint": self._source_fingerprint(),
+                "results": results,
+                "tools": tools
+            }
+            
+            manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+            with open(temp_path, 'w') as f:
+                json.dump(manifest, f)
+            os.replace(temp_path, manifest_path)
+        except Exception as e:
+            # e.g. a parameter default that isn't JSON serializable
+            logger.debug(f"Could not write plugin manifest {manifest_path}: {e}")
+    
+    def _load_from_manifest(self, manifest_path: Path) -> Optional[Dict[str, Any]]:
+        """Register lazy tools from an up-to-date manifest; None if it can't be used"""
+        try:
+            if not manifest_path.exists():
+                return None
+            with open(manifest_path, 'r') as f:
+                manifest = json.load(f)
+            
+            if (manifest.get("format") != MANIFEST_FORMAT or
+                    manifest.get("fingerprint") != self._source_fingerprint()):
+                logger.info("Plugin sources changed, running full discovery")
+                return None
+            
+            # Build every proxy before registering any, so a bad entry can't
+            # leave the registry half populated
+            proxies = [
+                LazyTool(_metadata_from_dict(entry["metadata"]), entry["file"], self._materialize)
+                for entry in manifest["tools"]
+            ]
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable plugin manifest {manifest_path}: {e}")
+            return None
+        
+        for proxy in proxies:
+            self.registry.register(proxy)
+            self._tool_sources[proxy.metadata.name] = proxy.source_file
+        
+        results = manifest["results"]
+        results["lazy"] = True
+        logger.info(f"Registered {len(proxies)} tools from plugin manifest without importing them")
+        return results
+    
+    def _materialize(self, tool_name: str, source_file: str) -> BaseTool:
+        """Import a lazily registered tool's module and return the real tool"""
+        with self._load_lock:
+            tool = self.registry.get_tool(tool_name)
+            if tool is not None and not isinstance(tool, LazyTool):
+                return tool  # Another call already loaded it
+            
+            # This runs on a tool worker thread while other commands look tools
+            # up. The proxies keep serving until the module has been imported,
+            # then each real tool replaces its proxy's entry in place, so no
+            # tool from this file is ever missing from the registry.
+            path = Path(source_file)
+            loaded = set(self._register_tools_from_module(
+                self._exec_module_only(path), path, replace=True
+            ))
+            
+            # Drop proxies for tools the module no longer defines
+            with self.registry.lock:
+                stale = [
+                    name for name, t in self.registry.tools.items()
+                    if isinstance(t, LazyTool) and t.source_file == source_file
+                    and name not in loaded
+                ]
+            for name in stale:
+                self.registry.unregister(name)
+            
+            tool = self.registry.get_tool(tool_name)
+            if tool is None:
+                raise ImportError(f"Tool '{tool_name}' is no longer defined in {source_file}")
+            return tool
+    
     def reload_plugin(self, plugin_path: str) -> Dict[str, Any]:
         """
         Reload a specific plugin (useful for development).
@@ -258,16 +706,15 @@ class PluginManager:
             
             # Remove old tools from registry
             if str(path) in self.loaded_modules:
-                # Find tools that came from this module and remove them
+                # Remove the tools this module registered, unless another file
+                # has since registered a tool under the same name
                 old_module = self.loaded_modules[str(path)]
-                tools_to_remove = []
-                
-                for tool_name, tool in self.registry.tools.items():
-                    if tool.__class__.__module__ == old_module.__name__:
-                        tools_to_remove.append(tool_name)
+                tools_to_remove = self._module_to_tools.pop(old_module.__name__, [])
                 
                 for tool_name in tools_to_remove:
-                    del self.registry.tools[tool_name]
+                    if self._tool_sources.get(tool_name) != str(path):
+                        continue
+                    self.registry.unregister(tool_name)
                     logger.info(f"Removed old tool: {tool_name}")
                 
                 # Remove module from sys.modules
@@ -275,6 +722,7 @@ class PluginManager:
                     del sys.modules[old_module.__name__]
                 
                 del self.loaded_modules[str(path)]
+                self._module_mtimes.pop(str(path), None)
             
             # Reload the plugin
             if path.is_file():
@@ -298,24 +746,34 @@ class PluginManager:
     
     def get_plugin_info(self) -> Dict[str, Any]:
         """Get information about all loaded plugins"""
+        # The per-category views only change when the registry does
+        if self._info_cache_version != self.registry.version:
+            # Group every tool's summary in one pass over the registry rather
+            # than one get_tools_by_category lookup per category
+            by_category: Dict[ToolCategory, List[Dict[str, Any]]] = {}
+            with self.registry.lock:
+                version = self.registry.version
+                for tool in self.registry.tools.values():
+                    metadata = tool.metadata
+                    by_category.setdefault(metadata.category, []).append(
+                        dict(zip(_INFO_FIELDS, _info_values(metadata)))
+                    )
+                
+                self._info_cache = {
+                    "categories": {
+                        category.value: len(tools) 
+                        for category, tools in self.registry.categories.items()
+                    },
+                    "tools_by_category": {
+                        category.value: by_category.get(category, [])
+                        for category in self.registry.categories.keys()
+                    },
+                }
+            self._info_cache_version = version
+        
         return {
             "total_tools": len(self.registry.tools),
-            "categories": {
-                category.value: len(tools) 
-                for category, tools in self.registry.categories.items()
-            },
-            "tools_by_category": {
-                category.value: [
-                    {
-                        "name": tool.metadata.name,
-                        "description": tool.metadata.description,
-                        "version": tool.metadata.version,
-                        "author": tool.metadata.author
-                    }
-                    for tool in self.registry.get_tools_by_category(category)
-                ]
-                for category in self.registry.categories.keys()
-            },
+            **self._info_cache,
             "loaded_modules": list(self.loaded_modules.keys()),
             "plugin_metadata": self.plugin_metadata
         }
@@ -340,25 +798,17 @@ class PluginManager:
         try:
             # Check Python packages
             for package in tool.metadata.requirements:
-                try:
-                    importlib.import_module(package)
-                except ImportError:
+                if not self._package_available(package):
                     result["missing_packages"].append(package)
                     result["valid"] = False
             
             # Check platform compatibility
-            import platform
-            current_platform = platform.system().lower()
-            if current_platform not in tool.metadata.platforms:
+            if _current_platform() not in tool.metadata.platforms:
                 result["platform_compatible"] = False
                 result["valid"] = False
             
             # Check Python version
-            import sys
-            current_version = sys.version_info
-            required_version = tuple(map(int, tool.metadata.min_python_version.split('.')))
-            
-            if current_version < required_version:
+            if _CURRENT_VERSION < _parse_version(tool.metadata.min_python_version):
                 result["python_version_ok"] = False
                 result["valid"] = False
                 
@@ -369,6 +819,18 @@ class PluginManager:
         
         return result
     
+    def _package_available(self, package: str) -> bool:
+        """Whether a requirement can be imported, found without importing it"""
+        available = self._dep_check_cache.get(package)
+        if available is None:
+            try:
+                available = importlib.util.find_spec(package) is not None
+            except (ImportError, ValueError):
+                # A missing parent package, or a malformed name
+                available = False
+            self._dep_check_cache[package] = available
+        return available
+    
     def install_missing_dependencies(self, tool: BaseTool) -> Dict[str, Any]:
         """
         Attempt to install missing dependencies for a tool.
@@ -392,19 +854,32 @@ class PluginManager:
             if validation["missing_packages"]:
                 import subprocess
                 
-                for package in validation["missing_packages"]:
-                    try:
-                        # Try to install the package
-                        subprocess.check_call([
-                            sys.executable, "-m", "pip", "install", package
-                        ])
+                missing = validation["missing_packages"]
+                # One pip run resolves every package together and pays pip's
+                # startup cost once
+                proc = subprocess.run(
+                    [sys.executable, "-m", "pip", "install", "--no-input",
+                     "--disable-pip-version-check", *missing],
+                    capture_output=True, text=True
+                )
+                
+                # Let the import system see the newly installed packages
+                importlib.invalidate_caches()
+                for package in missing:
+                    self._dep_check_cache.pop(package, None)
+                    # pip may have installed some packages before failing on
+                    # another, so check each one when the run as a whole failed
+                    if proc.returncode == 0 or self._package_available(package):
                         result["installed"].append(package)
                         logger.info(f"Successfully installed package: {package}")
-                        
-                    except subprocess.CalledProcessError as e:
+                    else:
                         result["failed"].append(package)
-                        logger.error(f"Failed to install package {package}: {e}")
+                        logger.error(f"Failed to install package {package}")
                 
+                if proc.returncode != 0:
+                    logger.error(
+                        f"pip install exited with {proc.returncode}: {proc.stderr.strip()}"
+                    )
                 result["success"] = len(result["failed"]) == 0
             else:
                 result["success"] = True
@@ -444,9 +919,6 @@ class PluginManager:
                 "requirements": []
             }
             
-            with open(plugin_dir / "plugin.json", 'w') as f:
-                json.dump(metadata, f, indent=2)
-            
             # Create main plugin file
             template_code = f'''"""
 {plugin_name} Plugin for Desktop MCP
@@ -456,10 +928,11 @@ This is a template plugin. Modify it to create your custom tools.
 
 from desktop_mcp.tools.base_tool import (
     BaseTool, ToolMetadata, ToolParameter, ToolResult, 
-    ToolCategory, ParameterType
+    ToolCategory, ParameterType, register_tool
 )
 
 
+@register_tool
 class {plugin_name.title()}Tool(BaseTool):
     """Example tool for {plugin_name} plugin"""
     
@@ -495,12 +968,10 @@ class {plugin_name.title()}Tool(BaseTool):
         )
 
 
-# The tool will be automatically discovered and loaded
+# @register_tool lists the tool for the plugin loader, which then skips
+# scanning the module for BaseTool subclasses
 '''
             
-            with open(plugin_dir / "__init__.py", 'w') as f:
-                f.write(template_code)
-            
             # Create README
             readme_content = f"""# {plugin_name} Plugin
 
@@ -519,13 +990,26 @@ The plugin will be automatically discovered and loaded.
 Modify the `__init__.py` file to add your custom tools.
 """
             
-            with open(plugin_dir / "README.md", 'w') as f:
-                f.write(readme_content)
+            # Encode everything up front, then write each file with one raw
+            # os.write instead of going through a buffered text wrapper
+            files = {
+                "plugin.json": json.dumps(metadata, indent=2).encode(),
+                "__init__.py": template_code.encode(),
+                "README.md": readme_content.encode(),
+            }
+            for name, data in files.items():
+                fd = os.open(plugin_dir / name, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
             
             return {
                 "success": True,
                 "plugin_dir": str(plugin_dir),
-                "files_created": ["plugin.json", "__init__.py", "README.md"]
+                "files_created": list(files)
             }
             
         except Exception as e:
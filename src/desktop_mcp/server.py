@@ -3,14 +3,26 @@ from mcp.server.fastmcp import FastMCP, Context, Image
 import subprocess
 import json
 import asyncio
+import functools
+import heapq
+import inspect
+import locale
 import logging
 import tempfile
 import shutil
 import os
+import sys
 import platform
+import shlex
+import struct
+import threading
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import quote_plus
 import requests
 import psutil
 import pyautogui
@@ -20,10 +32,32 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 from PIL import Image as PILImage
 import base64
 
+try:
+    import orjson
+    
+    def _to_json(obj: Any) -> str:
+        """Tool results as indented JSON, serialized by orjson"""
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            # e.g. non-string dict keys, which orjson rejects
+            return json.dumps(obj, indent=2)
+except ImportError:
+    def _to_json(obj: Any) -> str:
+        """Tool results as indented JSON"""
+        return json.dumps(obj, indent=2)
+
+try:
+    import mss
+    MSS_AVAILABLE = True
+except ImportError:
+    MSS_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -38,13 +72,67 @@ mcp = FastMCP(
     description="Desktop automation through the Model Context Protocol - AI assistant for managing your PC"
 )
 
+# Fixed for the life of the process
+_SYSTEM_TYPE = platform.system().lower()
+
+# Launch commands for well-known applications, per operating system
+_APP_MAPPINGS = {
+    "windows": {
+        "blender": ["blender.exe"],
+        "vscode": ["code"],
+        "code": ["code"],
+        "visual studio code": ["code"],
+        "notepad": ["notepad.exe"],
+        "calculator": ["calc.exe"],
+        "browser": ["start", "chrome"],
+        "chrome": ["start", "chrome"],
+        "firefox": ["start", "firefox"],
+        "edge": ["start", "msedge"],
+        "explorer": ["explorer.exe"],
+        "cmd": ["cmd.exe"],
+        "powershell": ["powershell.exe"],
+        "terminal": ["cmd.exe"]
+    },
+    "darwin": {  # macOS
+        "blender": ["open", "-a", "Blender"],
+        "vscode": ["open", "-a", "Visual Studio Code"],
+        "code": ["open", "-a", "Visual Studio Code"],
+        "visual studio code": ["open", "-a", "Visual Studio Code"],
+        "browser": ["open", "-a", "Google Chrome"],
+        "chrome": ["open", "-a", "Google Chrome"],
+        "firefox": ["open", "-a", "Firefox"],
+        "safari": ["open", "-a", "Safari"],
+        "finder": ["open", "-a", "Finder"],
+        "terminal": ["open", "-a", "Terminal"],
+        "calculator": ["open", "-a", "Calculator"]
+    },
+    "linux": {
+        "blender": ["blender"],
+        "vscode": ["code"],
+        "code": ["code"],
+        "visual studio code": ["code"],
+        "browser": ["google-chrome"],
+        "chrome": ["google-chrome"],
+        "firefox": ["firefox"],
+        "terminal": ["gnome-terminal"],
+        "nautilus": ["nautilus"],
+        "calculator": ["gnome-calculator"],
+        "gedit": ["gedit"]
+    }
+}
+
+@functools.lru_cache(maxsize=64)
+def _resolve_exe(name: str) -> Optional[str]:
+    """Absolute path of an executable found on PATH, or None"""
+    return shutil.which(name)
+
 class ApplicationManager:
     """Manages application launching and control"""
     
     @staticmethod
     def get_system_type():
         """Get the current operating system"""
-        return platform.system().lower()
+        return _SYSTEM_TYPE
     
     @staticmethod
     def open_application(app_name: str, args: List[str] = None) -> Dict[str, Any]:
@@ -53,60 +141,18 @@ class ApplicationManager:
         if args is None:
             args = []
         
-        # Common application mappings
-        app_mappings = {
-            "windows": {
-                "blender": ["blender.exe"],
-                "vscode": ["code"],
-                "code": ["code"],
-                "visual studio code": ["code"],
-                "notepad": ["notepad.exe"],
-                "calculator": ["calc.exe"],
-                "browser": ["start", "chrome"],
-                "chrome": ["start", "chrome"],
-                "firefox": ["start", "firefox"],
-                "edge": ["start", "msedge"],
-                "explorer": ["explorer.exe"],
-                "cmd": ["cmd.exe"],
-                "powershell": ["powershell.exe"],
-                "terminal": ["cmd.exe"]
-            },
-            "darwin": {  # macOS
-                "blender": ["open", "-a", "Blender"],
-                "vscode": ["open", "-a", "Visual Studio Code"],
-                "code": ["open", "-a", "Visual Studio Code"],
-                "visual studio code": ["open", "-a", "Visual Studio Code"],
-                "browser": ["open", "-a", "Google Chrome"],
-                "chrome": ["open", "-a", "Google Chrome"],
-                "firefox": ["open", "-a", "Firefox"],
-                "safari": ["open", "-a", "Safari"],
-                "finder": ["open", "-a", "Finder"],
-                "terminal": ["open", "-a", "Terminal"],
-                "calculator": ["open", "-a", "Calculator"]
-            },
-            "linux": {
-                "blender": ["blender"],
-                "vscode": ["code"],
-                "code": ["code"],
-                "visual studio code": ["code"],
-                "browser": ["google-chrome"],
-                "chrome": ["google-chrome"],
-                "firefox": ["firefox"],
-                "terminal": ["gnome-terminal"],
-                "nautilus": ["nautilus"],
-                "calculator": ["gnome-calculator"],
-                "gedit": ["gedit"]
-            }
-        }
-        
         try:
             app_lower = app_name.lower()
-            if system in app_mappings and app_lower in app_mappings[system]:
-                cmd = app_mappings[system][app_lower] + args
+            if system in _APP_MAPPINGS and app_lower in _APP_MAPPINGS[system]:
+                cmd = _APP_MAPPINGS[system][app_lower] + args
             else:
                 # Try to run the app directly
                 cmd = [app_name] + args
             
+            # Launch by absolute path so repeat opens skip the PATH search;
+            # names which aren't on PATH (e.g. Windows' "start") pass through
+            cmd[0] = _resolve_exe(cmd[0]) or cmd[0]
+            
             logger.info(f"Opening application: {' '.join(cmd)}")
             
             if system == "windows" and cmd[0] == "start":
@@ -129,6 +175,82 @@ class ApplicationManager:
                 "message": f"Failed to open {app_name}"
             }
 
+def _fast_path(path: str) -> Path:
+    """
+    Expand ~ and make the path absolute
+    
+    Only relative paths go through resolve(), which stats every component to
+    canonicalize symlinks; that walk is slow on network mounts. Absolute paths
+    just get "." and ".." collapsed, which needs no system calls.
+    """
+    expanded = Path(path).expanduser()
+    if expanded.is_absolute():
+        return Path(os.path.normpath(expanded))
+    return expanded.resolve()
+
+# Concurrent file copies when copying a directory tree
+COPY_WORKERS = 8
+
+def _fast_copy(src: str, dst: str) -> str:
+    """
+    copy2 replacement that lets the OS copy the file's bytes
+    
+    On Linux and macOS shutil.copy2 already copies in the kernel (sendfile /
+    fcopyfile). On Windows it reads and writes through a Python buffer, so
+    CopyFileW is used there instead; it keeps attributes and timestamps too.
+    """
+    if sys.platform == "win32":
+        if os.path.isdir(dst):
+            dst = os.path.join(dst, os.path.basename(src))
+        import ctypes
+        if not ctypes.windll.kernel32.CopyFileW(str(src), str(dst), False):
+            raise ctypes.WinError()
+        return dst
+    return shutil.copy2(src, dst)
+
+def _parallel_copytree(src: str, dst: str, workers: int = COPY_WORKERS):
+    """
+    copytree(src, dst, dirs_exist_ok=True) with the file copies spread over threads
+    
+    Copying many small files is bound by per-file syscall latency, not
+    bandwidth, so several copies in flight finish far sooner than one at a
+    time. Directories are created up front and get their metadata copied last,
+    after every file inside them has been written.
+    """
+    directories = []
+    errors = []
+    
+    def walk_error(error: OSError):
+        # os.walk skips directories it can't list; copytree reports them
+        errors.append((error.filename, dst, str(error)))
+    
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="DesktopMCP.Copy") as pool:
+        copies = []
+        for root, _, files in os.walk(src, onerror=walk_error, followlinks=True):
+            target = os.path.join(dst, os.path.relpath(root, src))
+            os.makedirs(target, exist_ok=True)
+            directories.append((root, target))
+            for name in files:
+                src_file, dst_file = os.path.join(root, name), os.path.join(target, name)
+                copies.append((src_file, dst_file, pool.submit(_fast_copy, src_file, dst_file)))
+        
+        for src_file, dst_file, copy in copies:
+            try:
+                copy.result()
+            except OSError as e:
+                errors.append((src_file, dst_file, str(e)))
+    
+    # Deepest first, matching copytree's order
+    for root, target in reversed(directories):
+        try:
+            shutil.copystat(root, target)
+        except OSError as e:
+            errors.append((root, target, str(e)))
+    
+    if errors:
+        raise shutil.Error(errors)
+    return dst
+
 class FileManager:
     """Manages file operations"""
     
@@ -136,8 +258,8 @@ class FileManager:
     def move_file(source: str, destination: str) -> Dict[str, Any]:
         """Move a file or directory from source to destination"""
         try:
-            source_path = Path(source).expanduser().resolve()
-            dest_path = Path(destination).expanduser().resolve()
+            source_path = _fast_path(source)
+            dest_path = _fast_path(destination)
             
             if not source_path.exists():
                 return {"success": False, "error": f"Source path does not exist: {source_path}"}
@@ -145,10 +267,9 @@ class FileManager:
             # Create destination directory if it doesn't exist
             dest_path.parent.mkdir(parents=True, exist_ok=True)
             
-            if source_path.is_file():
-                shutil.move(str(source_path), str(dest_path))
-            else:
-                shutil.move(str(source_path), str(dest_path))
+            # shutil.move renames when source and destination share a filesystem
+            # and only copies (then deletes) across devices
+            shutil.move(str(source_path), str(dest_path), copy_function=_fast_copy)
             
             return {
                 "success": True,
@@ -164,8 +285,8 @@ class FileManager:
     def copy_file(source: str, destination: str) -> Dict[str, Any]:
         """Copy a file or directory from source to destination"""
         try:
-            source_path = Path(source).expanduser().resolve()
-            dest_path = Path(destination).expanduser().resolve()
+            source_path = _fast_path(source)
+            dest_path = _fast_path(destination)
             
             if not source_path.exists():
                 return {"success": False, "error": f"Source path does not exist: {source_path}"}
@@ -174,9 +295,9 @@ class FileManager:
             dest_path.parent.mkdir(parents=True, exist_ok=True)
             
             if source_path.is_file():
-                shutil.copy2(str(source_path), str(dest_path))
+                _fast_copy(str(source_path), str(dest_path))
             else:
-                shutil.copytree(str(source_path), str(dest_path), dirs_exist_ok=True)
+                _parallel_copytree(str(source_path), str(dest_path))
             
             return {
                 "success": True,
@@ -192,7 +313,7 @@ class FileManager:
     def list_directory(path: str) -> Dict[str, Any]:
         """List contents of a directory"""
         try:
-            dir_path = Path(path).expanduser().resolve()
+            dir_path = _fast_path(path)
             
             if not dir_path.exists():
                 return {"success": False, "error": f"Directory does not exist: {dir_path}"}
@@ -200,16 +321,23 @@ class FileManager:
             if not dir_path.is_dir():
                 return {"success": False, "error": f"Path is not a directory: {dir_path}"}
             
+            # One stat per entry; scandir already knows each entry's type
             contents = []
-            for item in dir_path.iterdir():
-                item_info = {
-                    "name": item.name,
-                    "path": str(item),
-                    "type": "directory" if item.is_dir() else "file",
-                    "size": item.stat().st_size if item.is_file() else None,
-                    "modified": item.stat().st_mtime
-                }
-                contents.append(item_info)
+            append = contents.append
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        # Dangling symlink: describe the link itself
+                        st = entry.stat(follow_symlinks=False)
+                    append({
+                        "name": entry.name,
+                        "path": entry.path,
+                        "type": "directory" if entry.is_dir() else "file",
+                        "size": st.st_size if entry.is_file() else None,
+                        "modified": st.st_mtime
+                    })
             
             return {
                 "success": True,
@@ -221,11 +349,35 @@ class FileManager:
             logger.error(f"Failed to list directory: {str(e)}")
             return {"success": False, "error": str(e)}
 
+# Resolved on first use; driver re-creation after close_browser reuses it
+_CHROMEDRIVER_PATH: Optional[str] = None
+
+def _chromedriver_path() -> str:
+    """Path to a matching chromedriver, downloading it only the first time"""
+    global _CHROMEDRIVER_PATH
+    if _CHROMEDRIVER_PATH is None:
+        _CHROMEDRIVER_PATH = ChromeDriverManager().install()
+    return _CHROMEDRIVER_PATH
+
+# Search results URL per engine; {q} is the URL-encoded query
+_SEARCH_URLS = {
+    "google": "https://www.google.com/search?q={q}",
+    "bing": "https://www.bing.com/search?q={q}",
+    "duckduckgo": "https://duckduckgo.com/?q={q}"
+}
+
+# Longest wait for a page to finish loading after navigation, in seconds
+PAGE_LOAD_TIMEOUT = 10
+_PAGE_READY_STATES = ("interactive", "complete")
+
 class WebManager:
     """Manages web browsing and searching"""
     
-    def __init__(self):
+    def __init__(self, headless: bool = True):
         self.driver = None
+        # The web tools only report titles and URLs, so by default nothing is
+        # drawn on screen; pass headless=False to watch the browser
+        self.headless = headless
     
     def _get_driver(self):
         """Get or create a Chrome WebDriver instance"""
@@ -235,10 +387,15 @@ class WebManager:
                 chrome_options.add_argument("--no-sandbox")
                 chrome_options.add_argument("--disable-dev-shm-usage")
                 chrome_options.add_argument("--disable-gpu")
-                # Don't run headless by default so user can see the browser
-                # chrome_options.add_argument("--headless")
+                if self.headless:
+                    chrome_options.add_argument("--headless=new")
+                # Skip work whose result is never looked at: images, extensions,
+                # and waiting for subresources after DOMContentLoaded
+                chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+                chrome_options.add_argument("--disable-extensions")
+                chrome_options.page_load_strategy = "eager"
                 
-                service = Service(ChromeDriverManager().install())
+                service = Service(_chromedriver_path())
                 self.driver = webdriver.Chrome(service=service, options=chrome_options)
                 logger.info("Chrome WebDriver initialized")
             except Exception as e:
@@ -246,25 +403,34 @@ class WebManager:
                 raise
         return self.driver
     
+    @staticmethod
+    def _wait_for_page(driver, timeout: float = PAGE_LOAD_TIMEOUT):
+        """Return as soon as the document has been parsed, or after timeout"""
+        try:
+            # "interactive" matches the eager page load strategy: the DOM, and
+            # so the title, is ready even if subresources are still loading
+            WebDriverWait(driver, timeout).until(
+                lambda d: d.execute_script("return document.readyState") in _PAGE_READY_STATES
+            )
+        except TimeoutException:
+            # Report whatever is on screen, as the old fixed delay did
+            logger.warning(f"Page still loading after {timeout}s: {driver.current_url}")
+    
     def search_web(self, query: str, engine: str = "google") -> Dict[str, Any]:
         """Search the web using the specified search engine"""
         try:
-            driver = self._get_driver()
-            
-            search_urls = {
-                "google": f"https://www.google.com/search?q={query}",
-                "bing": f"https://www.bing.com/search?q={query}",
-                "duckduckgo": f"https://duckduckgo.com/?q={query}"
-            }
-            
-            if engine.lower() not in search_urls:
+            template = _SEARCH_URLS.get(engine.lower())
+            if template is None:
                 return {"success": False, "error": f"Unsupported search engine: {engine}"}
             
-            url = search_urls[engine.lower()]
+            driver = self._get_driver()
+            
+            # Encode the query so spaces, '&', '#' etc. stay part of it
+            url = template.format(q=quote_plus(query))
             driver.get(url)
             
             # Wait for page to load
-            time.sleep(2)
+            self._wait_for_page(driver)
             
             # Get page title and current URL
             title = driver.title
@@ -291,7 +457,7 @@ class WebManager:
                 url = 'https://' + url
             
             driver.get(url)
-            time.sleep(2)
+            self._wait_for_page(driver)
             
             title = driver.title
             current_url = driver.current_url
@@ -319,6 +485,74 @@ class WebManager:
                 return {"success": False, "error": str(e)}
         return {"success": True, "message": "No browser instance to close"}
 
+# Seconds between the two CPU samples get_running_processes takes per process
+PROCESS_CPU_SAMPLE_INTERVAL = 0.1
+
+# Processes that exit or can't be inspected mid-listing are skipped
+_PROC_ERRORS = (psutil.NoSuchProcess, psutil.AccessDenied)
+
+# Reads closer together than this reuse the last system CPU sample
+MIN_CPU_SAMPLE_INTERVAL = 0.1
+
+# Primed at import so every later read reports usage since the previous one,
+# instead of blocking for a fresh one-second measurement
+_cpu_sample_lock = threading.Lock()
+_last_cpu_sample = (time.monotonic(), psutil.cpu_percent(interval=None))
+
+def _system_cpu_percent() -> float:
+    """System-wide CPU usage since the previous sample, without blocking"""
+    global _last_cpu_sample
+    with _cpu_sample_lock:
+        taken_at, percent = _last_cpu_sample
+        now = time.monotonic()
+        # Back-to-back reads would measure a near-empty window, so keep the last value
+        if now - taken_at >= MIN_CPU_SAMPLE_INTERVAL:
+            percent = psutil.cpu_percent(interval=None)
+            _last_cpu_sample = (now, percent)
+        return percent
+
+_LINUX_CPU0_FREQ = "/sys/devices/system/cpu/cpu0/cpufreq/"
+
+def _read_khz_as_mhz(path: str) -> Optional[float]:
+    """A cpufreq sysfs value (kHz) in MHz, or None if it can't be read"""
+    try:
+        with open(path) as f:
+            return int(f.read()) / 1000.0
+    except (OSError, ValueError):
+        return None
+
+def _cpu_frequency() -> Dict[str, Optional[float]]:
+    """
+    Current, min and max CPU frequency in MHz
+    
+    On Linux psutil.cpu_freq() reads and averages every CPU's sysfs files;
+    cpu0's three files are read instead, which is one open per value however
+    many cores there are.
+    """
+    if _SYSTEM_TYPE == "linux":
+        current = _read_khz_as_mhz(_LINUX_CPU0_FREQ + "scaling_cur_freq")
+        if current is not None:
+            return {
+                "current": current,
+                "min": _read_khz_as_mhz(_LINUX_CPU0_FREQ + "scaling_min_freq"),
+                "max": _read_khz_as_mhz(_LINUX_CPU0_FREQ + "scaling_max_freq")
+            }
+    cpu_freq = psutil.cpu_freq()
+    return {
+        "current": cpu_freq.current if cpu_freq else None,
+        "min": cpu_freq.min if cpu_freq else None,
+        "max": cpu_freq.max if cpu_freq else None
+    }
+
+@functools.lru_cache(maxsize=1)
+def _platform_details() -> Dict[str, Any]:
+    """Platform strings for get_system_info; processor() may run uname, so ask once"""
+    return {
+        "platform": platform.platform(),
+        "architecture": platform.architecture(),
+        "processor": platform.processor(),
+    }
+
 class SystemMonitor:
     """Monitors system resources and processes"""
     
@@ -327,9 +561,8 @@ class SystemMonitor:
         """Get comprehensive system information"""
         try:
             # CPU info
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = _system_cpu_percent()
             cpu_count = psutil.cpu_count()
-            cpu_freq = psutil.cpu_freq()
             
             # Memory info
             memory = psutil.virtual_memory()
@@ -344,19 +577,13 @@ class SystemMonitor:
             return {
                 "success": True,
                 "system": {
-                    "platform": platform.platform(),
-                    "architecture": platform.architecture(),
-                    "processor": platform.processor(),
+                    **_platform_details(),
                     "boot_time": boot_time
                 },
                 "cpu": {
                     "usage_percent": cpu_percent,
                     "count": cpu_count,
-                    "frequency": {
-                        "current": cpu_freq.current if cpu_freq else None,
-                        "min": cpu_freq.min if cpu_freq else None,
-                        "max": cpu_freq.max if cpu_freq else None
-                    }
+                    "frequency": _cpu_frequency()
                 },
                 "memory": {
                     "total": memory.total,
@@ -384,35 +611,138 @@ class SystemMonitor:
     def get_running_processes() -> Dict[str, Any]:
         """Get list of running processes"""
         try:
-            processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
+            # A process's first cpu_percent() call has no earlier sample to
+            # compare against and always reports 0.0, so prime every process,
+            # wait a moment, then read the real values
+            procs = list(psutil.process_iter(['name']))
+            for proc in procs:
                 try:
-                    processes.append(proc.info)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    proc.cpu_percent(None)
+                except _PROC_ERRORS:
                     pass
+            time.sleep(PROCESS_CPU_SAMPLE_INTERVAL)
             
-            # Sort by CPU usage
-            processes.sort(key=lambda x: x.get('cpu_percent', 0), reverse=True)
+            processes = []
+            append = processes.append
+            for proc in procs:
+                try:
+                    # oneshot() reads each /proc (or task_info) record once for
+                    # both values instead of once per value
+                    with proc.oneshot():
+                        append({
+                            "pid": proc.pid,
+                            "name": proc.info['name'],
+                            "cpu_percent": proc.cpu_percent(None),
+                            "memory_percent": proc.memory_percent()
+                        })
+                except _PROC_ERRORS:
+                    pass
             
             return {
                 "success": True,
-                "processes": processes[:20],  # Top 20 processes
+                # Top 20 processes by CPU usage, without sorting the whole list
+                "processes": heapq.nlargest(20, processes, key=itemgetter('cpu_percent')),
                 "total_count": len(processes)
             }
         except Exception as e:
             logger.error(f"Failed to get running processes: {str(e)}")
             return {"success": False, "error": str(e)}
 
+# One mss grabber is reused: opening its display/GDI handles costs more than a grab
+_mss_instance = None
+_mss_lock = threading.Lock()
+
+def _grab_screen() -> PILImage.Image:
+    """Capture the whole desktop, with mss when installed and pyautogui otherwise"""
+    global _mss_instance
+    if MSS_AVAILABLE:
+        try:
+            with _mss_lock:
+                if _mss_instance is None:
+                    _mss_instance = mss.mss()
+                raw = _mss_instance.grab(_mss_instance.monitors[0])
+            return PILImage.frombytes("RGB", raw.size, raw.rgb)
+        except Exception as e:
+            logger.debug(f"mss capture failed, using pyautogui: {e}")
+    return pyautogui.screenshot()
+
 # Initialize managers
 app_manager = ApplicationManager()
 file_manager = FileManager()
 web_manager = WebManager()
 system_monitor = SystemMonitor()
 
+# Selenium drivers aren't thread-safe, so every browser call goes through one thread
+_web_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="DesktopMCP.Web")
+
+async def _run_web(func, *args):
+    """Run a blocking WebManager call on the browser thread"""
+    return await asyncio.get_running_loop().run_in_executor(_web_executor, func, *args)
+
+# Seconds execute_command lets a command run before killing it
+COMMAND_TIMEOUT = 30
+
+async def _run_command(command: str, shell: bool) -> Tuple[int, bytes, bytes]:
+    """
+    Run a command, returning its return code, stdout and stderr
+    
+    Raises subprocess.TimeoutExpired, after killing the command, if it runs
+    longer than COMMAND_TIMEOUT seconds.
+    """
+    if not shell and os.name == "nt":
+        # CreateProcess takes the command line as written. Splitting it and
+        # joining the arguments back up could change what the child receives.
+        result = await asyncio.to_thread(
+            subprocess.run, command, capture_output=True, timeout=COMMAND_TIMEOUT
+        )
+        return result.returncode, result.stdout, result.stderr
+    
+    # Awaiting the child keeps the event loop serving other tool calls
+    # while the command runs
+    if shell:
+        proc = await asyncio.create_subprocess_shell(
+            command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+    else:
+        proc = await asyncio.create_subprocess_exec(
+            *shlex.split(command),
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+    
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=COMMAND_TIMEOUT)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(command, COMMAND_TIMEOUT)
+    return proc.returncode, stdout, stderr
+
+def _json_tool(action: str):
+    """
+    Wrap an async tool that returns a result dict so it returns JSON
+    
+    An unexpected exception is logged and reported as a failed result instead
+    of escaping to the MCP client. The signature seen by FastMCP keeps the
+    tool's parameters but declares a str return.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs) -> str:
+            try:
+                return _to_json(await fn(*args, **kwargs))
+            except Exception as e:
+                logger.exception(f"Error {action}: {e}")
+                return _to_json({"success": False, "error": f"Error {action}: {e}"})
+        wrapper.__signature__ = inspect.signature(fn).replace(return_annotation=str)
+        return wrapper
+    return decorator
+
 # MCP Tools
 
 @mcp.tool()
-def open_application(ctx: Context, app_name: str, arguments: List[str] = None) -> str:
+@_json_tool("opening application")
+async def open_application(ctx: Context, app_name: str,
+                           arguments: List[str] = None) -> Dict[str, Any]:
     """
     Open an application on the desktop.
     
@@ -422,15 +752,11 @@ def open_application(ctx: Context, app_name: str, arguments: List[str] = None) -
     
     Supported applications include: Blender, VS Code, browsers (Chrome, Firefox), file managers, terminals, and more.
     """
-    try:
-        result = app_manager.open_application(app_name, arguments)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error opening application: {str(e)}")
-        return f"Error opening application: {str(e)}"
+    return await asyncio.to_thread(app_manager.open_application, app_name, arguments)
 
 @mcp.tool()
-def move_files(ctx: Context, source_path: str, destination_path: str) -> str:
+@_json_tool("moving file")
+async def move_files(ctx: Context, source_path: str, destination_path: str) -> Dict[str, Any]:
     """
     Move a file or directory from source to destination.
     
@@ -440,15 +766,11 @@ def move_files(ctx: Context, source_path: str, destination_path: str) -> str:
     
     Supports both relative and absolute paths. Creates destination directories if they don't exist.
     """
-    try:
-        result = file_manager.move_file(source_path, destination_path)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error moving file: {str(e)}")
-        return f"Error moving file: {str(e)}"
+    return await asyncio.to_thread(file_manager.move_file, source_path, destination_path)
 
 @mcp.tool()
-def copy_files(ctx: Context, source_path: str, destination_path: str) -> str:
+@_json_tool("copying file")
+async def copy_files(ctx: Context, source_path: str, destination_path: str) -> Dict[str, Any]:
     """
     Copy a file or directory from source to destination.
     
@@ -458,15 +780,11 @@ def copy_files(ctx: Context, source_path: str, destination_path: str) -> str:
     
     Supports both relative and absolute paths. Creates destination directories if they don't exist.
     """
-    try:
-        result = file_manager.copy_file(source_path, destination_path)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error copying file: {str(e)}")
-        return f"Error copying file: {str(e)}"
+    return await asyncio.to_thread(file_manager.copy_file, source_path, destination_path)
 
 @mcp.tool()
-def list_directory_contents(ctx: Context, directory_path: str) -> str:
+@_json_tool("listing directory")
+async def list_directory_contents(ctx: Context, directory_path: str) -> Dict[str, Any]:
     """
     List the contents of a directory.
     
@@ -475,15 +793,11 @@ def list_directory_contents(ctx: Context, directory_path: str) -> str:
     
     Returns information about files and subdirectories including names, types, sizes, and modification times.
     """
-    try:
-        result = file_manager.list_directory(directory_path)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error listing directory: {str(e)}")
-        return f"Error listing directory: {str(e)}"
+    return await asyncio.to_thread(file_manager.list_directory, directory_path)
 
 @mcp.tool()
-def search_web(ctx: Context, query: str, search_engine: str = "google") -> str:
+@_json_tool("searching web")
+async def search_web(ctx: Context, query: str, search_engine: str = "google") -> Dict[str, Any]:
     """
     Search the web using the specified search engine.
     
@@ -491,91 +805,108 @@ def search_web(ctx: Context, query: str, search_engine: str = "google") -> str:
     - query: The search query to look for
     - search_engine: Search engine to use ('google', 'bing', 'duckduckgo')
     
-    Opens a browser window and performs the search, returning information about the search results page.
+    Performs the search in a headless browser, returning information about the search results page.
     """
-    try:
-        result = web_manager.search_web(query, search_engine)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error searching web: {str(e)}")
-        return f"Error searching web: {str(e)}"
+    return await _run_web(web_manager.search_web, query, search_engine)
 
 @mcp.tool()
-def navigate_to_website(ctx: Context, url: str) -> str:
+@_json_tool("navigating to website")
+async def navigate_to_website(ctx: Context, url: str) -> Dict[str, Any]:
     """
     Navigate to a specific website URL.
     
     Parameters:
     - url: The URL to navigate to (with or without http/https prefix)
     
-    Opens a browser window and navigates to the specified URL.
+    Navigates a headless browser to the specified URL.
     """
-    try:
-        result = web_manager.navigate_to_url(url)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error navigating to website: {str(e)}")
-        return f"Error navigating to website: {str(e)}"
+    return await _run_web(web_manager.navigate_to_url, url)
 
 @mcp.tool()
-def take_screenshot(ctx: Context, save_path: str = None) -> Image:
+async def take_screenshot(ctx: Context, save_path: str = None, fmt: str = "png",
+                          max_dim: int = 1280, raw: bool = False) -> Image:
     """
     Take a screenshot of the desktop.
     
     Parameters:
-    - save_path: Optional path to save the screenshot file
+    - save_path: Optional path to save the screenshot file (always full resolution)
+    - fmt: Image format to return, 'png' (lossless, default) or 'jpeg' (smaller)
+    - max_dim: Longest side of the returned image in pixels; 0 keeps the native resolution
+    - raw: Return zlib-compressed RGB pixels ('rgb-zlib') instead of an encoded image,
+      for same-host clients that decode it themselves. The data starts with width,
+      height and channel count as three little-endian uint32s.
     
     Returns the screenshot as an Image.
     """
+    # Capture and encoding are blocking and CPU heavy, so keep them off the event loop
+    return await asyncio.to_thread(_take_screenshot, save_path, fmt, max_dim, raw)
+
+def _take_screenshot(save_path: Optional[str], fmt: str, max_dim: int, raw: bool = False) -> Image:
+    """Capture, optionally save, downscale and encode a screenshot"""
     try:
-        screenshot = pyautogui.screenshot()
+        fmt = fmt.lower()
+        if fmt == "jpg":
+            fmt = "jpeg"
+        if fmt not in ("png", "jpeg"):
+            raise ValueError(f"Unsupported screenshot format: {fmt}")
+        
+        screenshot = _grab_screen()
         
         if save_path:
             screenshot.save(save_path)
             logger.info(f"Screenshot saved to {save_path}")
         
-        # Convert to bytes for MCP Image
+        # Native resolution is mostly wasted on the receiving model; a smaller
+        # image is cheaper to encode, to transfer and to look at
+        if max_dim and max(screenshot.size) > max_dim:
+            screenshot.thumbnail((max_dim, max_dim), PILImage.LANCZOS)
+        
+        if raw:
+            # Skips PNG's per-row filtering and deflate search entirely;
+            # level 1 zlib over the raw pixels is far cheaper to produce
+            rgb = screenshot if screenshot.mode == "RGB" else screenshot.convert("RGB")
+            width, height = rgb.size
+            data = struct.pack('<III', width, height, 3) + zlib.compress(rgb.tobytes(), 1)
+            return Image(data=data, format="rgb-zlib")
+        
+        # Convert to bytes for MCP Image. The returned image is transient, so
+        # a fast, light encode beats zlib's default level 6 on a full screen.
         import io
         img_byte_arr = io.BytesIO()
-        screenshot.save(img_byte_arr, format='PNG')
+        if fmt == "jpeg":
+            screenshot.convert("RGB").save(img_byte_arr, format='JPEG', quality=80, optimize=False)
+        else:
+            screenshot.save(img_byte_arr, format='PNG', compress_level=1, optimize=False)
         img_byte_arr = img_byte_arr.getvalue()
         
-        return Image(data=img_byte_arr, format="png")
+        return Image(data=img_byte_arr, format=fmt)
         
     except Exception as e:
         logger.error(f"Error taking screenshot: {str(e)}")
         raise Exception(f"Screenshot failed: {str(e)}")
 
 @mcp.tool()
-def get_system_information(ctx: Context) -> str:
+@_json_tool("getting system info")
+async def get_system_information(ctx: Context) -> Dict[str, Any]:
     """
     Get comprehensive system information including CPU, memory, disk usage, and running processes.
     
     Returns detailed information about system resources and performance.
     """
-    try:
-        result = system_monitor.get_system_info()
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error getting system info: {str(e)}")
-        return f"Error getting system info: {str(e)}"
+    return await asyncio.to_thread(system_monitor.get_system_info)
 
 @mcp.tool()
-def get_running_processes(ctx: Context) -> str:
+@_json_tool("getting running processes")
+async def get_running_processes(ctx: Context) -> Dict[str, Any]:
     """
     Get a list of currently running processes with CPU and memory usage.
     
     Returns the top 20 processes sorted by CPU usage.
     """
-    try:
-        result = system_monitor.get_running_processes()
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error getting running processes: {str(e)}")
-        return f"Error getting running processes: {str(e)}"
+    return await asyncio.to_thread(system_monitor.get_running_processes)
 
 @mcp.tool()
-def execute_command(ctx: Context, command: str, shell: bool = True) -> str:
+async def execute_command(ctx: Context, command: str, shell: bool = True) -> str:
     """
     Execute a system command.
     
@@ -588,49 +919,41 @@ def execute_command(ctx: Context, command: str, shell: bool = True) -> str:
     try:
         logger.info(f"Executing command: {command}")
         
-        result = subprocess.run(
-            command,
-            shell=shell,
-            capture_output=True,
-            text=True,
-            timeout=30  # 30 second timeout
-        )
+        try:
+            return_code, stdout, stderr = await _run_command(command, shell)
+        except subprocess.TimeoutExpired:
+            return _to_json({
+                "success": False,
+                "error": f"Command timed out after {COMMAND_TIMEOUT} seconds",
+                "command": command
+            })
         
-        return json.dumps({
+        encoding = locale.getpreferredencoding(False)
+        return _to_json({
             "success": True,
             "command": command,
-            "return_code": result.returncode,
-            "stdout": result.stdout,
-            "stderr": result.stderr
-        }, indent=2)
+            "return_code": return_code,
+            "stdout": stdout.decode(encoding, errors="replace"),
+            "stderr": stderr.decode(encoding, errors="replace")
+        })
         
-    except subprocess.TimeoutExpired:
-        return json.dumps({
-            "success": False,
-            "error": "Command timed out after 30 seconds",
-            "command": command
-        }, indent=2)
     except Exception as e:
         logger.error(f"Error executing command: {str(e)}")
-        return json.dumps({
+        return _to_json({
             "success": False,
             "error": str(e),
             "command": command
-        }, indent=2)
+        })
 
 @mcp.tool()
-def close_browser(ctx: Context) -> str:
+@_json_tool("closing browser")
+async def close_browser(ctx: Context) -> Dict[str, Any]:
     """
     Close the browser instance that was opened for web operations.
     
-    Use this to clean up browser windows opened by search_web or navigate_to_website.
+    Use this to clean up the browser started by search_web or navigate_to_website.
     """
-    try:
-        result = web_manager.close_browser()
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        logger.error(f"Error closing browser: {str(e)}")
-        return f"Error closing browser: {str(e)}"
+    return await _run_web(web_manager.close_browser)
 
 def main():
     """Run the Desktop MCP server"""
@@ -10,11 +10,26 @@ from typing import Dict, Any, List, Optional, Union
 from dataclasses import dataclass, field
 from enum import Enum
 import logging
+import os
+import re
+import sys
+import threading
 import time
 from datetime import datetime
 
+# RE2 matches in linear time with no backtracking; the built-in validators only
+# use syntax both engines share. User-supplied patterns stay on re.
+try:
+    import re2 as _validator_re
+except ImportError:
+    _validator_re = re
+
 logger = logging.getLogger(__name__)
 
+_EMAIL_RE = _validator_re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Only the scheme://host prefix is checked, so matching stops after the host
+_URL_RE = _validator_re.compile(r'[a-zA-Z][a-zA-Z0-9+.-]*://[^\s/?#]+')
+
 
 class ToolCategory(Enum):
     """Standard tool categories for organization"""
@@ -45,7 +60,61 @@ class ParameterType(Enum):
     DIRECTORY = "directory"
 
 
-@dataclass
+# Expected Python type(s) and error wording per parameter type; bool is an int
+# subclass, so the INTEGER check rejects it explicitly
+_TYPE_CHECKS = {
+    ParameterType.STRING: (str, "must be a string"),
+    ParameterType.INTEGER: (int, "must be an integer"),
+    ParameterType.FLOAT: ((int, float), "must be a number"),
+    ParameterType.BOOLEAN: (bool, "must be a boolean"),
+    ParameterType.LIST: (list, "must be a list"),
+    ParameterType.DICT: (dict, "must be a dictionary"),
+}
+
+# JSON schema type for each parameter type; anything unlisted is a string
+_PARAM_JSON_TYPES = {
+    ParameterType.INTEGER: "integer",
+    ParameterType.FLOAT: "number",
+    ParameterType.BOOLEAN: "boolean",
+    ParameterType.LIST: "array",
+    ParameterType.DICT: "object",
+}
+
+
+def _check_file(value: Any) -> Optional[str]:
+    """Error message if value names no existing file"""
+    if isinstance(value, str) and not os.path.isfile(value):
+        return f"File not found: {value}"
+
+
+def _check_directory(value: Any) -> Optional[str]:
+    """Error message if value names no existing directory"""
+    if isinstance(value, str) and not os.path.isdir(value):
+        return f"Directory not found: {value}"
+
+
+def _check_url(value: Any) -> Optional[str]:
+    """Error message if value isn't a scheme://host URL"""
+    if isinstance(value, str) and not _URL_RE.match(value):
+        return f"Invalid URL format: {value}"
+
+
+def _check_email(value: Any) -> Optional[str]:
+    """Error message if value isn't an email address"""
+    if isinstance(value, str) and not _EMAIL_RE.match(value):
+        return f"Invalid email format: {value}"
+
+
+# Value checks for the string-based types beyond plain STRING
+_FORMAT_CHECKS = {
+    ParameterType.FILE: _check_file,
+    ParameterType.DIRECTORY: _check_directory,
+    ParameterType.URL: _check_url,
+    ParameterType.EMAIL: _check_email,
+}
+
+
+@dataclass(slots=True)
 class ToolParameter:
     """Tool parameter definition with validation"""
     name: str
@@ -57,72 +126,96 @@ class ToolParameter:
     min_value: Optional[Union[int, float]] = None
     max_value: Optional[Union[int, float]] = None
     pattern: Optional[str] = None  # Regex pattern for string validation
+    # Built once in __post_init__ so validate() only runs the checks that
+    # apply to this parameter's type and constraints
+    _pattern_re: Optional[re.Pattern] = field(default=None, init=False, repr=False, compare=False)
+    _checks: tuple = field(default=(), init=False, repr=False, compare=False)
     
-    def validate(self, value: Any) -> tuple[bool, Optional[str]]:
-        """Validate parameter value"""
-        if value is None:
-            if self.required:
-                return False, f"Parameter '{self.name}' is required"
-            return True, None
+    def __post_init__(self):
+        self._pattern_re = re.compile(self.pattern) if self.pattern else None
+        self._checks = self._build_checks()
+    
+    def _build_checks(self) -> tuple:
+        """Checks for a non-None value, in order; each returns an error message or None"""
+        name = self.name
+        checks = []
         
         # Type validation
-        if self.type == ParameterType.STRING and not isinstance(value, str):
-            return False, f"Parameter '{self.name}' must be a string"
-        elif self.type == ParameterType.INTEGER and not isinstance(value, int):
-            return False, f"Parameter '{self.name}' must be an integer"
-        elif self.type == ParameterType.FLOAT and not isinstance(value, (int, float)):
-            return False, f"Parameter '{self.name}' must be a number"
-        elif self.type == ParameterType.BOOLEAN and not isinstance(value, bool):
-            return False, f"Parameter '{self.name}' must be a boolean"
-        elif self.type == ParameterType.LIST and not isinstance(value, list):
-            return False, f"Parameter '{self.name}' must be a list"
-        elif self.type == ParameterType.DICT and not isinstance(value, dict):
-            return False, f"Parameter '{self.name}' must be a dictionary"
+        type_check = _TYPE_CHECKS.get(self.type)
+        if type_check:
+            expected, wording = type_check
+            type_error = f"Parameter '{name}' {wording}"
+            if self.type is ParameterType.INTEGER:
+                # bool is an int subclass but not an acceptable integer
+                def check_type(value):
+                    if not isinstance(value, int) or isinstance(value, bool):
+                        return type_error
+            else:
+                def check_type(value):
+                    if not isinstance(value, expected):
+                        return type_error
+            checks.append(check_type)
         
         # Range validation for numbers
-        if self.type in [ParameterType.INTEGER, ParameterType.FLOAT] and isinstance(value, (int, float)):
-            if self.min_value is not None and value < self.min_value:
-                return False, f"Parameter '{self.name}' must be >= {self.min_value}"
-            if self.max_value is not None and value > self.max_value:
-                return False, f"Parameter '{self.name}' must be <= {self.max_value}"
+        if self.type in (ParameterType.INTEGER, ParameterType.FLOAT):
+            min_value, max_value = self.min_value, self.max_value
+            if min_value is not None:
+                def check_min(value):
+                    if value < min_value:
+                        return f"Parameter '{name}' must be >= {min_value}"
+                checks.append(check_min)
+            if max_value is not None:
+                def check_max(value):
+                    if value > max_value:
+                        return f"Parameter '{name}' must be <= {max_value}"
+                checks.append(check_max)
         
         # Choice validation
-        if self.choices and value not in self.choices:
-            return False, f"Parameter '{self.name}' must be one of: {self.choices}"
+        if self.choices:
+            choices = self.choices
+            def check_choices(value):
+                if value not in choices:
+                    return f"Parameter '{name}' must be one of: {choices}"
+            checks.append(check_choices)
         
         # Pattern validation for strings
-        if self.type == ParameterType.STRING and self.pattern and isinstance(value, str):
-            import re
-            if not re.match(self.pattern, value):
-                return False, f"Parameter '{self.name}' does not match required pattern"
+        if self.type is ParameterType.STRING and self._pattern_re:
+            match = self._pattern_re.match
+            def check_pattern(value):
+                if not match(value):
+                    return f"Parameter '{name}' does not match required pattern"
+            checks.append(check_pattern)
         
-        # Path validation
-        if self.type in [ParameterType.PATH, ParameterType.FILE, ParameterType.DIRECTORY] and isinstance(value, str):
-            from pathlib import Path
-            path = Path(value)
-            if self.type == ParameterType.FILE and not path.is_file():
-                return False, f"File not found: {value}"
-            elif self.type == ParameterType.DIRECTORY and not path.is_dir():
-                return False, f"Directory not found: {value}"
+        # File, directory, URL and email validation
+        format_check = _FORMAT_CHECKS.get(self.type)
+        if format_check:
+            checks.append(format_check)
         
-        # URL validation
-        if self.type == ParameterType.URL and isinstance(value, str):
-            from urllib.parse import urlparse
-            parsed = urlparse(value)
-            if not all([parsed.scheme, parsed.netloc]):
-                return False, f"Invalid URL format: {value}"
+        return tuple(checks)
+    
+    def validate(self, value: Any) -> tuple[bool, Optional[str]]:
+        """Validate parameter value"""
+        error = self._error(value)
+        if error:
+            return False, error
+        return True, None
+    
+    def _error(self, value: Any) -> Optional[str]:
+        """validate() without the tuple: the error message, or None if value is valid"""
+        if value is None:
+            if self.required:
+                return f"Parameter '{self.name}' is required"
+            return None
         
-        # Email validation
-        if self.type == ParameterType.EMAIL and isinstance(value, str):
-            import re
-            email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            if not re.match(email_pattern, value):
-                return False, f"Invalid email format: {value}"
+        for check in self._checks:
+            error = check(value)
+            if error:
+                return error
         
-        return True, None
+        return None
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolMetadata:
     """Tool metadata for discovery and management"""
     name: str
@@ -140,7 +233,7 @@ class ToolMetadata:
     examples: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Standardized tool execution result"""
     success: bool
@@ -148,7 +241,13 @@ class ToolResult:
     data: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
     execution_time: float = 0.0
-    timestamp: datetime = field(default_factory=datetime.now)
+    # Unix time; a datetime is only built when one is asked for
+    timestamp: float = field(default_factory=time.time)
+    
+    @property
+    def timestamp_dt(self) -> datetime:
+        """Creation time as a local datetime"""
+        return datetime.fromtimestamp(self.timestamp)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert result to dictionary"""
@@ -158,7 +257,7 @@ class ToolResult:
             "data": self.data,
             "error": self.error,
             "execution_time": self.execution_time,
-            "timestamp": self.timestamp.isoformat()
+            "timestamp": self.timestamp_dt.isoformat()
         }
 
 
@@ -174,6 +273,12 @@ class BaseTool(ABC):
         self.metadata = self.get_metadata()
         self.logger = logging.getLogger(f"Tool.{self.metadata.name}")
         self._validate_metadata()
+        
+        # Metadata is fixed after construction, so validate_parameters can use
+        # these lookups instead of rebuilding them per call
+        self._params_by_name = {p.name: p for p in self.metadata.parameters}
+        self._required_params = tuple(p for p in self.metadata.parameters if p.required)
+        self._parameter_schema: Optional[Dict[str, Any]] = None
     
     @abstractmethod
     def get_metadata(self) -> ToolMetadata:
@@ -206,19 +311,20 @@ class BaseTool(ABC):
         Returns:
             tuple: (is_valid, error_message)
         """
-        for param in self.metadata.parameters:
-            value = kwargs.get(param.name)
-            is_valid, error = param.validate(value)
-            if not is_valid:
+        params_by_name = self._params_by_name
+        for name, value in kwargs.items():
+            param = params_by_name.get(name)
+            if param is None:
+                unexpected = kwargs.keys() - params_by_name.keys()
+                return False, f"Unexpected parameters: {unexpected}"
+            error = param._error(value)
+            if error:
                 return False, error
         
-        # Check for unexpected parameters
-        expected_params = {p.name for p in self.metadata.parameters}
-        provided_params = set(kwargs.keys())
-        unexpected = provided_params - expected_params
-        
-        if unexpected:
-            return False, f"Unexpected parameters: {unexpected}"
+        # Parameters that weren't passed only fail if they're required
+        for param in self._required_params:
+            if param.name not in kwargs:
+                return False, f"Parameter '{param.name}' is required"
         
         return True, None
     
@@ -267,7 +373,18 @@ class BaseTool(ABC):
             )
     
     def get_parameter_schema(self) -> Dict[str, Any]:
-        """Get parameter schema for UI generation"""
+        """
+        Get parameter schema for UI generation
+        
+        Built on first use and then reused, since metadata doesn't change
+        after construction; the returned dict is shared, so don't modify it.
+        """
+        if self._parameter_schema is None:
+            self._parameter_schema = self._build_parameter_schema()
+        return self._parameter_schema
+    
+    def _build_parameter_schema(self) -> Dict[str, Any]:
+        """JSON schema for the tool's parameters"""
         schema = {
             "type": "object",
             "properties": {},
@@ -317,20 +434,7 @@ class BaseTool(ABC):
     
     def _param_type_to_json_type(self, param_type: ParameterType) -> str:
         """Convert parameter type to JSON schema type"""
-        mapping = {
-            ParameterType.STRING: "string",
-            ParameterType.INTEGER: "integer",
-            ParameterType.FLOAT: "number",
-            ParameterType.BOOLEAN: "boolean",
-            ParameterType.LIST: "array",
-            ParameterType.DICT: "object",
-            ParameterType.PATH: "string",
-            ParameterType.FILE: "string",
-            ParameterType.DIRECTORY: "string",
-            ParameterType.URL: "string",
-            ParameterType.EMAIL: "string"
-        }
-        return mapping.get(param_type, "string")
+        return _PARAM_JSON_TYPES.get(param_type, "string")
     
     def __str__(self) -> str:
         return f"Tool({self.metadata.name})"
@@ -345,61 +449,100 @@ class ToolRegistry:
     def __init__(self):
         self.tools: Dict[str, BaseTool] = {}
         self.categories: Dict[ToolCategory, List[str]] = {}
+        # Lowercased name, description and keywords per tool, one per line, so
+        # search_tools is one substring test per tool; the newlines keep a
+        # single-line query from matching across two fields
+        self._search_text: Dict[str, str] = {}
+        # Bumped on every register/unregister so callers can cache derived views
+        self.version = 0
+        # Held while the tables above change. Lazy plugin tools are registered
+        # from tool worker threads, so code iterating tools or categories on
+        # another thread holds it too.
+        self.lock = threading.RLock()
     
-    def register(self, tool: BaseTool):
-        """Register a tool"""
-        name = tool.metadata.name
-        if name in self.tools:
-            logger.warning(f"Tool '{name}' already registered, overwriting")
-        
-        self.tools[name] = tool
-        
-        # Update category index
-        category = tool.metadata.category
-        if category not in self.categories:
-            self.categories[category] = []
-        
-        if name not in self.categories[category]:
-            self.categories[category].append(name)
+    def register(self, tool: BaseTool, replace: bool = False):
+        """
+        Register a tool
         
+        Args:
+            tool: Tool to register
+            replace: The tool is expected to replace one registered under the
+                same name, so don't warn about overwriting it
+        """
+        name = tool.metadata.name
+        with self.lock:
+            if name in self.tools and not replace:
+                logger.warning(f"Tool '{name}' already registered, overwriting")
+            
+            self.tools[name] = tool
+            metadata = tool.metadata
+            self._search_text[name] = "\n".join(
+                [metadata.name, metadata.description, *metadata.keywords]
+            ).lower()
+            
+            # Update category index
+            category = tool.metadata.category
+            if category not in self.categories:
+                self.categories[category] = []
+            
+            if name not in self.categories[category]:
+                self.categories[category].append(name)
+            
+            self.version += 1
         logger.info(f"Registered tool: {name}")
     
+    def unregister(self, name: str) -> bool:
+        """Remove a tool; returns False if it wasn't registered"""
+        with self.lock:
+            tool = self.tools.pop(name, None)
+            if tool is None:
+                return False
+            del self._search_text[name]
+            
+            category_tools = self.categories.get(tool.metadata.category)
+            if category_tools and name in category_tools:
+                category_tools.remove(name)
+            
+            self.version += 1
+        return True
+    
     def get_tool(self, name: str) -> Optional[BaseTool]:
         """Get tool by name"""
         return self.tools.get(name)
     
     def get_tools_by_category(self, category: ToolCategory) -> List[BaseTool]:
         """Get all tools in a category"""
-        tool_names = self.categories.get(category, [])
-        return [self.tools[name] for name in tool_names if name in self.tools]
+        with self.lock:
+            tool_names = self.categories.get(category, [])
+            return [self.tools[name] for name in tool_names if name in self.tools]
     
     def list_tools(self) -> List[str]:
         """List all registered tool names"""
-        return list(self.tools.keys())
+        with self.lock:
+            return list(self.tools.keys())
     
     def search_tools(self, query: str) -> List[BaseTool]:
         """Search tools by name, description, or keywords"""
         query = query.lower()
-        results = []
-        
-        for tool in self.tools.values():
-            # Search in name
-            if query in tool.metadata.name.lower():
-                results.append(tool)
-                continue
-            
-            # Search in description
-            if query in tool.metadata.description.lower():
-                results.append(tool)
-                continue
-            
-            # Search in keywords
-            if any(query in keyword.lower() for keyword in tool.metadata.keywords):
-                results.append(tool)
-                continue
-        
-        return results
+        with self.lock:
+            tools = self.tools
+            return [tools[name] for name, text in self._search_text.items() if query in text]
 
 
 # Global tool registry instance
-tool_registry = ToolRegistry()
\ No newline at end of file
+tool_registry = ToolRegistry()
+
+# Module attribute listing the tool classes marked with @register_tool
+TOOLS_ATTRIBUTE = "__desktop_mcp_tools__"
+
+
+def register_tool(cls):
+    """
+    Class decorator listing a tool for the plugin loader
+    
+    The loader registers exactly the listed classes of a module that uses it,
+    instead of scanning the module's namespace for BaseTool subclasses.
+    """
+    module_vars = vars(sys.modules[cls.__module__])
+    module_vars.setdefault(TOOLS_ATTRIBUTE, []).append(cls)
+    return cls
@@ -6,8 +6,10 @@ hierarchical configs, environment variables, and validation.
 """
 
 import os
+import re
+import copy
 import json
-import yaml
+import shutil
 from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
@@ -15,6 +17,109 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# orjson reads and writes bytes directly; the stdlib fallback is shaped to match
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+    
+    def _json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode()
+
+# ${VAR} or $VAR references in configuration strings
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)')
+
+
+def _yaml():
+    """PyYAML, imported on first use since the default config is JSON"""
+    import yaml
+    return yaml
+
+
+def _replace_env_var(match: re.Match) -> str:
+    """Expand one variable reference, leaving it as written if the variable is unset"""
+    var_name = match.group(1) or match.group(2)
+    return os.getenv(var_name, match.group(0))
+
+
+# Built once and shared by every ConfigManager, which only ever hands out copies
+_DEFAULT_CONFIG = {
+    "version": "2.0.0",
+    "app_name": "Desktop MCP",
+    "debug": False,
+
+    "logging": {
+        "level": "INFO",
+        "file": "data/logs/desktop_mcp.log",
+        "max_size": "10MB",
+        "backup_count": 5,
+        "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    },
+
+    "interfaces": {
+        "gui": {
+            "enabled": True,
+            "theme": "dark",
+            "window_size": [1200, 800],
+            "window_position": "center",
+            "auto_start": True
+        },
+        "voice": {
+            "enabled": False,
+            "engine": "whisper",  # whisper, vosk, google
+            "wake_word": "desktop",
+            "language": "en-US",
+            "confidence_threshold": 0.7,
+            "continuous_listening": False
+        },
+        "hotkeys": {
+            "enabled": True,
+            "global_hotkey": "ctrl+shift+d",
+            "screenshot_hotkey": "ctrl+shift+s",
+            "voice_toggle": "ctrl+shift+v"
+        },
+        "api": {
+            "enabled": False,
+            "host": "localhost",
+            "port": 8000,
+            "cors_enabled": True,
+            "auth_required": False
+        }
+    },
+
+    "plugins": {
+        "auto_discovery": True,
+        "auto_install_dependencies": False,
+        "lazy_loading": True,  # reuse the discovery manifest and import plugins on first use
+        "plugin_directories": ["plugins", "~/.desktop_mcp/plugins"],
+        "disabled_plugins": []
+    },
+
+    "execution": {
+        "max_batch_size": 16,  # queued commands parsed and dispatched per pass
+        "max_batch_wait_ms": 0,  # extra wait for more commands once one arrives
+        "tool_workers": 8,  # threads running blocking tool calls off the event loop
+        "history_max": 1000  # execution records kept in memory
+    },
+
+    "system": {
+        "startup_check": True,
+        "auto_update": False,
+        "telemetry": False,
+        "crash_reporting": True
+    },
+
+    "profiles": {
+        "default": "general",
+        "available": ["general", "development", "creative", "productivity"]
+    }
+}
+
 
 class ConfigManager:
     """
@@ -33,70 +138,11 @@ class ConfigManager:
         self.config_dir = self.config_path.parent
         self.config_dir.mkdir(parents=True, exist_ok=True)
         
-        # Default configuration
-        self.default_config = {
-            "version": "2.0.0",
-            "app_name": "Desktop MCP",
-            "debug": False,
-            
-            "logging": {
-                "level": "INFO",
-                "file": "data/logs/desktop_mcp.log",
-                "max_size": "10MB",
-                "backup_count": 5,
-                "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            },
-            
-            "interfaces": {
-                "gui": {
-                    "enabled": True,
-                    "theme": "dark",
-                    "window_size": [1200, 800],
-                    "window_position": "center",
-                    "auto_start": True
-                },
-                "voice": {
-                    "enabled": False,
-                    "engine": "whisper",  # whisper, vosk, google
-                    "wake_word": "desktop",
-                    "language": "en-US",
-                    "confidence_threshold": 0.7,
-                    "continuous_listening": False
-                },
-                "hotkeys": {
-                    "enabled": True,
-                    "global_hotkey": "ctrl+shift+d",
-                    "screenshot_hotkey": "ctrl+shift+s",
-                    "voice_toggle": "ctrl+shift+v"
-                },
-                "api": {
-                    "enabled": False,
-                    "host": "localhost",
-                    "port": 8000,
-                    "cors_enabled": True,
-                    "auth_required": False
-                }
-            },
-            
-            "plugins": {
-                "auto_discovery": True,
-                "auto_install_dependencies": False,
-                "plugin_directories": ["plugins", "~/.desktop_mcp/plugins"],
-                "disabled_plugins": []
-            },
-            
-            "system": {
-                "startup_check": True,
-                "auto_update": False,
-                "telemetry": False,
-                "crash_reporting": True
-            },
-            
-            "profiles": {
-                "default": "general",
-                "available": ["general", "development", "creative", "productivity"]
-            }
-        }
+        # Copy of the config as last loaded or saved, to detect unsaved changes
+        self._saved_config: Optional[Dict[str, Any]] = None
+        
+        # Default configuration; never handed out without copying
+        self.default_config = _DEFAULT_CONFIG
     
     def load_config(self) -> Dict[str, Any]:
         """
@@ -109,11 +155,11 @@ class ConfigManager:
             if self.config_path.exists():
                 logger.info(f"Loading configuration from {self.config_path}")
                 
-                with open(self.config_path, 'r') as f:
+                with open(self.config_path, 'rb') as f:
                     if self.config_path.suffix.lower() == '.yaml':
-                        config = yaml.safe_load(f)
+                        config = _yaml().safe_load(f)
                     else:
-                        config = json.load(f)
+                        config = _json_loads(f.read())
                 
                 # Merge with defaults
                 merged_config = self._merge_configs(self.default_config, config)
@@ -122,15 +168,21 @@ class ConfigManager:
                 merged_config = self._substitute_env_vars(merged_config)
                 
                 logger.info("Configuration loaded successfully")
+                self._saved_config = copy.deepcopy(merged_config)
                 return merged_config
             else:
                 logger.info("No configuration file found, using defaults")
-                return self.default_config.copy()
+                # Unsaved: defaults are written out the first time the app saves
+                return copy.deepcopy(self.default_config)
                 
         except Exception as e:
             logger.error(f"Failed to load configuration: {e}")
             logger.info("Using default configuration")
-            return self.default_config.copy()
+            return copy.deepcopy(self.default_config)
+    
+    def has_changed(self, config: Dict[str, Any]) -> bool:
+        """Whether config differs from what was last loaded from or saved to disk"""
+        return config != self._saved_config
     
     def save_config(self, config: Dict[str, Any]):
         """
@@ -140,20 +192,26 @@ class ConfigManager:
             config: Configuration dictionary to save
         """
         try:
+            # Write the new configuration next to the old one first, so an
+            # interrupted save never leaves a truncated config behind
+            temp_path = self.config_path.with_name(self.config_path.name + ".tmp")
+            if self.config_path.suffix.lower() == '.yaml':
+                with open(temp_path, 'w') as f:
+                    _yaml().dump(config, f, default_flow_style=False, indent=2)
+            else:
+                with open(temp_path, 'wb') as f:
+                    f.write(_json_dumps(config))
+            
             # Create backup of existing config
             if self.config_path.exists():
                 backup_path = self.config_path.with_suffix(
                     f'.backup.{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
                 )
-                self.config_path.rename(backup_path)
+                shutil.copy2(self.config_path, backup_path)
                 logger.info(f"Created configuration backup: {backup_path}")
             
-            # Save new configuration
-            with open(self.config_path, 'w') as f:
-                if self.config_path.suffix.lower() == '.yaml':
-                    yaml.dump(config, f, default_flow_style=False, indent=2)
-                else:
-                    json.dump(config, f, indent=2)
+            os.replace(temp_path, self.config_path)
+            self._saved_config = copy.deepcopy(config)
             
             logger.info(f"Configuration saved to {self.config_path}")
             
@@ -164,53 +222,53 @@ class ConfigManager:
         """
         Recursively merge user config with default config
         
+        The user config is filled in place with any defaults it doesn't set,
+        so only the default sections it's missing are copied.
+        
         Args:
             default: Default configuration
-            user: User configuration
+            user: User configuration, freshly parsed and safe to modify
             
         Returns:
-            Merged configuration
+            Merged configuration (the user dict)
         """
-        merged = default.copy()
-        
-        for key, value in user.items():
-            if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-                merged[key] = self._merge_configs(merged[key], value)
-            else:
-                merged[key] = value
+        for key, value in default.items():
+            if key not in user:
+                user[key] = copy.deepcopy(value)
+            elif isinstance(value, dict) and isinstance(user[key], dict):
+                self._merge_configs(value, user[key])
         
-        return merged
+        return user
     
     def _substitute_env_vars(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """
         Substitute environment variables in configuration values
         
+        Walks the tree iteratively and rewrites only the strings that
+        reference a variable, in place.
+        
         Args:
-            config: Configuration dictionary
+            config: Configuration dictionary, modified in place
             
         Returns:
             Configuration with environment variables substituted
         """
-        def substitute_value(value: Any) -> Any:
-            if isinstance(value, str):
-                # Replace ${VAR} or $VAR patterns
-                import re
-                pattern = r'\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)'
-                
-                def replace_match(match):
-                    var_name = match.group(1) or match.group(2)
-                    return os.getenv(var_name, match.group(0))
-                
-                return re.sub(pattern, replace_match, value)
-            elif isinstance(value, dict):
-                return {k: substitute_value(v) for k, v in value.items()}
-            elif isinstance(value, list):
-                return [substitute_value(item) for item in value]
-            else:
-                return value
+        stack = [config]
+        # YAML aliases can share, or nest, a container; visit each only once
+        seen = {id(config)}
+        while stack:
+            node = stack.pop()
+            for key in (node.keys() if isinstance(node, dict) else range(len(node))):
+                value = node[key]
+                if isinstance(value, str):
+                    # Most strings reference no variables; skip the regex for those
+                    if '$' in value:
+                        node[key] = _ENV_VAR_RE.sub(_replace_env_var, value)
+                elif isinstance(value, (dict, list)) and id(value) not in seen:
+                    seen.add(id(value))
+                    stack.append(value)
         
-        result = substitute_value(config)
-        return result if isinstance(result, dict) else config
+        return config
     
     def get_profile_config(self, profile_name: str) -> Dict[str, Any]:
         """
@@ -226,8 +284,8 @@ class ConfigManager:
         
         if profile_path.exists():
             try:
-                with open(profile_path, 'r') as f:
-                    return json.load(f)
+                with open(profile_path, 'rb') as f:
+                    return _json_loads(f.read())
             except Exception as e:
                 logger.error(f"Failed to load profile {profile_name}: {e}")
         
@@ -247,8 +305,8 @@ class ConfigManager:
         profile_path = profile_dir / f"{profile_name}.json"
         
         try:
-            with open(profile_path, 'w') as f:
-                json.dump(config, f, indent=2)
+            with open(profile_path, 'wb') as f:
+                f.write(_json_dumps(config))
             logger.info(f"Profile {profile_name} saved")
         except Exception as e:
             logger.error(f"Failed to save profile {profile_name}: {e}")
@@ -326,11 +384,12 @@ class ConfigManager:
         try:
             config = self.load_config()
             
-            with open(export_path, 'w') as f:
-                if export_path.suffix.lower() == '.yaml':
-                    yaml.dump(config, f, default_flow_style=False, indent=2)
-                else:
-                    json.dump(config, f, indent=2)
+            if export_path.suffix.lower() == '.yaml':
+                with open(export_path, 'w') as f:
+                    _yaml().dump(config, f, default_flow_style=False, indent=2)
+            else:
+                with open(export_path, 'wb') as f:
+                    f.write(_json_dumps(config))
             
             logger.info(f"Configuration exported to {export_path}")
             
@@ -345,11 +404,11 @@ class ConfigManager:
             import_path: Path to import the configuration from
         """
         try:
-            with open(import_path, 'r') as f:
+            with open(import_path, 'rb') as f:
                 if import_path.suffix.lower() == '.yaml':
-                    config = yaml.safe_load(f)
+                    config = _yaml().safe_load(f)
                 else:
-                    config = json.load(f)
+                    config = _json_loads(f.read())
             
             # Validate imported config
             validation = self.validate_config(config)
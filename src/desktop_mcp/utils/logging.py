@@ -5,13 +5,87 @@ Provides comprehensive logging capabilities with file rotation,
 multiple handlers, and configurable formatting.
 """
 
+import atexit
+import functools
+import itertools
+import json
 import logging
 import logging.handlers
 import os
+import queue
+import re
+import stat
 import sys
+import time
+import traceback
+import types
 from pathlib import Path
-from typing import Dict, Any, Optional
-from datetime import datetime
+from typing import Dict, Any, Iterable, Optional
+from datetime import datetime, time as dt_time, timedelta
+
+try:
+    import orjson
+    
+    def _event_json(data: Dict[str, Any]) -> str:
+        """Structured event as one line of JSON, serialized by orjson"""
+        try:
+            return orjson.dumps(data, default=str).decode()
+        except TypeError:
+            # e.g. integers wider than 64 bits, which orjson rejects
+            return json.dumps(data, default=str)
+except ImportError:
+    def _event_json(data: Dict[str, Any]) -> str:
+        """Structured event as one line of JSON"""
+        return json.dumps(data, default=str)
+
+try:
+    import psutil
+    _virtual_memory = psutil.virtual_memory
+except ImportError:
+    _virtual_memory = None
+
+
+# Number and unit of a size string such as "10MB"
+_SIZE_RE = re.compile(r'(\d+(?:\.\d+)?)\s*([KMGT]?B?)')
+
+_SIZE_MULTIPLIERS = {
+    'B': 1,
+    'KB': 1024,
+    'MB': 1024 * 1024,
+    'GB': 1024 * 1024 * 1024,
+    'TB': 1024 * 1024 * 1024 * 1024,
+    '': 1  # No unit = bytes
+}
+
+
+# Default logging config, read-only so no caller can alter it by accident
+_DEFAULT_LOG_CONFIG = types.MappingProxyType({
+    "level": "INFO",
+    "file": "data/logs/desktop_mcp.log",
+    "max_size": "10MB",
+    "backup_count": 5,
+    "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    "console_enabled": True,
+    "file_enabled": True,
+    # StructuredLogger events, one JSON object per line
+    "events_file": "data/logs/events.jsonl",
+    "events_enabled": True
+})
+
+# Level names accepted in the config and by StructuredLogger.log_event
+_LEVELS = {
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.FATAL,
+    "ERROR": logging.ERROR,
+    "WARN": logging.WARNING,
+    "WARNING": logging.WARNING,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+    "NOTSET": logging.NOTSET,
+}
+
+# Listener started by setup_logging, writing queued records to the real handlers
+_queue_listener: Optional[logging.handlers.QueueListener] = None
 
 
 def setup_logging(config: Dict[str, Any]):
@@ -21,25 +95,14 @@ def setup_logging(config: Dict[str, Any]):
     Args:
         config: Logging configuration dictionary
     """
-    # Default logging config
-    default_config = {
-        "level": "INFO",
-        "file": "data/logs/desktop_mcp.log",
-        "max_size": "10MB",
-        "backup_count": 5,
-        "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        "console_enabled": True,
-        "file_enabled": True
-    }
-    
     # Merge with provided config
-    config = {**default_config, **config}
+    config = {**_DEFAULT_LOG_CONFIG, **config}
     
     # Parse log level
-    level = getattr(logging, config["level"].upper(), logging.INFO)
+    level = _LEVELS.get(config["level"].upper(), logging.INFO)
     
-    # Create formatter
-    formatter = logging.Formatter(config["format"])
+    # Create formatter, shared by every handler so each record is formatted once
+    formatter = _SharedFormatter(config["format"])
     
     # Get root logger
     root_logger = logging.getLogger()
@@ -47,40 +110,89 @@ def setup_logging(config: Dict[str, Any]):
     
     # Clear existing handlers
     root_logger.handlers.clear()
+    _stop_queue_listener()
+    
+    # The real handlers run on the queue listener's thread; the root logger
+    # only gets a QueueHandler, so logging calls never wait on console or
+    # file I/O (or the rotation size check)
+    handlers = []
     
     # Console handler
     if config["console_enabled"]:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
+    
+    # Parse max size
+    max_bytes = parse_size(config["max_size"])
     
     # File handler with rotation
     if config["file_enabled"]:
         log_file = Path(config["file"])
         log_file.parent.mkdir(parents=True, exist_ok=True)
         
-        # Parse max size
-        max_bytes = parse_size(config["max_size"])
-        
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = FastRotatingFileHandler(
             log_file,
             maxBytes=max_bytes,
-            backupCount=config["backup_count"]
+            backupCount=config["backup_count"],
+            encoding="utf-8"
         )
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Structured events also go to their own JSON Lines file, so consumers
+    # can read them without parsing the text log
+    if config["events_enabled"]:
+        events_file = Path(config["events_file"])
+        events_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        events_handler = FastRotatingFileHandler(
+            events_file,
+            maxBytes=max_bytes,
+            backupCount=config["backup_count"],
+            encoding="utf-8"
+        )
+        events_handler.setLevel(level)
+        events_handler.setFormatter(_EventLineFormatter())
+        events_handler.addFilter(_is_event)
+        handlers.append(events_handler)
     
     # Add error handler for critical errors
     error_handler = ErrorFileHandler()
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(formatter)
-    root_logger.addHandler(error_handler)
+    handlers.append(error_handler)
+    
+    global _queue_listener
+    log_queue = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    configure_third_party_loggers()
     
     logging.info("Logging system initialized")
 
 
+def _stop_queue_listener():
+    """Drain the log queue and close the handlers behind it"""
+    global _queue_listener
+    listener, _queue_listener = _queue_listener, None
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+# Registered after logging's own shutdown hook, so it runs first and every
+# queued record is written before the handlers are flushed and closed
+atexit.register(_stop_queue_listener)
+
+
 def parse_size(size_str: str) -> int:
     """
     Parse size string to bytes
@@ -94,8 +206,7 @@ def parse_size(size_str: str) -> int:
     size_str = size_str.upper().strip()
     
     # Extract number and unit
-    import re
-    match = re.match(r'(\d+(?:\.\d+)?)\s*([KMGT]?B?)', size_str)
+    match = _SIZE_RE.match(size_str)
     
     if not match:
         return 10 * 1024 * 1024  # Default 10MB
@@ -103,27 +214,144 @@ def parse_size(size_str: str) -> int:
     number = float(match.group(1))
     unit = match.group(2)
     
-    multipliers = {
-        'B': 1,
-        'KB': 1024,
-        'MB': 1024 * 1024,
-        'GB': 1024 * 1024 * 1024,
-        'TB': 1024 * 1024 * 1024 * 1024,
-        '': 1  # No unit = bytes
-    }
+    return int(number * _SIZE_MULTIPLIERS.get(unit, 1))
+
+
+# Distinct logger names memoized by _cached_logger
+LOGGER_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=LOGGER_CACHE_SIZE)
+def _cached_logger(name: str) -> logging.Logger:
+    """
+    logging.getLogger, memoized for get_logger and the utility loggers below
+    
+    They're often built per operation, and a repeat name then skips the
+    logging module's lock. Names should come from a bounded set (operation
+    names, not ids), as loggers themselves are never freed.
+    """
+    # Only runs on a cache miss; warns once as the cache nears its bound
+    if _cached_logger.cache_info().currsize == LOGGER_CACHE_SIZE * 9 // 10:
+        logging.getLogger(__name__).warning(
+            f"{LOGGER_CACHE_SIZE * 9 // 10} distinct logger names in use; "
+            "are ids or other unbounded values being put into logger names?"
+        )
+    return logging.getLogger(name)
+
+
+class _SharedFormatter(logging.Formatter):
+    """
+    Formatter that formats each record only once
+    
+    setup_logging gives one instance to all its handlers, which the queue
+    listener runs one after another on the same record; the first to format
+    it stores the text on the record for the rest.
+    """
+    
+    def format(self, record):
+        cached = record.__dict__.get("_formatted")
+        if cached is not None and cached[0] is self:
+            return cached[1]
+        text = super().format(record)
+        record._formatted = (self, text)
+        return text
+
+
+def _is_event(record: logging.LogRecord) -> bool:
+    """Whether record was logged by StructuredLogger.log_event"""
+    return hasattr(record, "event_data")
+
+
+class _EventLineFormatter(logging.Formatter):
+    """A structured event as one JSON line, with its record's time, level and logger"""
+    
+    def format(self, record):
+        return _event_json({
+            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            **record.event_data
+        })
+
+
+class FastRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that tracks the file size itself
+    
+    The stock handler checks the path with two stat() calls and seeks to the
+    end of the stream for every record, and formats each record twice. This
+    one reads the size once per opened file and formats each record once.
+    Like the stock handler's, sizes are in bytes: each message is counted as
+    encoded for the stream (newline translation on Windows aside).
+    """
+    
+    def _open(self):
+        stream = super()._open()
+        info = os.fstat(stream.fileno())
+        self._size = info.st_size
+        # See bpo-45401: never roll over anything other than regular files
+        self._rotatable = stat.S_ISREG(info.st_mode)
+        return stream
+    
+    def _encoded_size(self, message: str) -> int:
+        """Bytes message takes up once the stream encodes it"""
+        return len(message.encode(self.stream.encoding, self.stream.errors))
+    
+    def _would_overflow(self, size: int) -> bool:
+        """Whether writing size more bytes reaches maxBytes"""
+        return self.maxBytes > 0 and self._rotatable and self._size + size >= self.maxBytes
+    
+    def shouldRollover(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        return self._would_overflow(self._encoded_size(self.format(record) + self.terminator))
     
-    return int(number * multipliers.get(unit, 1))
+    def emit(self, record):
+        try:
+            message = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            size = self._encoded_size(message)
+            if self._would_overflow(size):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(message)
+            self.flush()
+            self._size += size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 class ErrorFileHandler(logging.Handler):
     """
     Special handler for error logs that creates separate error files
+    
+    The current day's file stays open, as a raw O_APPEND descriptor, between
+    records and is only reopened when a record falls on a later day.
     """
     
     def __init__(self):
         super().__init__()
         self.error_dir = Path("data/logs/errors")
         self.error_dir.mkdir(parents=True, exist_ok=True)
+        self._fd: Optional[int] = None
+        # Unix time at which the open file's day ends
+        self._fd_until = 0.0
+    
+    def _open_for(self, created: float):
+        """Switch to the error file for the day containing created"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        day = datetime.fromtimestamp(created).date()
+        self._fd = os.open(
+            self.error_dir / f"errors_{day:%Y-%m-%d}.log",
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+        )
+        self._fd_until = datetime.combine(day + timedelta(days=1), dt_time()).timestamp()
     
     def emit(self, record):
         """
@@ -134,26 +362,35 @@ class ErrorFileHandler(logging.Handler):
         """
         if record.levelno >= logging.ERROR:
             try:
-                # Create error file with date
-                date_str = datetime.now().strftime("%Y-%m-%d")
-                error_file = self.error_dir / f"errors_{date_str}.log"
-                
                 # Format the record
-                message = self.format(record)
+                message = self.format(record) + '\n'
+                
+                # Add the full stack trace if available, unless the formatter
+                # already included it (logging.Formatter does, via exc_text)
+                if record.exc_info and not record.exc_text:
+                    message += ''.join(traceback.format_exception(*record.exc_info))
                 
-                # Write to error file
-                with open(error_file, 'a', encoding='utf-8') as f:
-                    f.write(message + '\n')
-                    
-                    # Add stack trace if available
-                    if record.exc_info:
-                        import traceback
-                        f.write(traceback.format_exception(*record.exc_info)[0])
-                        f.write('\n')
+                # handle() already holds self.lock here
+                if self._fd is None or record.created >= self._fd_until:
+                    self._open_for(record.created)
+                
+                # Unbuffered, so errors logged just before a crash still reach
+                # the file; one write per record unless the kernel cuts it short
+                view = memoryview(message.encode('utf-8'))
+                while view:
+                    view = view[os.write(self._fd, view):]
                 
             except Exception:
                 # Don't let logging errors crash the application
                 pass
+    
+    def close(self):
+        """Close the open error file"""
+        with self.lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+        super().close()
 
 
 class PerformanceLogger:
@@ -163,13 +400,15 @@ class PerformanceLogger:
     
     def __init__(self, name: str):
         self.name = name
-        self.logger = logging.getLogger(f"Performance.{name}")
+        self.logger = _cached_logger(f"Performance.{name}")
+        # time.perf_counter_ns() reading taken by start(), or None
         self.start_time = None
     
     def start(self):
         """Start timing"""
-        self.start_time = datetime.now()
-        self.logger.debug(f"Started: {self.name}")
+        self.start_time = time.perf_counter_ns()
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Started: {self.name}")
     
     def stop(self, message: Optional[str] = None):
         """
@@ -178,8 +417,8 @@ class PerformanceLogger:
         Args:
             message: Optional message to include
         """
-        if self.start_time:
-            duration = (datetime.now() - self.start_time).total_seconds()
+        if self.start_time is not None:
+            duration = (time.perf_counter_ns() - self.start_time) / 1e9
             log_msg = f"Completed: {self.name} in {duration:.3f}s"
             
             if message:
@@ -196,7 +435,8 @@ class PerformanceLogger:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
         if exc_type:
-            self.logger.error(f"Failed: {self.name} - {exc_val}")
+            if self.logger.isEnabledFor(logging.ERROR):
+                self.logger.error(f"Failed: {self.name} - {exc_val}")
         else:
             self.stop()
 
@@ -207,35 +447,39 @@ class StructuredLogger:
     """
     
     def __init__(self, name: str):
-        self.logger = logging.getLogger(name)
+        self.logger = _cached_logger(name)
     
     def log_event(self, event: str, level: str = "INFO", **kwargs):
         """
         Log a structured event
         
+        Nothing is built or serialized when the logger has the level disabled.
+        
         Args:
             event: Event name/type
             level: Log level
             **kwargs: Additional event data
         """
-        level_num = getattr(logging, level.upper(), logging.INFO)
+        level_num = _LEVELS.get(level.upper(), logging.INFO)
         
-        # Create structured message
+        # Nothing is serialized for events the logger would drop
+        if not self.logger.isEnabledFor(level_num):
+            return
+        
+        # Create structured message; the record itself carries the timestamp
         event_data = {
             "event": event,
-            "timestamp": datetime.now().isoformat(),
             **kwargs
         }
         
-        # Log as JSON-like structure
-        message = f"EVENT:{event}"
-        for key, value in kwargs.items():
-            message += f" {key}={value}"
-        
-        self.logger.log(level_num, message)
+        # Log as JSON; the dict rides along for the events file
+        self.logger.log(level_num, _event_json(event_data), extra={"event_data": event_data})
     
     def log_command_execution(self, command: str, success: bool, duration: float, **kwargs):
         """Log command execution event"""
+        # Checked here too, so a filtered event doesn't even build kwargs
+        if not self.logger.isEnabledFor(logging.INFO if success else logging.WARNING):
+            return
         self.log_event(
             "command_execution",
             level="INFO" if success else "WARNING",
@@ -247,6 +491,8 @@ class StructuredLogger:
     
     def log_tool_execution(self, tool_name: str, success: bool, duration: float, **kwargs):
         """Log tool execution event"""
+        if not self.logger.isEnabledFor(logging.INFO if success else logging.ERROR):
+            return
         self.log_event(
             "tool_execution",
             level="INFO" if success else "ERROR",
@@ -258,6 +504,8 @@ class StructuredLogger:
     
     def log_system_event(self, event_type: str, **kwargs):
         """Log system event"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         self.log_event(
             "system_event",
             level="INFO",
@@ -276,7 +524,7 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger instance
     """
-    return logging.getLogger(name)
+    return _cached_logger(name)
 
 
 def get_performance_logger(name: str) -> PerformanceLogger:
@@ -289,9 +537,17 @@ def get_performance_logger(name: str) -> PerformanceLogger:
     Returns:
         PerformanceLogger instance
     """
+    # A new instance each time, since it holds the start time; its logger
+    # comes from _cached_logger
     return PerformanceLogger(name)
 
 
+@functools.lru_cache(maxsize=LOGGER_CACHE_SIZE)
+def _structured_logger(name: str) -> StructuredLogger:
+    """Shared StructuredLogger for a name"""
+    return StructuredLogger(name)
+
+
 def get_structured_logger(name: str) -> StructuredLogger:
     """
     Get a structured logger
@@ -302,7 +558,8 @@ def get_structured_logger(name: str) -> StructuredLogger:
     Returns:
         StructuredLogger instance
     """
-    return StructuredLogger(name)
+    # Stateless, so one instance per name can be shared
+    return _structured_logger(name)
 
 
 def log_startup_info():
@@ -329,27 +586,37 @@ def get_memory_info() -> Dict[str, Any]:
     Returns:
         Dictionary with memory info
     """
-    try:
-        import psutil
-        memory = psutil.virtual_memory()
-        return {
-            "total_gb": round(memory.total / (1024**3), 2),
-            "available_gb": round(memory.available / (1024**3), 2),
-            "percent_used": memory.percent
-        }
-    except ImportError:
+    if _virtual_memory is None:
         return {"error": "psutil not available"}
+    
+    memory = _virtual_memory()
+    return {
+        "total_gb": round(memory.total / (1024**3), 2),
+        "available_gb": round(memory.available / (1024**3), 2),
+        "percent_used": memory.percent
+    }
+
+
+# Common libraries whose loggers are too chatty below WARNING
+_NOISY_LOGGERS = (
+    "urllib3.connectionpool",
+    "selenium.webdriver.remote.remote_connection",
+    "PIL.PngImagePlugin",
+    "matplotlib.font_manager"
+)
 
 
-def configure_third_party_loggers():
-    """Configure third-party library loggers to reduce noise"""
-    # Reduce noise from common libraries
-    noisy_loggers = [
-        "urllib3.connectionpool",
-        "selenium.webdriver.remote.remote_connection",
-        "PIL.PngImagePlugin",
-        "matplotlib.font_manager"
-    ]
+def configure_third_party_loggers(extra: Iterable[str] = (), level: int = logging.WARNING):
+    """
+    Configure third-party library loggers to reduce noise
+    
+    Safe to call repeatedly; loggers already at level are left alone.
     
-    for logger_name in noisy_loggers:
-        logging.getLogger(logger_name).setLevel(logging.WARNING)
\ No newline at end of file
+    Args:
+        extra: More logger names to quiet besides the built-in list
+        level: Minimum level those loggers still emit
+    """
+    for logger_name in itertools.chain(_NOISY_LOGGERS, extra):
+        noisy_logger = _cached_logger(logger_name)
+        if noisy_logger.level != level:
+            noisy_logger.setLevel(level)
\ No newline at end of file